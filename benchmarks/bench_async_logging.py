@@ -0,0 +1,79 @@
+"""Benchmark preprocessing throughput under DEBUG logging with the synchronous and the asynchronous sink.
+
+Each mode runs in a fresh interpreter, because the sink is chosen when logging_config is
+imported. Console output of the runs is discarded; the log files go to a temporary directory.
+"""
+
+# ─── Standard Library Imports ────────────────────────────────────────────────────
+import os
+import sys
+import json
+import argparse
+import tempfile
+import subprocess
+import time
+
+# ─── Project Imports ─────────────────────────────────────────────────────────────
+from common import add_data_arguments, load_splits, write_results, logger
+
+
+def _run_mode(args, level: str, async_sink: bool) -> dict:
+    """Run the preprocessing pipeline in a child interpreter with one level and sink and return its timings."""
+    with tempfile.TemporaryDirectory() as log_dir:
+        env = {**os.environ, "LOG_LEVEL": level, "LOG_ASYNC": "1" if async_sink else "0", "LOG_DIR": log_dir}
+        command = [sys.executable, __file__, "--worker", "--train-dir", str(args.train_dir),
+                   "--test-dir", str(args.test_dir), "--samples", str(args.samples)]
+        completed = subprocess.run(command, env=env, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, check=True, text=True)
+        timings = json.loads(completed.stdout.strip().splitlines()[-1])
+        timings["log_bytes"] = sum(os.path.getsize(os.path.join(log_dir, f)) for f in os.listdir(log_dir))
+    return timings
+
+
+def _worker(args):
+    """Preprocess the training reviews and print the timings as JSON."""
+    from src.config import logging_config
+    from src.preprocessing.preprocessing_pipeline import preprocessing_pipeline
+
+    train_set, _ = load_splits(args)
+    texts = train_set.data
+    preprocessing_pipeline(texts[:20], name="warmup")
+
+    start = time.perf_counter()
+    preprocessing_pipeline(texts, name="benchmark")
+    caller_seconds = time.perf_counter() - start
+    logging_config.shutdown_logging()
+    drained_seconds = time.perf_counter() - start
+
+    print(json.dumps({"reviews": len(texts), "caller_seconds": caller_seconds, "drained_seconds": drained_seconds}))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure the throughput impact of the async log sink under DEBUG.")
+    add_data_arguments(parser)
+    parser.add_argument('--repeat', type=int, default=3, help="Runs per mode; the fastest is reported.")
+    parser.add_argument('--worker', action='store_true', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        _worker(args)
+        return
+
+    # INFO skips the per-review debug records and is the reference for the logging overhead
+    results = []
+    for level, async_sink in (("INFO", False), ("DEBUG", False), ("DEBUG", True)):
+        runs = [_run_mode(args, level, async_sink) for _ in range(args.repeat)]
+        timings = min(runs, key=lambda run: run["caller_seconds"])
+        results.append({
+            "level": level,
+            "sink": "async" if async_sink else "sync",
+            **timings,
+            "reviews_per_second": timings["reviews"] / timings["caller_seconds"],
+            "overhead_vs_info": timings["caller_seconds"] / results[0]["caller_seconds"] - 1 if results else 0.0,
+        })
+        logger.info("Benchmarked the %s sink at %s", results[-1]["sink"], level)
+
+    write_results(results, args.output)
+
+
+if __name__ == "__main__":
+    main()
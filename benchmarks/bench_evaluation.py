@@ -0,0 +1,68 @@
+"""Benchmark batched multi-model evaluation against scoring the models one at a time."""
+
+# ─── Standard Library Imports ────────────────────────────────────────────────────
+import argparse
+
+# ─── Third-Party Imports ─────────────────────────────────────────────────────────
+import numpy as np
+from sklearn.metrics import accuracy_score, f1_score, precision_score, recall_score
+from sklearn.model_selection import ParameterGrid
+
+# ─── Project Imports ─────────────────────────────────────────────────────────────
+from common import add_data_arguments, load_splits, timed, write_results, logger
+from src.svm.training import evaluation, solvers, vectorizer
+from src.svm.training.gridsearch_trainer import training_params
+
+
+def _one_at_a_time(X, y, models) -> dict[str, np.ndarray]:
+    """Predict and score every model separately, as the report did before."""
+    metrics = {name: [] for name in evaluation.METRICS}
+    for model in models:
+        y_pred = model.predict(X)
+        metrics["precision"].append(precision_score(y, y_pred, zero_division=0))
+        metrics["recall"].append(recall_score(y, y_pred))
+        metrics["f1"].append(f1_score(y, y_pred))
+        metrics["accuracy"].append(accuracy_score(y, y_pred))
+    return {name: np.array(values) for name, values in metrics.items()}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare batched and per-model test-set evaluation.")
+    add_data_arguments(parser)
+    parser.add_argument('--max-features', type=int, default=80000)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    train_set, test_set = load_splits(args)
+    data = vectorizer.tfidf_vectorizer(train_set, test_set, max_features=args.max_features, ngram_range=(1, 2))
+
+    # One model per C and class weight of the SVM grid, all on the same encoding
+    grid = training_params["grid_search_params"]
+    candidates = list(ParameterGrid({"C": grid["C"], "class_weight": grid["class_weight"]}))
+    models = [solvers.make_estimator("liblinear", **params).fit(data.X_train, data.y_train) for params in candidates]
+
+    results = []
+    for n_models in sorted({1, len(models) // 2, len(models)}):
+        subset = models[:n_models]
+        reference, single_seconds = timed(_one_at_a_time, data.X_test, data.y_test, subset, repeat=args.repeat)
+        batched, batched_seconds = timed(evaluation.evaluate_models, data.X_test, data.y_test, subset, repeat=args.repeat)
+
+        identical = all(np.array_equal(reference[name], batched[name]) for name in evaluation.METRICS)
+        if not identical:
+            raise AssertionError(f"Batched evaluation changed the metrics for {n_models} models")
+
+        results.append({
+            "n_models": n_models,
+            "n_test": data.X_test.shape[0],
+            "one_at_a_time_seconds": single_seconds,
+            "batched_seconds": batched_seconds,
+            "speedup": single_seconds / batched_seconds,
+            "identical": identical,
+        })
+        logger.info("Benchmarked evaluation of %d models", n_models)
+
+    write_results(results, args.output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""Benchmark fit time, inference latency, model size and F1 of the feature-selection stage at several k."""
+
+# ─── Standard Library Imports ────────────────────────────────────────────────────
+import io
+import argparse
+
+# ─── Third-Party Imports ─────────────────────────────────────────────────────────
+from joblib import dump
+from sklearn.svm import LinearSVC
+from sklearn.metrics import f1_score
+
+# ─── Project Imports ─────────────────────────────────────────────────────────────
+from common import add_data_arguments, load_splits, timed, write_results, logger
+from src.svm.training import vectorizer, feature_selection
+
+
+def _artifact_bytes(*objects) -> int:
+    """Return the joblib-serialized size of the given objects."""
+    buffer = io.BytesIO()
+    dump(objects, buffer)
+    return buffer.getbuffer().nbytes
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark supervised feature selection before SVM training.")
+    add_data_arguments(parser)
+    parser.add_argument('--k', type=int, nargs='+', default=[5000, 10000, 20000, 40000], help="Numbers of features to keep.")
+    parser.add_argument('--score-func', choices=sorted(feature_selection.SCORE_FUNCTIONS), default="chi2")
+    parser.add_argument('--max-features', type=int, default=80000)
+    parser.add_argument('--ngram-max', type=int, default=3)
+    args = parser.parse_args()
+
+    train_set, test_set = load_splits(args)
+    data = vectorizer.tfidf_vectorizer(
+        train_set, test_set, max_features=args.max_features, ngram_range=(1, args.ngram_max), sublinear_tf=True
+    )
+
+    results = []
+    for k in [None] + sorted(args.k):
+        reduced = data if k is None else feature_selection.select_features(data, k, score_func=args.score_func)
+        model, fit_seconds = timed(LinearSVC().fit, reduced.X_train, reduced.y_train)
+
+        # End-to-end inference on raw text: vectorize with the (remapped) encoder and predict
+        y_pred, predict_seconds = timed(lambda: model.predict(reduced.vectorizer.transform(test_set.data)), repeat=3)
+
+        results.append({
+            "k": reduced.X_train.shape[1],
+            "fit_seconds": fit_seconds,
+            "latency_ms_per_review": 1000 * predict_seconds / len(test_set.data),
+            "f1": float(f1_score(reduced.y_test, y_pred)),
+            "artifact_bytes": _artifact_bytes(model, reduced.vectorizer),
+        })
+        logger.info("Benchmarked feature selection with %d features", reduced.X_train.shape[1])
+
+    write_results(results, args.output)
+
+
+if __name__ == "__main__":
+    main()
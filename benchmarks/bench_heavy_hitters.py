@@ -0,0 +1,72 @@
+"""Benchmark peak memory and time of heavy-hitter vocabulary selection against TfidfVectorizer's per ngram_range."""
+
+# ─── Standard Library Imports ────────────────────────────────────────────────────
+import argparse
+import tracemalloc
+
+# ─── Third-Party Imports ─────────────────────────────────────────────────────────
+import numpy as np
+from sklearn.feature_extraction.text import CountVectorizer
+
+# ─── Project Imports ─────────────────────────────────────────────────────────────
+from common import add_data_arguments, load_splits, timed, write_results, logger
+from src.svm.training import vectorizer
+from src.svm.training.gridsearch_trainer import training_params
+
+
+def traced_peak_mib(fn, *args, **kwargs) -> float:
+    """Peak memory traced while running a function, in MiB."""
+    tracemalloc.start()
+    try:
+        fn(*args, **kwargs)
+        return tracemalloc.get_traced_memory()[1] / 2**20
+    finally:
+        tracemalloc.stop()
+
+
+def missed_above_cutoff(docs, reference: dict, sketched: dict, ngram_range: tuple) -> int:
+    """Selected n-grams missing from the sketch vocabulary although strictly above sklearn's cut-off count."""
+    union = sorted(reference.keys() | sketched.keys())
+    counts = np.asarray(CountVectorizer(ngram_range=ngram_range, stop_words="english", vocabulary=union)
+                        .fit_transform(docs).sum(axis=0)).ravel()
+    count = dict(zip(union, counts))
+    cutoff = min(count[term] for term in reference)
+    return sum(1 for term in reference if term not in sketched and count[term] > cutoff)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare the sklearn and sketch encoder engines per ngram_range.")
+    add_data_arguments(parser)
+    parser.add_argument('--max-features', type=int, default=None, help="Defaults to the largest value in the grid.")
+    parser.add_argument('--repeat', type=int, default=1)
+    args = parser.parse_args()
+
+    train_set, test_set = load_splits(args)
+    grid = training_params["vectorizer_param_grid"]
+    max_features = args.max_features or max(grid["max_features"])
+
+    results = []
+    for ngram_range in [tuple(r) for r in grid["ngram_range"]]:
+        params = dict(max_features=max_features, ngram_range=ngram_range, sublinear_tf=True, transform_n_jobs=1)
+        row = {"ngram_range": list(ngram_range), "max_features": max_features}
+        encoded = {}
+        for engine in ("sklearn", "sketch"):
+            encoded[engine], row[f"{engine}_seconds"] = timed(vectorizer.tfidf_vectorizer, train_set, test_set,
+                                                              engine=engine, repeat=args.repeat, **params)
+            row[f"{engine}_peak_mib"] = traced_peak_mib(vectorizer.tfidf_vectorizer, train_set, test_set,
+                                                        engine=engine, **params)
+
+        reference, sketched = encoded["sklearn"].vectorizer.vocabulary_, encoded["sketch"].vectorizer.vocabulary_
+        # Overlap is lowered by n-grams tied at the cut-off count; misses above it are selection errors
+        row["vocabulary_overlap"] = len(reference.keys() & sketched.keys()) / max(len(reference), 1)
+        row["missed_above_cutoff"] = missed_above_cutoff(train_set.data, reference, sketched, ngram_range)
+        row["memory_ratio"] = row["sklearn_peak_mib"] / row["sketch_peak_mib"]
+        results.append(row)
+        logger.info("ngram_range=%s: sklearn %.1f MiB, sketch %.1f MiB", ngram_range,
+                    row["sklearn_peak_mib"], row["sketch_peak_mib"])
+
+    write_results(results, args.output)
+
+
+if __name__ == "__main__":
+    main()
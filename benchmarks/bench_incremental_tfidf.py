@@ -0,0 +1,53 @@
+"""Benchmark refreshing the TF-IDF encoder with partial_fit against refitting on the whole corpus."""
+
+# ─── Standard Library Imports ────────────────────────────────────────────────────
+import argparse
+
+# ─── Third-Party Imports ─────────────────────────────────────────────────────────
+import numpy as np
+from sklearn.feature_extraction.text import TfidfVectorizer
+
+# ─── Project Imports ─────────────────────────────────────────────────────────────
+from common import add_data_arguments, load_splits, timed, write_results, logger
+from src.svm.training.incremental_tfidf import IncrementalTfidf
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark incremental TF-IDF updates.")
+    add_data_arguments(parser)
+    parser.add_argument('--batches', type=int, default=4, help="New batches the training split is cut into after the base.")
+    parser.add_argument('--capacity', type=int, default=None, help="Vocabulary capacity admitting new terms.")
+    args = parser.parse_args()
+
+    train_set, _ = load_splits(args)
+    docs = train_set.data
+    parts = np.array_split(np.arange(len(docs)), args.batches + 1)
+    params = {"max_features": 80000, "ngram_range": (1, 2), "sublinear_tf": True}
+
+    base = [docs[i] for i in parts[0]]
+    encoder, base_seconds = timed(IncrementalTfidf.from_documents, TfidfVectorizer(**params), base,
+                                  capacity=args.capacity)
+    results = [{"batch": 0, "documents": len(base), "refit_seconds": base_seconds, "partial_fit_seconds": base_seconds}]
+    seen = list(base)
+    for number, part in enumerate(parts[1:], start=1):
+        batch = [docs[i] for i in part]
+        seen.extend(batch)
+        _, partial_seconds = timed(encoder.partial_fit, batch)
+        refit, refit_seconds = timed(TfidfVectorizer(**params).fit, seen)
+
+        # With a fixed vocabulary the refreshed idf equals a refit on everything seen
+        fixed = TfidfVectorizer(**{**params, "max_features": None}, vocabulary=encoder.vocabulary_).fit(seen)
+        results.append({
+            "batch": number, "documents": len(seen), "refit_seconds": refit_seconds,
+            "partial_fit_seconds": partial_seconds, "speedup": refit_seconds / partial_seconds,
+            "vocabulary": len(encoder.vocabulary_),
+            "vocabulary_overlap_with_refit": len(encoder.vocabulary_.keys() & refit.vocabulary_.keys()) / len(refit.vocabulary_),
+            "max_idf_difference": float(np.max(np.abs(encoder.idf_ - fixed.idf_))),
+        })
+        logger.info("Benchmarked incremental update %d/%d", number, args.batches)
+
+    write_results(results, args.output)
+
+
+if __name__ == "__main__":
+    main()
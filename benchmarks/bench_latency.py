@@ -0,0 +1,310 @@
+"""Online latency benchmark of the raw-review prediction path.
+
+Drives a FusedPredictor (cleaning, filters, lemmatizer, vectorizer.transform, model) with
+single-review requests at a fixed arrival rate and concurrency, and reports p50/p90/p99/max
+latency per stage and end to end. Requests arrive as a Poisson process (open loop), and
+end-to-end latency is measured from the scheduled arrival, so time spent waiting for a
+free worker counts against the SLO instead of silently lowering the offered load.
+A rate of 0 runs a closed loop that sends the next request as soon as a worker is free.
+
+Reviews are synthetic: lengths follow a log-normal distribution fitted to IMDb reviews
+(median ~175 words, long right tail) and words are drawn from the loaded reviews, or
+from a small built-in word list if no data is available. Warm-up requests run first
+and are excluded from the report. --repeat replaces a fraction of the reviews with copies
+of earlier ones, as reposts and retries do, and --cache-size serves them from a
+PredictionCache.
+
+The scorer runs in-process (--target inprocess), on a localhost HTTP server started by
+this script (--target localhost), or behind a URL of a server started with --serve.
+"""
+
+# ─── Standard Library Imports ────────────────────────────────────────────────────
+import json
+import time
+import queue
+import argparse
+import threading
+import urllib.request
+from pathlib import Path
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# ─── Third-Party Imports ─────────────────────────────────────────────────────────
+import numpy as np
+
+# ─── Project Imports ─────────────────────────────────────────────────────────────
+from common import write_results, logger
+from src.data import data_loader
+from src.config.paths import MODEL_DIR, CLEANED_TEST_DIR, TEST_DATA_DIR
+from src.svm.inference.fused_predictor import STAGES, STAGE_OPTIONS, FusedPredictor
+from src.svm.inference.prediction_cache import PredictionCache
+
+# Log-normal review length in words, fitted to the IMDb training reviews
+LENGTH_MEDIAN, LENGTH_SIGMA, LENGTH_RANGE = 175, 0.75, (10, 2500)
+
+# Fallback words when no reviews are available to sample from
+_WORDS = ("the movie film was a great bad plot acting story really good awful boring fun loved hated characters "
+          "director scene scenes music ending i it this and but not very too much so watch watched time best worst "
+          "funny sad script actors performance cinema minutes character cast beautiful terrible dull brilliant").split()
+
+PERCENTILES = (50, 90, 99)
+
+
+def synthetic_reviews(n: int, words: list[str], seed: int = 0) -> list[str]:
+    """
+    Generate reviews with a realistic length distribution.
+    Args:
+        n (int): Number of reviews.
+        words (list[str]): Word pool sampled with its frequencies.
+        seed (int): Random seed.
+    Returns:
+        list[str]: Reviews, with the '<br /><br />' paragraph breaks of IMDb reviews.
+    """
+    rng = np.random.default_rng(seed)
+    lengths = np.clip(rng.lognormal(np.log(LENGTH_MEDIAN), LENGTH_SIGMA, n), *LENGTH_RANGE).astype(int)
+    pool = np.asarray(words, dtype=object)
+    reviews = []
+    for length in lengths:
+        review = pool[rng.integers(0, len(pool), length)]
+        breaks = rng.integers(0, length, length // 80)
+        review[breaks] = review[breaks] + ". <br /><br />"
+        reviews.append(" ".join(review) + ".")
+    return reviews
+
+
+def with_repeats(reviews: list[str], fraction: float, seed: int = 0) -> list[str]:
+    """
+    Replace a fraction of the reviews with copies of earlier reviews.
+    Args:
+        reviews (list[str]): The reviews.
+        fraction (float): Probability that a review (after the first) repeats an earlier one.
+        seed (int): Random seed.
+    Returns:
+        list[str]: The reviews with repeats.
+    """
+    rng = np.random.default_rng(seed)
+    reviews = list(reviews)
+    for i in np.flatnonzero(rng.random(len(reviews)) < fraction):
+        if i > 0:
+            reviews[i] = reviews[rng.integers(0, i)]
+    return reviews
+
+
+def load_word_pool(paths: list[Path], limit: int = 2000) -> list[str]:
+    """Words of up to `limit` reviews from the first existing folder, or the built-in list."""
+    for path in paths:
+        if Path(path).is_dir() and any(Path(path).glob("*/*.txt")):
+            reviews = data_loader.load_texts_from_folder(path, test_mode=True, sample_count=limit).data
+            return " ".join(reviews).split()
+    logger.info("No reviews found; sampling synthetic reviews from the built-in word list")
+    return list(_WORDS)
+
+
+# ─── Scorers ─────────────────────────────────────────────────────────────────────
+class InProcessScorer:
+    """Calls the predictor directly; returns the seconds spent per stage."""
+
+    def __init__(self, predictor: FusedPredictor):
+        self.predictor = predictor
+
+    def __call__(self, texts: list[str]) -> dict[str, float]:
+        _, timings = self.predictor.decision_function_timed(texts)
+        return timings
+
+
+class HttpScorer:
+    """POSTs reviews to a scoring server; the server reports its per-stage seconds."""
+
+    def __init__(self, url: str):
+        self.url = url.rstrip("/") + "/score"
+
+    def __call__(self, texts: list[str]) -> dict[str, float]:
+        request = urllib.request.Request(self.url, data=json.dumps({"texts": texts}).encode("utf-8"),
+                                         headers={"Content-Type": "application/json"})
+        with urllib.request.urlopen(request, timeout=60) as response:
+            return json.loads(response.read())["timings"]
+
+
+def make_server(predictor: FusedPredictor, port: int = 0) -> ThreadingHTTPServer:
+    """
+    Build a localhost scoring server: POST /score {"texts": [...]} → scores, labels and stage timings.
+    Args:
+        predictor (FusedPredictor): The predictor serving the requests.
+        port (int): Port on 127.0.0.1; 0 picks a free one.
+    Returns:
+        ThreadingHTTPServer: The server; call serve_forever to start it.
+    """
+    class Handler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            texts = json.loads(self.rfile.read(int(self.headers["Content-Length"])))["texts"]
+            scores, timings = predictor.decision_function_timed(texts)
+            body = json.dumps({
+                "scores": scores.tolist(),
+                "labels": predictor.classes[(scores > 0).astype(np.int64)].tolist(),
+                "timings": timings,
+            }).encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    return ThreadingHTTPServer(("127.0.0.1", port), Handler)
+
+
+# ─── Load Generator ──────────────────────────────────────────────────────────────
+def run_load(scorer, requests: list[list[str]], rate: float, concurrency: int, seed: int = 0) -> list[dict]:
+    """
+    Send requests at a Poisson arrival rate from a fixed number of worker threads.
+    Args:
+        scorer (callable): Scores a list of texts and returns seconds per stage.
+        requests (list[list[str]]): Request payloads in send order.
+        rate (float): Mean arrivals per second; 0 sends each request as soon as a worker is free.
+        concurrency (int): Number of worker threads.
+        seed (int): Seed of the arrival process.
+    Returns:
+        list[dict]: Per request the 'queue', 'service' and 'end_to_end' seconds, the stage
+            'timings' and an 'error' message if it failed.
+    """
+    rng = np.random.default_rng(seed)
+    gaps = rng.exponential(1 / rate, len(requests)) if rate > 0 else np.zeros(len(requests))
+    arrivals = np.cumsum(gaps)
+    pending = queue.Queue()
+    results = [None] * len(requests)
+
+    def worker():
+        for index, scheduled in iter(pending.get, None):
+            started = time.perf_counter()
+            row = {"queue": started - scheduled if rate > 0 else 0.0}
+            try:
+                row["timings"] = scorer(requests[index])
+            except Exception as e:
+                row["error"] = repr(e)
+            finished = time.perf_counter()
+            row["service"] = finished - started
+            row["end_to_end"] = finished - (scheduled if rate > 0 else started)
+            results[index] = row
+
+    threads = [threading.Thread(target=worker, daemon=True) for _ in range(concurrency)]
+    for thread in threads:
+        thread.start()
+
+    # Open loop: enqueue at the scheduled arrival times, whether or not a worker is free
+    start = time.perf_counter()
+    for index, arrival in enumerate(arrivals):
+        delay = start + arrival - time.perf_counter()
+        if delay > 0:
+            time.sleep(delay)
+        pending.put((index, start + arrival if rate > 0 else 0.0))
+    for _ in threads:
+        pending.put(None)
+    for thread in threads:
+        thread.join()
+    return results
+
+
+def latency_rows(results: list[dict], seconds: float) -> list[dict]:
+    """
+    Summarize request results as one row per stage plus service, queueing and end-to-end latency.
+    Args:
+        results (list[dict]): Output of run_load.
+        seconds (float): Wall time of the measured run.
+    Returns:
+        list[dict]: Percentiles and maximum in milliseconds per row.
+    """
+    ok = [r for r in results if "error" not in r]
+    series = {stage: [r["timings"][stage] for r in ok] for stage in STAGES}
+    series.update(service=[r["service"] for r in ok], queue=[r["queue"] for r in ok],
+                  end_to_end=[r["end_to_end"] for r in ok])
+    rows = []
+    for name, values in series.items():
+        values = np.asarray(values) * 1000
+        row = {"stage": name}
+        for p in PERCENTILES:
+            row[f"p{p}_ms"] = float(np.percentile(values, p)) if len(values) else float("nan")
+        row["max_ms"] = float(values.max()) if len(values) else float("nan")
+        rows.append(row)
+    rows.append({"stage": "summary", "requests": len(results), "errors": len(results) - len(ok),
+                 "seconds": seconds, "requests_per_second": len(results) / seconds})
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark online latency of the raw-review prediction path.")
+    parser.add_argument('--model-dir', type=Path, default=MODEL_DIR, help="Directory with the saved vectorizer and model.")
+    parser.add_argument('--predictor', type=Path, default=None, help="Saved FusedPredictor file (overrides --model-dir).")
+    parser.add_argument('--target', default="inprocess",
+                        help="'inprocess', 'localhost' (start a server here) or the URL of a running server.")
+    parser.add_argument('--serve', action='store_true', help="Only run the localhost scoring server.")
+    parser.add_argument('--port', type=int, default=8080, help="Port of the server started with --serve.")
+    parser.add_argument('--rate', type=float, default=20.0, help="Mean requests per second (0 = closed loop).")
+    parser.add_argument('--concurrency', type=int, default=4, help="Concurrent requests in flight.")
+    parser.add_argument('--requests', type=int, default=500, help="Measured requests.")
+    parser.add_argument('--warmup', type=int, default=50, help="Requests sent first and excluded from the report.")
+    parser.add_argument('--batch-size', type=int, default=1, help="Reviews per request.")
+    parser.add_argument('--data-dir', type=Path, nargs='*', default=[TEST_DATA_DIR, CLEANED_TEST_DIR],
+                        help="Folders whose reviews provide the word pool of the synthetic reviews.")
+    parser.add_argument('--repeat', type=float, default=0.0, help="Fraction of reviews repeating an earlier review.")
+    parser.add_argument('--cache-size', type=int, default=0, help="Scores kept in the prediction cache (0 = no cache).")
+    parser.add_argument('--cache-ttl', type=float, default=None, help="Seconds a cached score is served.")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', type=Path, default=None, help="Write the results as JSON to this file.")
+    for stage, options in STAGE_OPTIONS.items():
+        parser.add_argument(f'--{stage}', choices=options, default=None, help=f"Implementation of the {stage} stage.")
+    args = parser.parse_args()
+
+    stages = {stage: getattr(args, stage) for stage in STAGE_OPTIONS if getattr(args, stage) is not None}
+    if stages.get("lemmatize") == "memo" and args.concurrency > 1:
+        parser.error("The memo lemmatizer is not thread-safe; use --concurrency 1")
+
+    predictor = None
+    cache = PredictionCache(args.cache_size, ttl=args.cache_ttl) if args.cache_size > 0 else None
+    if args.serve or args.target in ("inprocess", "localhost"):
+        if args.predictor is not None:
+            predictor = FusedPredictor.load(args.predictor, cache=cache, **stages)
+        else:
+            predictor = FusedPredictor.from_model_dir(args.model_dir, cache=cache, **stages)
+
+    if args.serve:
+        server = make_server(predictor, args.port)
+        logger.info("Scoring server listening on http://127.0.0.1:%d/score", server.server_port)
+        server.serve_forever()
+        return
+
+    server = None
+    if args.target == "inprocess":
+        scorer = InProcessScorer(predictor)
+    elif args.target == "localhost":
+        server = make_server(predictor)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        scorer = HttpScorer(f"http://127.0.0.1:{server.server_port}")
+    else:
+        scorer = HttpScorer(args.target)
+
+    words = load_word_pool(args.data_dir)
+    reviews = synthetic_reviews((args.warmup + args.requests) * args.batch_size, words, seed=args.seed)
+    reviews = with_repeats(reviews, args.repeat, seed=args.seed)
+    payloads = [reviews[i:i + args.batch_size] for i in range(0, len(reviews), args.batch_size)]
+
+    try:
+        # Warm-up: load lazy resources and fill caches without recording latency
+        run_load(scorer, payloads[:args.warmup], rate=0, concurrency=args.concurrency, seed=args.seed)
+        start = time.perf_counter()
+        results = run_load(scorer, payloads[args.warmup:], args.rate, args.concurrency, seed=args.seed)
+        seconds = time.perf_counter() - start
+    finally:
+        if server is not None:
+            server.shutdown()
+
+    rows = latency_rows(results, seconds)
+    rows[-1].update(target=args.target, rate=args.rate, concurrency=args.concurrency, batch_size=args.batch_size,
+                    warmup=args.warmup, stages=predictor.stages if predictor is not None else None,
+                    mean_words=float(np.mean([len(r.split()) for r in reviews])), repeat=args.repeat,
+                    cache=cache.stats() if cache is not None else None)
+    write_results(rows, args.output)
+
+
+if __name__ == "__main__":
+    main()
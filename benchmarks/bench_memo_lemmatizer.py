@@ -0,0 +1,57 @@
+"""Benchmark the memoized lemmatizer against the full spaCy pass: reviews/sec, hit rate and divergence."""
+
+# ─── Standard Library Imports ────────────────────────────────────────────────────
+import argparse
+
+# ─── Project Imports ─────────────────────────────────────────────────────────────
+from common import add_data_arguments, load_splits, timed, write_results, logger
+from src.preprocessing import clean_text, filters, lemmatization, memo_lemmatizer
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the memoized lookup lemmatizer.")
+    add_data_arguments(parser)
+    parser.add_argument('--memo-size', type=int, default=100000)
+    args = parser.parse_args()
+
+    # Lemmatization input as in the preprocessing pipeline: cleaned and filtered reviews
+    train_set, test_set = load_splits(args)
+    warmup = [filters.filtering_pipeline(clean_text.regex_cleaning_pipeline(t)) for t in train_set.data]
+    texts = [filters.filtering_pipeline(clean_text.regex_cleaning_pipeline(t)) for t in test_set.data]
+
+    _, spacy_seconds = timed(lambda: [lemmatization.lemmatize_text(t) for t in texts])
+    results = [{"mode": "spacy", "reviews_per_second": len(texts) / spacy_seconds}]
+
+    for seeded in (False, True):
+        seed = memo_lemmatizer.load_lookup_table() if seeded else None
+        lemmatizer = memo_lemmatizer.MemoLemmatizer(max_size=args.memo_size, seed=seed)
+
+        # Cold: the memo fills up while scoring the training reviews
+        _, cold_seconds = timed(lambda: [lemmatizer.lemmatize_text(t) for t in warmup])
+        cold = lemmatizer.stats()
+
+        # Warm: unseen test reviews against the filled memo, compared with the full pass
+        lemmatizer.token_hits = lemmatizer.token_misses = lemmatizer.reviews = lemmatizer.reviews_from_memo = 0
+        _, warm_seconds = timed(lambda: [lemmatizer.lemmatize_text(t) for t in texts])
+        warm = lemmatizer.stats()
+        report = memo_lemmatizer.divergence_report(texts, lemmatizer)
+
+        results.append({
+            "mode": "memo+seed" if seeded else "memo",
+            "cold_reviews_per_second": len(warmup) / cold_seconds,
+            "cold_hit_rate": cold["hit_rate"],
+            "reviews_per_second": len(texts) / warm_seconds,
+            "speedup_vs_spacy": spacy_seconds / warm_seconds,
+            "hit_rate": warm["hit_rate"],
+            "reviews_from_memo": warm["reviews_from_memo"] / max(warm["reviews"], 1),
+            "memo_size": warm["memo_size"],
+            "ambiguous_tokens": warm["ambiguous_tokens"],
+            **report,
+        })
+        logger.info("Benchmarked memo lemmatizer (seeded=%s)", seeded)
+
+    write_results(results, args.output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""Benchmark the vectorized n-gram counting engine against TfidfVectorizer's own counting."""
+
+# ─── Standard Library Imports ────────────────────────────────────────────────────
+import argparse
+
+# ─── Third-Party Imports ─────────────────────────────────────────────────────────
+import numpy as np
+
+# ─── Project Imports ─────────────────────────────────────────────────────────────
+from common import add_data_arguments, load_splits, timed, write_results, logger
+from src.svm.training import vectorizer
+from src.svm.training.gridsearch_trainer import training_params
+
+
+def _identical(a, b) -> bool:
+    """Same vocabulary, idf and matrices down to the stored entry order."""
+    same = a.vectorizer.vocabulary_ == b.vectorizer.vocabulary_ and np.array_equal(a.vectorizer.idf_, b.vectorizer.idf_)
+    for X, Y in ((a.X_train, b.X_train), (a.X_test, b.X_test)):
+        same &= (np.array_equal(X.indptr, Y.indptr) and np.array_equal(X.indices, Y.indices)
+                 and np.array_equal(X.data, Y.data))
+    return bool(same)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare the sklearn and numpy encoder engines per ngram_range.")
+    add_data_arguments(parser)
+    parser.add_argument('--max-features', type=int, default=None, help="Defaults to the largest value in the grid.")
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    train_set, test_set = load_splits(args)
+    grid = training_params["vectorizer_param_grid"]
+    max_features = args.max_features or max(grid["max_features"])
+
+    results = []
+    for ngram_range in [(1, 1)] + [tuple(r) for r in grid["ngram_range"]]:
+        params = dict(max_features=max_features, ngram_range=ngram_range, sublinear_tf=True)
+        reference, sklearn_seconds = timed(vectorizer.tfidf_vectorizer, train_set, test_set, repeat=args.repeat,
+                                           engine="sklearn", **params)
+        encoded, numpy_seconds = timed(vectorizer.tfidf_vectorizer, train_set, test_set, repeat=args.repeat,
+                                       engine="numpy", **params)
+
+        identical = _identical(reference, encoded)
+        if not identical:
+            raise AssertionError(f"The numpy engine changed the encoding for ngram_range={ngram_range}")
+
+        results.append({
+            "ngram_range": list(ngram_range),
+            "max_features": max_features,
+            "n_features": len(encoded.vectorizer.vocabulary_),
+            "sklearn_seconds": sklearn_seconds,
+            "numpy_seconds": numpy_seconds,
+            "speedup": sklearn_seconds / numpy_seconds,
+            "identical": identical,
+        })
+        logger.info("ngram_range=%s: sklearn %.2fs, numpy %.2fs", ngram_range, sklearn_seconds, numpy_seconds)
+
+    write_results(results, args.output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""Benchmark the chunked parallel transform of the test split against a single transform call."""
+
+# ─── Standard Library Imports ────────────────────────────────────────────────────
+import argparse
+
+# ─── Third-Party Imports ─────────────────────────────────────────────────────────
+import numpy as np
+import scipy.sparse as sp
+from sklearn.feature_extraction.text import TfidfVectorizer
+
+# ─── Project Imports ─────────────────────────────────────────────────────────────
+from common import add_data_arguments, load_splits, timed, write_results, logger
+from src.svm.training import ngram_counter
+from src.svm.training.parallel_transform import ParallelTransformer, stack_csr
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark chunked parallel vectorizer.transform.")
+    add_data_arguments(parser)
+    parser.add_argument('--jobs', type=int, nargs='+', default=[1, 2, 4, 8])
+    parser.add_argument('--chunk-size', type=int, default=None, help="Documents per task (default: derived).")
+    parser.add_argument('--engine', choices=("sklearn", "numpy"), default="sklearn")
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    train_set, test_set = load_splits(args)
+    vectorizer = TfidfVectorizer(max_features=80000, ngram_range=(1, 2), sublinear_tf=True)
+    if args.engine == "numpy":
+        encoder = ngram_counter.NgramCounter(vectorizer)
+        encoder.fit_transform(train_set.data)
+    else:
+        encoder = vectorizer.fit(train_set.data)
+    docs = test_set.data
+
+    reference, serial_seconds = timed(encoder.transform, docs, repeat=args.repeat)
+    results = [{"jobs": "serial", "seconds": serial_seconds, "speedup": 1.0}]
+    for n_jobs in args.jobs:
+        with ParallelTransformer(encoder, n_jobs=n_jobs, chunk_size=args.chunk_size) as pool:
+            # The first call forks the workers; time the warm pool like a long scoring stream
+            _, startup_seconds = timed(pool.transform, docs)
+            X, seconds = timed(pool.transform, docs, repeat=args.repeat)
+        if (X != reference).nnz:
+            raise AssertionError(f"Parallel transform with {n_jobs} jobs differs from transform")
+        results.append({"jobs": n_jobs, "seconds": seconds, "first_call_seconds": startup_seconds,
+                        "speedup": serial_seconds / seconds})
+        logger.info("Benchmarked parallel transform with %d jobs", n_jobs)
+
+    # Stacking the ordered CSR pieces against scipy's generic vstack
+    pieces = [reference[i:i + 100] for i in range(0, reference.shape[0], 100)]
+    _, stack_seconds = timed(stack_csr, pieces, repeat=args.repeat)
+    _, vstack_seconds = timed(sp.vstack, pieces, format="csr", repeat=args.repeat)
+    results.append({"jobs": "stack_csr vs sp.vstack", "seconds": stack_seconds,
+                    "speedup": vstack_seconds / max(stack_seconds, np.finfo(float).tiny)})
+
+    write_results(results, args.output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""Benchmark float64 against float32 encodings: memory, disk size, speed and F1 parity."""
+
+# ─── Standard Library Imports ────────────────────────────────────────────────────
+import argparse
+import tempfile
+from pathlib import Path
+
+# ─── Third-Party Imports ─────────────────────────────────────────────────────────
+import numpy as np
+from sklearn.svm import LinearSVC
+from sklearn.metrics import f1_score
+
+# ─── Project Imports ─────────────────────────────────────────────────────────────
+from common import add_data_arguments, load_splits, timed, write_results, logger
+from src.data import data_loader
+from src.svm.training import vectorizer
+
+
+def _matrix_bytes(X) -> int:
+    """Return the memory held by the data and index arrays of a CSR matrix."""
+    return X.data.nbytes + X.indices.nbytes + X.indptr.nbytes
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the float32 precision mode against float64.")
+    add_data_arguments(parser)
+    parser.add_argument('--max-features', type=int, default=80000)
+    parser.add_argument('--ngram-max', type=int, default=3)
+    args = parser.parse_args()
+
+    train_set, test_set = load_splits(args)
+
+    results, decisions = [], {}
+    for dtype in (np.float64, np.float32):
+        data, encode_seconds = timed(
+            vectorizer.tfidf_vectorizer, train_set, test_set,
+            max_features=args.max_features, ngram_range=(1, args.ngram_max), sublinear_tf=True, dtype=dtype,
+        )
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "encoded.joblib"
+            data_loader.save_encoded_dataset_as_sparse_matrix(data, path, dtype=dtype)
+            disk_bytes = path.stat().st_size
+
+        model, fit_seconds = timed(LinearSVC().fit, data.X_train, data.y_train)
+        decision, predict_seconds = timed(model.decision_function, data.X_test, repeat=5)
+        decisions[dtype] = decision
+
+        results.append({
+            "dtype": np.dtype(dtype).name,
+            "index_dtype": data.X_train.indices.dtype.name,
+            "matrix_bytes": _matrix_bytes(data.X_train) + _matrix_bytes(data.X_test),
+            "disk_bytes": disk_bytes,
+            "encode_seconds": encode_seconds,
+            "fit_seconds": fit_seconds,
+            "predict_seconds": predict_seconds,
+            "f1": float(f1_score(data.y_test, (decision > 0).astype(int))),
+        })
+
+    # Accuracy check: decisions and predictions of both precisions must agree
+    diff = np.abs(decisions[np.float64] - decisions[np.float32])
+    flips = int(((decisions[np.float64] > 0) != (decisions[np.float32] > 0)).sum())
+    results.append({"max_decision_diff": float(diff.max()), "prediction_flips": flips,
+                    "f1_delta": results[1]["f1"] - results[0]["f1"]})
+    logger.info("float32 changed %d of %d test predictions", flips, len(diff))
+
+    write_results(results, args.output)
+
+
+if __name__ == "__main__":
+    main()
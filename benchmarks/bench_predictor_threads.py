@@ -0,0 +1,56 @@
+"""Benchmark throughput of one shared Predictor called from a growing number of threads."""
+
+# ─── Standard Library Imports ────────────────────────────────────────────────────
+import time
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+
+# ─── Third-Party Imports ─────────────────────────────────────────────────────────
+import numpy as np
+from sklearn.svm import LinearSVC
+
+# ─── Project Imports ─────────────────────────────────────────────────────────────
+from common import add_data_arguments, load_splits, write_results, logger
+from src.svm.training import vectorizer
+from src.svm.inference.predictor import Predictor
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark a shared Predictor under concurrent threads.")
+    add_data_arguments(parser)
+    parser.add_argument('--threads', type=int, nargs='+', default=[1, 2, 4, 8, 16])
+    parser.add_argument('--batch-size', type=int, default=64, help="Reviews per predictor call.")
+    parser.add_argument('--rounds', type=int, default=3, help="Passes over the test split per thread count.")
+    args = parser.parse_args()
+
+    train_set, test_set = load_splits(args)
+    data = vectorizer.tfidf_vectorizer(train_set, test_set, max_features=80000, ngram_range=(1, 2), sublinear_tf=True)
+    predictor = Predictor(data.vectorizer, LinearSVC().fit(data.X_train, data.y_train))
+
+    texts = test_set.data
+    batches = [texts[i:i + args.batch_size] for i in range(0, len(texts), args.batch_size)] * args.rounds
+    reference = np.concatenate([predictor.decision_function(b) for b in batches])
+
+    results = []
+    for n_threads in args.threads:
+        with ThreadPoolExecutor(max_workers=n_threads) as pool:
+            start = time.perf_counter()
+            scores = np.concatenate(list(pool.map(predictor.decision_function, batches)))
+            seconds = time.perf_counter() - start
+
+        # Concurrent calls must return exactly the single-threaded results
+        if not np.array_equal(scores, reference):
+            raise AssertionError(f"Results differ under {n_threads} threads")
+
+        results.append({
+            "threads": n_threads,
+            "reviews_per_second": len(scores) / seconds,
+            "speedup": (len(scores) / seconds) / (results[0]["reviews_per_second"] if results else len(scores) / seconds),
+        })
+        logger.info("Benchmarked predictor with %d threads", n_threads)
+
+    write_results(results, args.output)
+
+
+if __name__ == "__main__":
+    main()
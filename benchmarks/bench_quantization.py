@@ -0,0 +1,52 @@
+"""Benchmark int8/int16 quantized weights: decision error, flips, artifact size and scoring time."""
+
+# ─── Standard Library Imports ────────────────────────────────────────────────────
+import argparse
+import tempfile
+from pathlib import Path
+
+# ─── Third-Party Imports ─────────────────────────────────────────────────────────
+import joblib
+from sklearn.svm import LinearSVC
+
+# ─── Project Imports ─────────────────────────────────────────────────────────────
+from common import add_data_arguments, load_splits, timed, write_results, logger
+from src.svm.training import vectorizer
+from src.svm.inference.predictor import Predictor
+from src.svm.inference.quantized import QUANTIZATION_BITS, QuantizedPredictor, quantization_report
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark quantized SVM weights against the float model.")
+    add_data_arguments(parser)
+    parser.add_argument('--max-features', type=int, default=80000)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    train_set, test_set = load_splits(args)
+    data = vectorizer.tfidf_vectorizer(train_set, test_set, max_features=args.max_features, ngram_range=(1, 2),
+                                       sublinear_tf=True)
+    model = LinearSVC().fit(data.X_train, data.y_train)
+    texts = test_set.data
+
+    with tempfile.TemporaryDirectory() as directory:
+        directory = Path(directory)
+        joblib.dump(data.vectorizer, directory / "vectorizer.joblib")
+        joblib.dump(model, directory / "svm.joblib")
+        float_bytes = (directory / "vectorizer.joblib").stat().st_size + (directory / "svm.joblib").stat().st_size
+
+        _, float_seconds = timed(Predictor(data.vectorizer, model).decision_function, texts, repeat=args.repeat)
+        results = [{"bits": 64, "artifact_bytes": float_bytes, "seconds": float_seconds}]
+        for bits in QUANTIZATION_BITS:
+            quantized = QuantizedPredictor(data.vectorizer, model, bits=bits)
+            path = quantized.save(directory / f"quantized_{bits}.joblib")
+            _, seconds = timed(quantized.decision_function, texts, repeat=args.repeat)
+            report = quantization_report(quantized, data.vectorizer, model, texts, data.y_test)
+            results.append({**report, "artifact_bytes": path.stat().st_size, "seconds": seconds})
+            logger.info("Benchmarked int%d quantization", bits)
+
+    write_results(results, args.output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""Benchmark extending the SVM grid with and without the persistent result store."""
+
+# ─── Standard Library Imports ────────────────────────────────────────────────────
+import argparse
+import tempfile
+from pathlib import Path
+
+# ─── Third-Party Imports ─────────────────────────────────────────────────────────
+from sklearn.model_selection import ParameterGrid
+
+# ─── Project Imports ─────────────────────────────────────────────────────────────
+from common import add_data_arguments, load_splits, timed, write_results, logger
+from src.svm.training import vectorizer
+from src.svm.training.shared_memory import shared_grid_search
+from src.svm.training.result_store import ResultStore, format_summary
+from src.svm.training.gridsearch_trainer import training_params
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark incremental grid extension with the result store.")
+    add_data_arguments(parser)
+    parser.add_argument('--extra-C', type=float, default=4.0, help="C value added to the configured grid.")
+    parser.add_argument('--n-jobs', type=int, default=1)
+    args = parser.parse_args()
+
+    train_set, test_set = load_splits(args)
+    data = vectorizer.tfidf_vectorizer(train_set, test_set, max_features=80000, ngram_range=(1, 2), sublinear_tf=True)
+    grid = {name: list(values) for name, values in training_params["grid_search_params"].items()}
+    extended = {**grid, "C": grid["C"] + [args.extra_C]}
+    cv = training_params.get("trainer", {}).get("cv", 3)
+
+    with tempfile.TemporaryDirectory() as directory, ResultStore(Path(directory) / "results.sqlite") as store:
+        search = lambda param_grid, store=None: shared_grid_search(data, param_grid, cv=cv, n_jobs=args.n_jobs,
+                                                                   directory=directory, store=store)
+        _, base_seconds = timed(search, grid, store)
+        merged, incremental_seconds = timed(search, extended, store)
+        scratch, scratch_seconds = timed(search, extended)
+        if merged.best_params_ != scratch.best_params_:
+            raise AssertionError("Merged search selected different parameters than the search from scratch")
+        logger.info("Accuracy/fit-time Pareto front:\n%s", format_summary(store.pareto_front()))
+
+    results = [
+        {"run": "initial grid", "fits": len(ParameterGrid(grid)) * cv, "seconds": base_seconds},
+        {"run": "extended, from scratch", "fits": len(ParameterGrid(extended)) * cv, "seconds": scratch_seconds},
+        {"run": "extended, from store", "fits": (len(ParameterGrid(extended)) - len(ParameterGrid(grid))) * cv,
+         "seconds": incremental_seconds},
+    ]
+    write_results(results, args.output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""Benchmark peak memory and wall time of GridSearchCV against the shared-memory grid search."""
+
+# ─── Standard Library Imports ────────────────────────────────────────────────────
+import time
+import argparse
+
+# ─── Third-Party Imports ─────────────────────────────────────────────────────────
+from sklearn.svm import LinearSVC
+from sklearn.model_selection import GridSearchCV
+
+# ─── Project Imports ─────────────────────────────────────────────────────────────
+from common import add_data_arguments, load_splits, write_results, logger, ProcessTreeMemory
+from src.svm.training import vectorizer, shared_memory
+from src.svm.training.gridsearch_trainer import training_params
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare peak memory of copied and memory-mapped grid-search folds.")
+    add_data_arguments(parser)
+    parser.add_argument('--max-features', type=int, default=80000)
+    parser.add_argument('--ngram-max', type=int, default=3)
+    parser.add_argument('--n-jobs', type=int, nargs='+', default=[1, 4, 8])
+    args = parser.parse_args()
+
+    train_set, test_set = load_splits(args)
+    data = vectorizer.tfidf_vectorizer(
+        train_set, test_set, max_features=args.max_features, ngram_range=(1, args.ngram_max), sublinear_tf=True
+    )
+    param_grid = training_params["grid_search_params"]
+    X_mib = (data.X_train.data.nbytes + data.X_train.indices.nbytes + data.X_train.indptr.nbytes) / 2**20
+
+    results = []
+    for n_jobs in args.n_jobs:
+        for mode in ("copied", "shared"):
+            with ProcessTreeMemory() as memory:
+                start = time.perf_counter()
+                if mode == "shared":
+                    grid = shared_memory.shared_grid_search(data, param_grid, cv=3, n_jobs=n_jobs)
+                else:
+                    grid = GridSearchCV(LinearSVC(), param_grid, cv=3, scoring="f1", n_jobs=n_jobs)
+                    grid.fit(data.X_train, data.y_train)
+                seconds = time.perf_counter() - start
+
+            results.append({
+                "mode": mode,
+                "n_jobs": n_jobs,
+                "X_train_mib": X_mib,
+                "peak_rss_mib": memory.peak_rss_mib,
+                "peak_pss_mib": memory.peak_pss_mib,
+                "seconds": seconds,
+                "best_score": float(grid.best_score_),
+            })
+            logger.info("Benchmarked %s folds with n_jobs=%d", mode, n_jobs)
+
+    write_results(results, args.output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""Benchmark peak memory of collecting every encoding against the streamed encode → train → discard loop."""
+
+# ─── Standard Library Imports ────────────────────────────────────────────────────
+import time
+import argparse
+import tempfile
+import itertools
+from pathlib import Path
+
+# ─── Project Imports ─────────────────────────────────────────────────────────────
+from common import add_data_arguments, load_splits, write_results, logger, ProcessTreeMemory
+from src.svm.training import vectorizer, gridsearch_trainer, streaming
+
+
+def collect_all(train_set, test_set, combinations, directory):
+    """The previous loop: encode every combination, then train on each, keeping everything."""
+    encoded = {}
+    for param_dict in combinations:
+        name, data_set, param_dict, _ = vectorizer.encode_and_save(train_set, test_set, param_dict, directory=directory)
+        encoded[name] = data_set
+    models = {name: gridsearch_trainer.train_svm_model(data_set) for name, data_set in encoded.items()}
+    return max(models.items(), key=lambda item: item[1].best_score_)[0]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare peak memory of the collected and streamed encoder grid.")
+    add_data_arguments(parser)
+    parser.add_argument('--max-features', type=int, nargs='+', default=[80000, 50000])
+    parser.add_argument('--ngram-max', type=int, nargs='+', default=[2, 3])
+    args = parser.parse_args()
+
+    train_set, test_set = load_splits(args)
+    combinations = [{"max_features": mf, "ngram_range": (1, n), "sublinear_tf": True}
+                    for mf, n in itertools.product(args.max_features, args.ngram_max)]
+
+    results = []
+    for mode in ("collected", "streamed"):
+        with tempfile.TemporaryDirectory() as tmp, ProcessTreeMemory() as memory:
+            start = time.perf_counter()
+            if mode == "streamed":
+                best_name = streaming.stream_encoder_grid(train_set, test_set, combinations, directory=Path(tmp)).name
+            else:
+                best_name = collect_all(train_set, test_set, combinations, Path(tmp))
+            seconds = time.perf_counter() - start
+
+        results.append({
+            "mode": mode,
+            "encodings": len(combinations),
+            "peak_rss_mib": memory.peak_rss_mib,
+            "seconds": seconds,
+            "best_encoding": best_name,
+        })
+        logger.info("Benchmarked %s encoder grid", mode)
+
+    write_results(results, args.output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""Benchmark throughput and per-worker memory of the pre-fork scoring pool.
+
+Compares workers forked around a SharedPredictor (memory-mapped arrays and hash index)
+with workers forked around a plain Predictor, whose vocabulary dict pages are copied
+as soon as the workers touch the reference counts of its entries.
+"""
+
+# ─── Standard Library Imports ────────────────────────────────────────────────────
+import os
+import time
+import argparse
+import tempfile
+from pathlib import Path
+
+# ─── Third-Party Imports ─────────────────────────────────────────────────────────
+import numpy as np
+from sklearn.svm import LinearSVC
+
+# ─── Project Imports ─────────────────────────────────────────────────────────────
+from common import add_data_arguments, load_splits, write_results, logger
+from src.data import data_loader
+from src.svm.training import vectorizer
+from src.svm.inference.predictor import Predictor
+from src.svm.inference.worker_pool import ScoringPool, SharedPredictor, process_memory_kib
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the pre-fork scoring worker pool.")
+    add_data_arguments(parser)
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 4, 16])
+    parser.add_argument('--batch-size', type=int, default=64, help="Reviews per request.")
+    parser.add_argument('--rounds', type=int, default=3, help="Passes over the test split per worker count.")
+    parser.add_argument('--max-features', type=int, default=200000)
+    args = parser.parse_args()
+
+    train_set, test_set = load_splits(args)
+    data = vectorizer.tfidf_vectorizer(train_set, test_set, max_features=args.max_features, ngram_range=(1, 2),
+                                       sublinear_tf=True)
+    model_dir = Path(tempfile.mkdtemp(prefix="bench_worker_pool_"))
+    data_loader.save_encoder(model_dir / "vectorizer__bench.joblib", data.vectorizer)
+    data_loader.save_svm_model(LinearSVC().fit(data.X_train, data.y_train), model_dir / "svm__bench.joblib")
+    del data
+
+    texts = test_set.data
+    batches = [texts[i:i + args.batch_size] for i in range(0, len(texts), args.batch_size)] * args.rounds
+    reference = None
+
+    results = []
+    for mode in ("shared", "dict"):
+        if mode == "shared":
+            predictor = SharedPredictor.from_model_dir(model_dir)
+        else:
+            predictor = Predictor.from_model_dir(model_dir)
+        if reference is None:
+            reference = np.concatenate([predictor.decision_function(b) for b in batches])
+
+        for n_workers in args.workers:
+            with ScoringPool(predictor, n_workers) as pool:
+                start = time.perf_counter()
+                scores = np.concatenate(list(pool.map(batches)))
+                seconds = time.perf_counter() - start
+                memory = list(pool.memory().values())
+
+            if not np.allclose(scores, reference, rtol=0, atol=1e-12):
+                raise AssertionError(f"Pool scores differ in {mode} mode with {n_workers} workers")
+
+            results.append({
+                "mode": mode,
+                "workers": n_workers,
+                "reviews_per_second": len(scores) / seconds,
+                "worker_rss_mib": float(np.mean([m["rss"] for m in memory]) / 1024),
+                "worker_uss_mib": float(np.mean([m["uss"] for m in memory]) / 1024),
+                "worker_pss_mib": float(np.mean([m["pss"] for m in memory]) / 1024),
+                "total_uss_mib": sum(m["uss"] for m in memory) / 1024,
+                "parent_rss_mib": process_memory_kib(os.getpid())["rss"] / 1024,
+            })
+            logger.info("Benchmarked %s pool with %d workers", mode, n_workers)
+
+        if mode == "shared":
+            predictor.release()
+        del predictor
+
+    write_results(results, args.output)
+
+
+if __name__ == "__main__":
+    main()
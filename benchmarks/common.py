@@ -0,0 +1,156 @@
+"""Shared helpers for the benchmark scripts: data loading, timing and result output."""
+
+# ─── Standard Library Imports ────────────────────────────────────────────────────
+import os
+import sys
+import json
+import time
+import threading
+from pathlib import Path
+
+# ─── Project Root Setup ──────────────────────────────────────────────────────────
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.append(str(ROOT))
+
+# ─── Project Imports ─────────────────────────────────────────────────────────────
+from src.data import data_loader
+from src.config import logging_config
+from src.config.paths import CLEANED_TRAIN_DIR, CLEANED_TEST_DIR
+
+# ─── Logging Setup ───────────────────────────────────────────────────────────────
+logger = logging_config.configure_logging()
+
+
+def add_data_arguments(parser):
+    """
+    Add the data selection arguments shared by all benchmarks to an argument parser.
+    Args:
+        parser (argparse.ArgumentParser): The parser to extend.
+    Returns:
+        None
+    """
+    parser.add_argument('--train-dir', type=Path, default=CLEANED_TRAIN_DIR, help="Folder with preprocessed training reviews.")
+    parser.add_argument('--test-dir', type=Path, default=CLEANED_TEST_DIR, help="Folder with preprocessed test reviews.")
+    parser.add_argument('--samples', type=int, default=0, help="Limit each split to this many reviews (0 = all).")
+    parser.add_argument('--output', type=Path, default=None, help="Write the results as JSON to this file.")
+
+
+def load_splits(args):
+    """
+    Load the train and test splits selected by the shared data arguments.
+    Args:
+        args (argparse.Namespace): Parsed arguments from add_data_arguments.
+    Returns:
+        tuple[Bunch, Bunch]: The training and test datasets.
+    """
+    test_mode = args.samples > 0
+    train_set = data_loader.load_texts_from_folder(args.train_dir, test_mode=test_mode, sample_count=args.samples)
+    test_set = data_loader.load_texts_from_folder(args.test_dir, test_mode=test_mode, sample_count=args.samples)
+    return train_set, test_set
+
+
+def timed(fn, *args, repeat: int = 1, **kwargs):
+    """
+    Call a function repeatedly and return its last result with the best wall time.
+    Args:
+        fn (callable): The function to time.
+        repeat (int): Number of calls; the fastest one is reported.
+    Returns:
+        tuple: (result, seconds) of the fastest call.
+    """
+    best = float("inf")
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn(*args, **kwargs)
+        best = min(best, time.perf_counter() - start)
+    return result, best
+
+
+def write_results(results, path: Path | None):
+    """
+    Log benchmark results and optionally write them as JSON.
+    Args:
+        results (list[dict] or dict): The benchmark results.
+        path (Path, optional): Destination of the JSON file.
+    Returns:
+        None
+    """
+    rows = results if isinstance(results, list) else [results]
+    for row in rows:
+        logger.info("%s", ", ".join(f"{k}={v:.4g}" if isinstance(v, float) else f"{k}={v}" for k, v in row.items()))
+
+    if path is not None:
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(results, indent=2), encoding="utf-8")
+        logger.info("Benchmark results written to %s", path)
+
+
+def _descendants(pid: int) -> list[int]:
+    """Return the pids of all living descendants of a process (Linux /proc only)."""
+    children = {}
+    for entry in Path("/proc").iterdir():
+        if not entry.name.isdigit():
+            continue
+        try:
+            ppid = int((entry / "stat").read_text().rsplit(")", 1)[1].split()[1])
+        except (OSError, IndexError, ValueError):
+            continue
+        children.setdefault(ppid, []).append(int(entry.name))
+    found, stack = [], [pid]
+    while stack:
+        for child in children.get(stack.pop(), []):
+            found.append(child)
+            stack.append(child)
+    return found
+
+
+def _memory_kib(pid: int) -> tuple[int, int]:
+    """Return (RSS, PSS) of a process in KiB, or zeros if it is gone."""
+    try:
+        rss = pss = 0
+        for line in Path(f"/proc/{pid}/smaps_rollup").read_text().splitlines():
+            if line.startswith("Rss:"):
+                rss = int(line.split()[1])
+            elif line.startswith("Pss:"):
+                pss = int(line.split()[1])
+        return rss, pss
+    except OSError:
+        return 0, 0
+
+
+class ProcessTreeMemory:
+    """
+    Context manager sampling the summed memory of this process and all its descendants.
+    RSS counts shared pages once per process; PSS divides them among the sharers.
+
+    Attributes:
+    - peak_rss_mib: Highest summed RSS observed, in MiB.
+    - peak_pss_mib: Highest summed PSS observed, in MiB.
+    """
+
+    def __init__(self, interval: float = 0.05):
+        self.interval = interval
+        self.peak_rss_mib = 0.0
+        self.peak_pss_mib = 0.0
+        self._stop = threading.Event()
+
+    def _sample(self):
+        while not self._stop.is_set():
+            pids = [os.getpid()] + _descendants(os.getpid())
+            usage = [_memory_kib(pid) for pid in pids]
+            self.peak_rss_mib = max(self.peak_rss_mib, sum(u[0] for u in usage) / 1024)
+            self.peak_pss_mib = max(self.peak_pss_mib, sum(u[1] for u in usage) / 1024)
+            self._stop.wait(self.interval)
+
+    def __enter__(self):
+        self._thread = threading.Thread(target=self._sample, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._thread.join()
+        return False
@@ -6,7 +6,7 @@ from pathlib import Path
 from sklearn.metrics import classification_report
 
 # ─── Project Module Imports ──────────────────────────────────────────────────────
-from src.data import data_loader
+from src.svm.inference.fused_predictor import FusedPredictor
 from src.config import logging_config
 from src.config.paths import TEST_DATA_DIR, MODEL_DIR
 
@@ -42,34 +42,20 @@ for i in range(samples):
     y_test.append(1)  # Positive review
                 
 
-# Find the Encoder
+# Load the fused predictor saved by training, or build it from the saved encoder and model
 path = Path(MODEL_DIR)
-matching_files = list(path.glob("*vectorizer*"))
-logger.info("Loading vectorizer from %s", path)
-logger.info("Found %d vectorizer files", len(matching_files))
-
-# Load the Encoder
-vectorizer = data_loader.load_encoder(matching_files[0])
-logger.info("Using vectorizer file: %s", matching_files[0])
-
-# Find the Model
-matching_files = list(path.glob("*svm*"))
-logger.info("Loading model from %s", path)
-logger.info("Found %d model files", len(matching_files))
-
-# Load the Model
-model = data_loader.load_svm_model(matching_files[0])
-logger.info("Using model file: %s", matching_files[0])
-
-# Encode the Data
-logger.info("Encoding the data")
-encoded_data = vectorizer.transform(x_test)
-logger.info("Encoded data shape: %s", encoded_data.shape)
-logger.info("Encoded data type: %s", type(encoded_data))
-
-# Make Predictions
+predictor_files = sorted(path.glob("predictor__*.joblib"), key=lambda p: p.stat().st_mtime)
+if predictor_files:
+    predictor = FusedPredictor.load(predictor_files[-1])
+else:
+    logger.info("No fused predictor found in %s; building it from the saved encoder and model", path)
+    predictor = FusedPredictor.from_model_dir(path)
+logger.info("Using model %s with stages %s", predictor.version, predictor.stages)
+
+# Make Predictions; the raw reviews go through the same preprocessing as in training
 logger.info("Making predictions")
-y_pred = model.predict(encoded_data)
+y_pred = predictor.predict(x_test)
+logger.info("Per-stage latency: %s", predictor.latency())
 
 # Generate a classification report
 target_names = ["neg", "pos"]
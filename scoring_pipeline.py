@@ -0,0 +1,77 @@
+"""Batch scoring entry point: stream reviews from JSONL files or stdin through the trained model."""
+
+# ─── Standard Library Imports ────────────────────────────────────────────────────
+import argparse
+from pathlib import Path
+
+# ─── Project Imports ─────────────────────────────────────────────────────────────
+from src.data import data_loader
+from src.svm.inference import batch_scorer, hot_reload
+from src.preprocessing import memo_lemmatizer
+from src.config import logging_config
+from src.config.paths import MODEL_DIR
+
+# ─── Argument Parsing ────────────────────────────────────────────────────────────
+parser = argparse.ArgumentParser(description="Score reviews from JSONL files or stdin.")
+parser.add_argument('inputs', nargs='*', default=['-'], help="Input JSONL files with one review per line ('-' for stdin).")
+parser.add_argument('--output', type=Path, default=None, help="Output JSONL file (default: stdout).")
+parser.add_argument('--checkpoint', type=Path, default=None, help="Checkpoint file for resumable runs (requires --output).")
+parser.add_argument('--batch-size', type=int, default=512, help="Number of reviews scored per batch.")
+parser.add_argument('--prefetch', type=int, default=4, help="Number of parsed batches buffered ahead of scoring.")
+parser.add_argument('--text-field', default="text", help="JSON field holding the review text.")
+parser.add_argument('--id-field', default="id", help="JSON field holding the review id.")
+parser.add_argument('--skip-preprocessing', action='store_true', help="Input is already preprocessed.")
+parser.add_argument('--memo-lemmatizer', action='store_true', help="Lemmatize with the memoized lookup fast path.")
+parser.add_argument('--memo-size', type=int, default=100000, help="Maximum number of tokens in the lemma memo.")
+parser.add_argument('--seed-lookups', action='store_true', help="Pre-seed the lemma memo from spaCy's lookup table.")
+parser.add_argument('--transform-jobs', type=int, default=1, help="Worker processes vectorizing each batch in chunks (-1: all cores).")
+parser.add_argument('--hot-reload', action='store_true', help="Swap in newly trained artifacts of the model directory between batches.")
+parser.add_argument('--reload-interval', type=float, default=2.0, help="Seconds between checks of the model directory.")
+parser.add_argument('--model-dir', type=Path, default=MODEL_DIR, help="Directory with the saved vectorizer and SVM model.")
+args = parser.parse_args()
+
+# ─── Logging Setup ───────────────────────────────────────────────────────────────
+logger = logging_config.configure_logging()
+
+
+def scoring():
+    # Load the encoder and the model, optionally watching the model directory for new ones
+    reloader = None
+    if args.hot_reload:
+        reloader = hot_reload.HotReloader(args.model_dir, loader=hot_reload.load_artifacts,
+                                          interval=args.reload_interval).start()
+        vectorizer, model = reloader.current()
+    else:
+        vectorizer_path, model_path = data_loader.find_model_artifacts(args.model_dir)
+        vectorizer = data_loader.load_encoder(vectorizer_path)
+        model = data_loader.load_svm_model(model_path)
+
+    # Optionally lemmatize through the memo instead of the full spaCy pipeline
+    lemmatizer = None
+    if args.memo_lemmatizer:
+        seed = memo_lemmatizer.load_lookup_table() if args.seed_lookups else None
+        lemmatizer = memo_lemmatizer.MemoLemmatizer(max_size=args.memo_size, seed=seed)
+
+    # Stream the input through the model
+    batch_scorer.score_stream(
+        args.inputs, vectorizer, model,
+        output=args.output,
+        checkpoint=args.checkpoint,
+        batch_size=args.batch_size,
+        prefetch=args.prefetch,
+        preprocess=not args.skip_preprocessing,
+        text_field=args.text_field,
+        id_field=args.id_field,
+        lemmatizer=lemmatizer,
+        transform_n_jobs=args.transform_jobs,
+        reloader=reloader,
+    )
+    if reloader is not None:
+        reloader.stop()
+        logger.info("Model reload statistics: %s", reloader.stats())
+    if lemmatizer is not None:
+        logger.info("Memo lemmatizer statistics: %s", lemmatizer.stats())
+
+
+if __name__ == "__main__":
+    scoring()
@@ -3,9 +3,15 @@
 # ─── Imports ─────────────────────────────────────────────────────────────────────
 import os
 import sys
+import queue
+import atexit
+import weakref
 from pathlib import Path
+from contextlib import contextmanager
 from datetime import datetime
 import logging
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from multiprocessing import util as mp_util
 # ─── Path Setup ──────────────────────────────────────────────────────────────────
 PROJECT_ROOT = Path(__file__).resolve().parents[2]
 if str(PROJECT_ROOT) not in sys.path:
@@ -20,28 +26,158 @@ LOG_DIR = Path(os.getenv("LOG_DIR", LOG_DIR)).resolve()
 LOG_ROOT = Path(os.getenv("LOG_ROOT", LOG_ROOT)).resolve()
 log_prefix = os.getenv("LOG_CONTEXT", "project") 
 
-timestamp = datetime.now()
-timestamp = timestamp.strftime("%Y-%m-%d_%H-%M-%S")
+# Asynchronous sink and size-based rotation of the log files
+LOG_ASYNC = os.getenv("LOG_ASYNC", "1") != "0"
+LOG_MAX_BYTES = int(os.getenv("LOG_MAX_BYTES", 50 * 2**20))
+LOG_BACKUP_COUNT = int(os.getenv("LOG_BACKUP_COUNT", 5))
+
+# Main process and timestamp of the run. Forked workers inherit them; spawn-started workers
+# read them from the environment that worker_log_environment() sets while they are launched
+_RUN_ENVIRONMENT = ("LOG_MAIN_PID", "LOG_TIMESTAMP")
+MAIN_PID = int(os.environ.pop("LOG_MAIN_PID", os.getpid()))
+timestamp = os.environ.pop("LOG_TIMESTAMP", None) or datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
 LOG_FILE = LOG_DIR / f"{timestamp}_{log_prefix}.log"
 
 log_path = Path(LOG_FILE)
 log_path.parent.mkdir(parents=True, exist_ok=True)
 
+def process_log_file(pid: int | None = None) -> Path:
+    """Log file of a process: LOG_FILE for the main process, LOG_FILE with the pid for workers."""
+    pid = pid or os.getpid()
+    return LOG_FILE if pid == MAIN_PID else LOG_FILE.with_name(f"{LOG_FILE.stem}_pid{pid}.log")
+
+@contextmanager
+def worker_log_environment():
+    """
+    Export the run's main pid and timestamp while spawn-started workers are launched, so
+    they log to per-process files next to the main log. The environment is restored on
+    exit, so unrelated subprocesses start a run of their own.
+    """
+    saved = {key: os.environ.get(key) for key in _RUN_ENVIRONMENT}
+    os.environ.update(LOG_MAIN_PID=str(MAIN_PID), LOG_TIMESTAMP=timestamp)
+    try:
+        yield
+    finally:
+        for key, value in saved.items():
+            if value is None:
+                os.environ.pop(key, None)
+            else:
+                os.environ[key] = value
+
 # ─── Formatter ───────────────────────────────────────────────────────
 class PathSanitizerFormatter(logging.Formatter):
+    """Formatter that replaces the project root in messages and arguments with 'project_root'."""
+
+    def __init__(self, *args, root: Path = LOG_ROOT, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Resolved once; sanitizing a record is then a plain substring replace
+        self.root = str(Path(root).resolve())
+        self._last = (lambda: None, None)
+
     def sanitize(self, msg):
         if isinstance(msg, Path):
             msg = str(msg)
-        if isinstance(msg, str):
-            log_root_str = str(LOG_ROOT.resolve())
-            msg = msg.replace(log_root_str, 'project_root')
+        if isinstance(msg, str) and self.root in msg:
+            msg = msg.replace(self.root, 'project_root')
         return msg
 
     def format(self, record):
+        # The console and file handler share this formatter; format each record once
+        last_record, last_text = self._last
+        if last_record() is record:
+            return last_text
         record.msg = self.sanitize(record.msg)
         if record.args and isinstance(record.args, tuple):
             record.args = tuple(self.sanitize(a) for a in record.args)
-        return super().format(record)
+        text = super().format(record)
+        self._last = (weakref.ref(record), text)
+        return text
+
+class MergingQueueHandler(QueueHandler):
+    """QueueHandler that only merges the arguments on the calling thread; formatting happens in the writer."""
+
+    def prepare(self, record):
+        # Merge now so mutable arguments are logged as they were; the record itself is not copied
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+# ─── Handlers ────────────────────────────────────────────────────────
+# Loggers configured in this process, and the background listener of each
+_configured = {}
+
+def _build_handlers(log_file: Path) -> list[logging.Handler]:
+    """Console handler and size-rotated file handler sharing the sanitizing formatter."""
+    formatter = PathSanitizerFormatter('%(asctime)s - %(levelname)s - %(message)s')
+
+    # Console handler
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(formatter)
+
+    # File handler, rotated by size; worker files are only created once they get a record
+    file_handler = RotatingFileHandler(log_file, maxBytes=LOG_MAX_BYTES, backupCount=LOG_BACKUP_COUNT,
+                                       encoding='utf-8', delay=log_file != LOG_FILE)
+    file_handler.setFormatter(formatter)
+    return [stream_handler, file_handler]
+
+class ProcessQueueListener(QueueListener):
+    """QueueListener that records the process that owns it and whether its writer thread runs."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.pid = os.getpid()
+        self.running = False
+
+    def start(self):
+        super().start()
+        self.running = True
+
+    def stop(self):
+        super().stop()
+        self.running = False
+
+def _stop_listener(listener: ProcessQueueListener):
+    """Drain the queue and stop the background writer of this process; safe to call more than once."""
+    if listener.pid == os.getpid() and listener.running:
+        listener.stop()
+        for handler in listener.handlers:
+            handler.close()
+
+def _flush_at_exit(listener: ProcessQueueListener):
+    """Stop the writer at interpreter exit and at multiprocessing worker exit, which skips atexit."""
+    atexit.register(_stop_listener, listener)
+    mp_util.Finalize(None, _stop_listener, args=(listener,), exitpriority=0)
+
+def _attach(logger: logging.Logger):
+    """Attach the handlers of this process to a logger, behind a queue if LOG_ASYNC is set."""
+    handlers = _build_handlers(process_log_file())
+    if not LOG_ASYNC:
+        for handler in handlers:
+            logger.addHandler(handler)
+        _configured[logger.name] = None
+        return
+
+    # The calling thread only enqueues; a background thread formats and writes
+    log_queue = queue.SimpleQueue()
+    listener = ProcessQueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    logger.addHandler(MergingQueueHandler(log_queue))
+    _configured[logger.name] = listener
+
+    # multiprocessing drops the exit hooks when a worker starts; re-arm them there
+    _flush_at_exit(listener)
+    mp_util.register_after_fork(listener, _flush_at_exit)
+
+def _reattach_after_fork():
+    """Give a forked child its own queue, writer thread and per-process log file."""
+    for name in list(_configured):
+        logger = logging.getLogger(name)
+        # The parent's writer thread does not exist in the child; its handlers are left to the parent
+        for handler in list(logger.handlers):
+            logger.removeHandler(handler)
+        _attach(logger)
+
+os.register_at_fork(after_in_child=_reattach_after_fork)
 
 # ─── Logger Config ───────────────────────────────────────────────────
 def configure_logging(logger_name='project_logger') -> logging.Logger:
@@ -49,18 +185,17 @@ def configure_logging(logger_name='project_logger') -> logging.Logger:
     logger = logging.getLogger(logger_name)
 
     if not logger.hasHandlers():
-        formatter = PathSanitizerFormatter('%(asctime)s - %(levelname)s - %(message)s')
-
-        # Console handler
-        stream_handler = logging.StreamHandler()
-        stream_handler.setFormatter(formatter)
-        logger.addHandler(stream_handler)
-
-        # File handler
-        file_handler = logging.FileHandler(LOG_FILE, encoding='utf-8')
-        file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
-
+        _attach(logger)
         logger.setLevel(LOG_LEVEL)
 
     return logger
+
+def shutdown_logging(logger_name='project_logger'):
+    """Write all queued records of a logger, stop its writer and detach its handlers."""
+    logger = logging.getLogger(logger_name)
+    listener = _configured.pop(logger_name, None)
+    if listener is not None:
+        _stop_listener(listener)
+    for handler in list(logger.handlers):
+        logger.removeHandler(handler)
+        handler.close()
@@ -1,3 +1,3 @@
-from . import data_classes, download_data, data_loader
+from . import data_classes, download_data, data_loader, deduplication
 
-__all__ = ["download_data", "data_loader", "data_classes"]
\ No newline at end of file
+__all__ = ["download_data", "data_loader", "data_classes", "deduplication"]
@@ -2,9 +2,14 @@
 """Module to load, encode, and save datasets using TfidfDataset."""
 
 # ─── Standard Library Imports ────────────────────────────────────────────────────
+import os
+import json
+import time
 from pathlib import Path
+from datetime import datetime, timezone
 
 # ─── Third-Party Imports ─────────────────────────────────────────────────────────
+import numpy as np
 from src.config import logging_config
 from sklearn.datasets import load_files
 from sklearn.utils import Bunch
@@ -14,12 +19,15 @@ from sklearn.feature_extraction.text import TfidfVectorizer
 
 # ─── Project Imports ──────────────────────────────────────────────────────────────
 from src.data.data_classes import TfidfDataset
-from src.config.paths import CLEANED_DATA_TXT_DIR, ENCODED_DATA_DIR
+from src.config.paths import CLEANED_DATA_TXT_DIR, ENCODED_DATA_DIR, MODEL_DIR
 
 # ─── Set up logging ───────────────────────────────────────────────────────────────
 
 logger = logging_config.configure_logging()
 
+# File naming the active artifacts of a model directory
+MODEL_MANIFEST = "manifest.json"
+
 
 def load_texts_from_folder(path, test_mode: bool = False, sample_count: int=20) -> Bunch:
     """
@@ -54,7 +62,7 @@ def save_dataset_as_txt(dataset: Bunch, split: str, path: str = CLEANED_DATA_TXT
     """
     Save the dataset to the specified directory, organizing files into 'pos' and 'neg' subdirectories.
     Args:
-        dataset (Bunch): The dataset to save, containing 'data' and 'target'.
+        dataset (Bunch): The dataset to save, containing 'data' (texts or token lists) and 'target'.
         DATA_DIR (str or Path): The directory where the dataset will be saved.
         split (str): The split of the dataset ('train' or 'test').
     Returns:
@@ -79,17 +87,36 @@ def save_dataset_as_txt(dataset: Bunch, split: str, path: str = CLEANED_DATA_TXT
         label_dir = label_map[label]
         file_path = SAVE_DIR / split / label_dir / f"{i}.txt"
         with open(file_path, "w", encoding="utf-8") as f:
-            f.write(text)
+            # Token lists are stored space-separated; the vectorizer splits them back identically
+            f.write(text if isinstance(text, str) else " ".join(text))
         logger.debug(f"Saved file: {file_path}")
     logger.info(f"Saved {len(dataset.data)} files to {SAVE_DIR / split}")
 
-def save_encoded_dataset_as_sparse_matrix(dataset: TfidfDataset, path: str = ENCODED_DATA_DIR):
+def compact_sparse_matrix(X, dtype=np.float32):
+    """
+    Convert a sparse matrix to the given float dtype with int32 index arrays.
+    Index arrays are only downcast when the matrix fits 32-bit indexing.
+    Args:
+        X (csr_matrix): The sparse matrix to convert.
+        dtype (np.dtype): The target dtype of the stored values.
+    Returns:
+        csr_matrix: The converted matrix (X itself if nothing had to change).
+    """
+    X = X.astype(dtype, copy=False)
+    int32_max = np.iinfo(np.int32).max
+    if X.nnz <= int32_max and max(X.shape) <= int32_max:
+        X.indices = X.indices.astype(np.int32, copy=False)
+        X.indptr = X.indptr.astype(np.int32, copy=False)
+    return X
+
+def save_encoded_dataset_as_sparse_matrix(dataset: TfidfDataset, path: str = ENCODED_DATA_DIR, dtype=None):
     """
     Save the dataset as a sparse matrix in the specified directory.
     Args:
         dataset (Bunch): The dataset to save, containing 'data' and 'target'.
         DATA_DIR (str or Path): The directory where the dataset will be saved.
         split (str): The split of the dataset ('train' or 'test').
+        dtype (np.dtype, optional): If given, the matrices are stored with this dtype and int32 indices.
     Returns:
         None
     """
@@ -101,12 +128,17 @@ def save_encoded_dataset_as_sparse_matrix(dataset: TfidfDataset, path: str = ENC
         path = Path(path)
     path.parent.mkdir(parents=True, exist_ok=True)
 
+    # Optionally store the matrices in a compact precision
+    X_train, X_test = dataset.X_train, dataset.X_test
+    if dtype is not None:
+        X_train = compact_sparse_matrix(X_train, dtype)
+        X_test = compact_sparse_matrix(X_test, dtype)
 
     # Save the sparse matrix and target labels
     dump({
-        "X_train": dataset.X_train,
+        "X_train": X_train,
         "y_train": dataset.y_train,
-        "X_test": dataset.X_test,
+        "X_test": X_test,
         "y_test": dataset.y_test,
         "vectorizer": dataset.vectorizer
     }, path)
@@ -144,6 +176,24 @@ def load_encoded_dataset_joblib(path: str = ENCODED_DATA_DIR / "complete_dataset
     
     return dataset
 
+def dump_atomic(obj, path: str | Path) -> Path:
+    """
+    Dump an object with joblib to a temporary file and move it into place.
+    Args:
+        obj: The object to save.
+        path (str or Path): Destination file; replaced in one step if it exists.
+    Returns:
+        Path: The written file.
+    """
+    path = Path(path)
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    try:
+        dump(obj, tmp_path)
+        os.replace(tmp_path, path)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+    return path
+
 def save_svm_model(model: GridSearchCV, path: str = ENCODED_DATA_DIR / "svm_model.joblib"):
     """
     Save the trained SVM model to a joblib file.
@@ -156,8 +206,8 @@ def save_svm_model(model: GridSearchCV, path: str = ENCODED_DATA_DIR / "svm_mode
     # Start logging
     logger.info(f"Saving SVM model to {path}")
 
-    # Save the model using joblib
-    dump(model, path)
+    # Save the model using joblib; readers of the directory never see a half-written file
+    dump_atomic(model, path)
     logger.info(f"SVM model saved to {path}")
 
 def load_svm_model(path: str = ENCODED_DATA_DIR / "svm_model.joblib") -> GridSearchCV:
@@ -209,8 +259,8 @@ def save_encoder(path: str, vectorizer):
     # Start logging
     logger.info(f"Saving encoder to {path}")
 
-    # Save the vectorizer using joblib
-    dump(vectorizer, path)
+    # Save the vectorizer using joblib; readers of the directory never see a half-written file
+    dump_atomic(vectorizer, path)
     logger.info(f"Encoder saved to {path}")
 
 def load_encoder(path: str) -> TfidfVectorizer:
@@ -228,4 +278,84 @@ def load_encoder(path: str) -> TfidfVectorizer:
     vectorizer = load(path)
     logger.info("Encoder loaded successfully")
 
-    return vectorizer
\ No newline at end of file
+    return vectorizer
+
+def find_model_artifacts(path: str = MODEL_DIR) -> tuple[Path, Path]:
+    """
+    Find the most recently saved matching vectorizer and SVM model in a model directory.
+    Artifacts are paired by the name shared by 'vectorizer__<name>.joblib' and 'svm__<name>.joblib'.
+    If the directory has a manifest, the artifacts it names are used instead.
+    Args:
+        path (str or Path): The directory containing the saved artifacts.
+    Returns:
+        tuple[Path, Path]: The paths of the vectorizer and the SVM model.
+    """
+    path = Path(path)
+    manifest = read_model_manifest(path)
+    if manifest is not None:
+        vectorizer_path, model_path = path / manifest["vectorizer"], path / manifest["model"]
+        logger.info(f"Manifest names model artifacts {vectorizer_path.name} and {model_path.name}")
+        return vectorizer_path, model_path
+
+    pairs = []
+    for vectorizer_path in path.glob("vectorizer__*.joblib"):
+        model_path = path / vectorizer_path.name.replace("vectorizer__", "svm__", 1)
+        if model_path.exists():
+            pairs.append((max(vectorizer_path.stat().st_mtime, model_path.stat().st_mtime), vectorizer_path, model_path))
+
+    if not pairs:
+        raise FileNotFoundError(f"No matching vectorizer and SVM model found in {path}")
+
+    _, vectorizer_path, model_path = max(pairs)
+    logger.info(f"Found model artifacts {vectorizer_path.name} and {model_path.name}")
+
+    return vectorizer_path, model_path
+
+def model_version(model_path: str | Path) -> str:
+    """
+    Unique version of a newly saved model.
+    Args:
+        model_path (str or Path): The saved SVM model.
+    Returns:
+        str: The model file name and the UTC save time, e.g. 'svm__<name>@20240101T120000123456Z'.
+    """
+    return f"{Path(model_path).stem}@{datetime.now(timezone.utc).strftime('%Y%m%dT%H%M%S%fZ')}"
+
+def write_model_manifest(directory: str | Path, vectorizer_path: str | Path, model_path: str | Path,
+                         version: str | None = None) -> Path:
+    """
+    Atomically point the manifest of a model directory at a vectorizer and SVM model.
+    Write it after the artifacts are saved, so readers never see a half-written pair.
+    Args:
+        directory (str or Path): The model directory.
+        vectorizer_path (str or Path): The saved vectorizer inside the directory.
+        model_path (str or Path): The saved SVM model inside the directory.
+        version (str, optional): Unique identifier of the pair; model_version(model_path) by default.
+    Returns:
+        Path: The manifest file.
+    """
+    directory = Path(directory)
+    path = directory / MODEL_MANIFEST
+    tmp_path = path.with_name(path.name + ".tmp")
+    tmp_path.write_text(json.dumps({
+        "version": version or model_version(model_path),
+        "vectorizer": Path(vectorizer_path).name,
+        "model": Path(model_path).name,
+        "created": time.time(),
+    }), encoding="utf-8")
+    os.replace(tmp_path, path)
+    logger.info(f"Model manifest {path} points to {Path(model_path).name}")
+    return path
+
+def read_model_manifest(directory: str | Path) -> dict | None:
+    """
+    Read the manifest of a model directory.
+    Args:
+        directory (str or Path): The model directory.
+    Returns:
+        dict or None: 'version', 'vectorizer', 'model' and 'created', or None without a manifest.
+    """
+    path = Path(directory) / MODEL_MANIFEST
+    if not path.exists():
+        return None
+    return json.loads(path.read_text(encoding="utf-8"))
@@ -0,0 +1,275 @@
+"""Deduplication stage for raw review datasets.
+
+Fingerprints normalized reviews to find exact and whitespace- or markup-variant
+duplicates within a split and across the train/test boundary, optionally flags
+near-duplicates with MinHash/LSH, and drops or reports them before preprocessing.
+"""
+
+# ─── Standard Library Imports ────────────────────────────────────────────────────
+import csv
+import re
+import zlib
+from hashlib import blake2b
+from pathlib import Path
+
+# ─── Third-Party Imports ─────────────────────────────────────────────────────────
+import numpy as np
+from sklearn.utils import Bunch
+
+# ─── Project Imports ─────────────────────────────────────────────────────────────
+from src.config import logging_config
+
+# ─── Logging Setup ───────────────────────────────────────────────────────────────
+logger = logging_config.configure_logging()
+
+# ─── Normalization Patterns ──────────────────────────────────────────────────────
+_HTML_TAG = re.compile(r"<[^>]+>")
+_NON_ALNUM = re.compile(r"[^a-z0-9]+")
+
+# Mersenne prime used for the MinHash permutations
+_MERSENNE_PRIME = np.uint64((1 << 61) - 1)
+
+
+def normalize_review(text: str) -> str:
+    """
+    Normalize a review so that whitespace, casing, markup and punctuation variants collide.
+    Args:
+        text (str): Raw review text.
+    Returns:
+        str: Lowercased text without HTML tags and with every non-alphanumeric run
+            collapsed to a single space.
+    """
+    text = _HTML_TAG.sub(" ", text.lower())
+    return _NON_ALNUM.sub(" ", text).strip()
+
+
+def fingerprint_reviews(texts: list[str], chunk_size: int = 10000) -> np.ndarray:
+    """
+    Compute a 64-bit fingerprint of every normalized review.
+    The texts are processed in chunks so only one chunk of normalized strings is held
+    in memory at a time; the result costs 8 bytes per review.
+    Args:
+        texts (list[str]): Raw review texts.
+        chunk_size (int): Number of reviews normalized and hashed per batch.
+    Returns:
+        np.ndarray: uint64 array with one fingerprint per review.
+    """
+    fingerprints = np.empty(len(texts), dtype=np.uint64)
+    for start in range(0, len(texts), chunk_size):
+        chunk = texts[start:start + chunk_size]
+        digests = b"".join(
+            blake2b(normalize_review(t).encode("utf-8"), digest_size=8).digest() for t in chunk
+        )
+        fingerprints[start:start + len(chunk)] = np.frombuffer(digests, dtype=np.uint64)
+    return fingerprints
+
+
+def minhash_signatures(texts: list[str], num_perm: int = 64, shingle_size: int = 3,
+                       chunk_size: int = 10000, seed: int = 42) -> np.ndarray:
+    """
+    Compute MinHash signatures over word shingles of the normalized reviews.
+    Args:
+        texts (list[str]): Raw review texts.
+        num_perm (int): Number of hash permutations (signature length).
+        shingle_size (int): Number of consecutive words per shingle.
+        chunk_size (int): Number of reviews processed per batch.
+        seed (int): Seed for the permutation coefficients.
+    Returns:
+        np.ndarray: uint32 array of shape (len(texts), num_perm).
+    """
+    rng = np.random.default_rng(seed)
+    # Keep a < 2**31 and shingle hashes < 2**32 so a * h + b cannot overflow uint64
+    a = rng.integers(1, 1 << 31, size=num_perm, dtype=np.uint64)
+    b = rng.integers(0, 1 << 31, size=num_perm, dtype=np.uint64)
+
+    signatures = np.empty((len(texts), num_perm), dtype=np.uint32)
+    for start in range(0, len(texts), chunk_size):
+        for offset, text in enumerate(texts[start:start + chunk_size]):
+            words = normalize_review(text).split()
+            n_shingles = max(len(words) - shingle_size + 1, 1)
+            shingles = np.fromiter(
+                (zlib.crc32(" ".join(words[i:i + shingle_size]).encode("utf-8")) for i in range(n_shingles)),
+                dtype=np.uint64, count=n_shingles,
+            )
+            hashed = (np.outer(shingles, a) + b) % _MERSENNE_PRIME
+            signatures[start + offset] = (hashed.min(axis=0) & np.uint64(0xFFFFFFFF)).astype(np.uint32)
+    return signatures
+
+
+def find_near_duplicates(signatures: np.ndarray, bands: int = 16, threshold: float = 0.8) -> np.ndarray:
+    """
+    Find near-duplicate pairs with LSH banding over MinHash signatures.
+    Candidate pairs are rows whose signatures agree on a full band; they are found by
+    sorting the band hashes, so memory stays linear in the number of rows. Candidates
+    are kept when their estimated Jaccard similarity reaches the threshold.
+    Args:
+        signatures (np.ndarray): MinHash signatures of shape (n_rows, num_perm).
+        bands (int): Number of LSH bands; num_perm must be divisible by it.
+        threshold (float): Minimum estimated Jaccard similarity of a near-duplicate pair.
+    Returns:
+        np.ndarray: int64 array of shape (n_pairs, 2) with i < j for every pair.
+    """
+    n_rows, num_perm = signatures.shape
+    if num_perm % bands != 0:
+        raise ValueError(f"num_perm={num_perm} must be divisible by bands={bands}")
+    if n_rows < 2:
+        return np.empty((0, 2), dtype=np.int64)
+    rows_per_band = num_perm // bands
+
+    pairs = []
+    for band in range(bands):
+        band_slice = np.ascontiguousarray(signatures[:, band * rows_per_band:(band + 1) * rows_per_band])
+        band_hashes = np.frombuffer(
+            b"".join(blake2b(row.tobytes(), digest_size=8).digest() for row in band_slice),
+            dtype=np.uint64,
+        )
+
+        # Rows with equal band hashes are adjacent after sorting; pair each with the first of its run
+        order = np.argsort(band_hashes, kind="stable")
+        sorted_hashes = band_hashes[order]
+        run_starts = np.r_[True, sorted_hashes[1:] != sorted_hashes[:-1]]
+        run_first = order[np.maximum.accumulate(np.where(run_starts, np.arange(n_rows), 0))]
+        members = ~run_starts
+        pairs.append(np.column_stack([run_first[members], order[members]]))
+
+    candidates = np.concatenate(pairs).astype(np.int64)
+    candidates.sort(axis=1)
+    candidates = np.unique(candidates, axis=0)
+
+    # Verify candidates with the estimated Jaccard similarity
+    similarity = (signatures[candidates[:, 0]] == signatures[candidates[:, 1]]).mean(axis=1)
+    return candidates[similarity >= threshold]
+
+
+def _subset_bunch(dataset: Bunch, keep: np.ndarray) -> Bunch:
+    """Return a copy of a load_files Bunch restricted to the rows in the boolean mask keep."""
+    subset = Bunch(**dataset)
+    subset.data = [text for text, k in zip(dataset.data, keep) if k]
+    subset.target = np.asarray(dataset.target)[keep]
+    if "filenames" in dataset:
+        subset.filenames = np.asarray(dataset.filenames)[keep]
+    return subset
+
+
+def _report_row(split: str, index: int, dataset: Bunch, reason: str, duplicate_of: str) -> dict:
+    """Build one row of the deduplication report."""
+    filenames = dataset.get("filenames")
+    return {
+        "split": split,
+        "index": index,
+        "filename": str(filenames[index]) if filenames is not None else "",
+        "label": int(np.asarray(dataset.target)[index]),
+        "reason": reason,
+        "duplicate_of": duplicate_of,
+    }
+
+
+def write_dedup_report(rows: list[dict], path: str | Path):
+    """
+    Write the deduplication report as a CSV file.
+    Args:
+        rows (list[dict]): Report rows as returned by deduplicate_splits.
+        path (str or Path): Destination of the CSV file.
+    Returns:
+        None
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=["split", "index", "filename", "label", "reason", "duplicate_of"])
+        writer.writeheader()
+        writer.writerows(rows)
+    logger.info("Deduplication report with %d rows written to %s", len(rows), path)
+
+
+def deduplicate_splits(train_set: Bunch, test_set: Bunch,
+                       mode: str = "drop",
+                       near_duplicates: bool = False,
+                       num_perm: int = 64,
+                       bands: int = 16,
+                       threshold: float = 0.8,
+                       chunk_size: int = 10000,
+                       report_path: str | Path | None = None) -> tuple[Bunch, Bunch, list[dict]]:
+    """
+    Remove duplicate reviews within each split and test reviews that also occur in train.
+    The first occurrence of a review within a split is kept. Test reviews duplicating
+    a train review are removed from the test split so train and test stay disjoint.
+    Args:
+        train_set (Bunch): Raw training dataset as returned by load_texts_from_folder.
+        test_set (Bunch): Raw test dataset as returned by load_texts_from_folder.
+        mode (str): 'drop' to remove duplicates, 'report' to only report them.
+        near_duplicates (bool): If True, also detect near-duplicates with MinHash/LSH.
+        num_perm (int): MinHash signature length.
+        bands (int): Number of LSH bands.
+        threshold (float): Minimum estimated Jaccard similarity of near-duplicates.
+        chunk_size (int): Number of reviews hashed per batch.
+        report_path (str or Path, optional): If given, the report is written there as CSV.
+    Returns:
+        tuple[Bunch, Bunch, list[dict]]: The deduplicated train and test sets and the
+            report rows describing every duplicate found.
+    """
+    if mode not in ("drop", "report"):
+        raise ValueError(f"Unknown deduplication mode: {mode}")
+    logger.info("Starting deduplication (mode=%s, near_duplicates=%s)", mode, near_duplicates)
+
+    splits = {"train": train_set, "test": test_set}
+    keep = {name: np.ones(len(ds.data), dtype=bool) for name, ds in splits.items()}
+    fingerprints = {name: fingerprint_reviews(ds.data, chunk_size) for name, ds in splits.items()}
+    report = []
+
+    # ─── Exact duplicates within each split ─────────────────────────────────────
+    for name, fps in fingerprints.items():
+        _, first_idx, inverse = np.unique(fps, return_index=True, return_inverse=True)
+        first_of_row = first_idx[inverse]
+        duplicates = np.flatnonzero(first_of_row != np.arange(len(fps)))
+        keep[name][duplicates] = False
+        report.extend(
+            _report_row(name, int(i), splits[name], "exact_duplicate", f"{name}:{first_of_row[i]}")
+            for i in duplicates
+        )
+
+    # ─── Exact overlap between train and test ───────────────────────────────────
+    train_fps = fingerprints["train"]
+    order = np.argsort(train_fps, kind="stable")
+    sorted_train = train_fps[order]
+    positions = np.searchsorted(sorted_train, fingerprints["test"])
+    positions = np.minimum(positions, max(len(sorted_train) - 1, 0))
+    overlap = (
+        np.flatnonzero(sorted_train[positions] == fingerprints["test"]) if len(sorted_train) else np.empty(0, dtype=np.int64)
+    )
+    overlap = overlap[keep["test"][overlap]]
+    keep["test"][overlap] = False
+    report.extend(
+        _report_row("test", int(i), test_set, "train_test_overlap", f"train:{order[positions[i]]}")
+        for i in overlap
+    )
+
+    # ─── Near duplicates over the remaining rows ────────────────────────────────
+    if near_duplicates:
+        # Train rows come first, so the later member of every pair is dropped and
+        # train/test pairs always drop the test review
+        rows = [("train", int(i)) for i in np.flatnonzero(keep["train"])]
+        rows += [("test", int(i)) for i in np.flatnonzero(keep["test"])]
+        texts = [splits[name].data[i] for name, i in rows]
+        signatures = minhash_signatures(texts, num_perm=num_perm, chunk_size=chunk_size)
+        pairs = find_near_duplicates(signatures, bands=bands, threshold=threshold)
+        for first, second in pairs:
+            first_split, first_idx = rows[first]
+            second_split, second_idx = rows[second]
+            if not keep[first_split][first_idx] or not keep[second_split][second_idx]:
+                continue
+            keep[second_split][second_idx] = False
+            report.append(_report_row(
+                second_split, second_idx, splits[second_split], "near_duplicate", f"{first_split}:{first_idx}"
+            ))
+
+    for name in splits:
+        logger.info("Found %d duplicate reviews in %s split", int((~keep[name]).sum()), name)
+
+    if report_path is not None:
+        write_dedup_report(report, report_path)
+
+    if mode == "report":
+        return train_set, test_set, report
+
+    return _subset_bunch(train_set, keep["train"]), _subset_bunch(test_set, keep["test"]), report
@@ -1,2 +1,2 @@
-from . import clean_text, filters, lemmatization, preprocessing_pipeline
-__all__ = ["clean_text", "filters", "lemmatization", "preprocessing_pipeline"]
\ No newline at end of file
+from . import clean_text, filters, lemmatization, memo_lemmatizer, preprocessing_pipeline
+__all__ = ["clean_text", "filters", "lemmatization", "memo_lemmatizer", "preprocessing_pipeline"]
\ No newline at end of file
@@ -1,5 +1,8 @@
 """Lemmatization Module. This module provides functionality to lemmatize text using spaCy."""
 
+# ─── Standard Library Imports ────────────────────────────────────────────────────────────────
+import re
+
 # ─── Third-Party Imports ─────────────────────────────────────────────────────────────────────
 import spacy
 
@@ -22,6 +25,9 @@ else:
 # Load the spaCy model
 nlp = spacy.load("en_core_web_sm")
 
+# Default token pattern of TfidfVectorizer
+TOKEN_PATTERN = re.compile(r"(?u)\b\w\w+\b")
+
 def lemmatize_text(text):
     """
     Lemmatize the input text using spaCy.
@@ -40,3 +46,42 @@ def lemmatize_text(text):
 
     logger.debug(f"Lemmatized text: {lemmatized_text}")
     return lemmatized_text
+
+def normalize_lemmas(lemmas) -> list[str]:
+    """
+    Turn lemmas into the tokens TfidfVectorizer would extract from their space-joined text.
+
+    Args:
+        lemmas (iterable[str]): Lemmas in document order.
+
+    Returns:
+        list[str]: Lowercased tokens matching the vectorizer's default token pattern.
+    """
+    tokens = []
+    for lemma in lemmas:
+        lemma = lemma.lower()
+        # Most lemmas are a single word and match the pattern as a whole
+        if len(lemma) > 1 and lemma.isalnum():
+            tokens.append(lemma)
+        else:
+            tokens.extend(TOKEN_PATTERN.findall(lemma))
+    return tokens
+
+def lemmatize_tokens(text):
+    """
+    Lemmatize the input text using spaCy and return vectorizer-ready tokens.
+
+    Args:
+        text (str): Input text to be lemmatized.
+
+    Returns:
+        list[str]: Lowercased lemma tokens, as TfidfVectorizer would split the lemmatized text.
+    """
+    logger.debug(f"Lemmatizing text to tokens: {text}")
+
+    # Process the text with spaCy
+    doc = nlp(text)
+    tokens = normalize_lemmas(token.lemma_ for token in doc)
+
+    logger.debug(f"Lemmatized tokens: {tokens}")
+    return tokens
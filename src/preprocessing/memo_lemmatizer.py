@@ -0,0 +1,227 @@
+"""Memoized lemmatizer for latency-sensitive online preprocessing.
+
+Review vocabulary is highly repetitive, so most tokens get the same lemma every time
+they occur. This lemmatizer only runs spaCy's tokenizer on a review and looks every
+token up in a bounded token → lemma memo. The tagger, attribute ruler and lemmatizer
+run only on windows around tokens that are not cached yet or whose lemma depends on
+context (e.g. "saw", "left", "being"), and their results refine the memo.
+
+A token is treated as context dependent once it was observed in context with different
+lemmas, and a lemma is only served from the memo after `confirm` agreeing observations.
+(Checking the rule lemmatizer across word classes is no alternative: it disagrees for
+most inflected words, e.g. "films" as NOUN and ADJ.)
+
+The window spans WINDOW tokens on each side of a missed token, the receptive field of
+the CNN tok2vec in the small English pipeline, so a missed token sees the same context
+as in a full pass. Parser and NER never run; they do not affect lemmas.
+"""
+
+# ─── Standard Library Imports ────────────────────────────────────────────────────
+from collections import Counter, OrderedDict
+
+# ─── Third-Party Imports ─────────────────────────────────────────────────────────
+import spacy
+
+# ─── Project Imports ─────────────────────────────────────────────────────────────
+from . import lemmatization
+from src.config import logging_config
+
+# ─── Logging Setup ───────────────────────────────────────────────────────────────
+logger = logging_config.configure_logging()
+
+# Tokens of context on each side of a missed token
+WINDOW = 4
+
+# Pipeline components that determine lemmas
+LEMMA_PIPES = ("tok2vec", "tagger", "morphologizer", "attribute_ruler", "lemmatizer")
+
+
+def load_lookup_table(lang: str = "en") -> dict:
+    """
+    Load spaCy's context-free token → lemma lookup table.
+    Args:
+        lang (str): Language code of the table.
+    Returns:
+        dict: The lookup table; empty if spacy-lookups-data is not installed.
+    """
+    try:
+        lookups = spacy.lookups.load_lookups(lang, ["lemma_lookup"])
+    except ValueError:
+        logger.warning("spacy-lookups-data is not installed; the memo starts empty.")
+        return {}
+    return dict(lookups.get_table("lemma_lookup").items())
+
+
+class MemoLemmatizer:
+    """
+    Lemmatizer that serves cached lemmas and falls back to spaCy for uncached or ambiguous tokens.
+
+    Attributes:
+    - max_size: Largest number of cached tokens; least recently used entries are evicted.
+    - confirm: Number of agreeing in-context observations before a lemma is served.
+    - ambiguous: Tokens with context-dependent lemmas; always lemmatized in context.
+    - token_hits, token_misses: Tokens served from the memo and sent to spaCy.
+    - reviews, reviews_from_memo: Lemmatized reviews and those that needed no model call.
+    """
+
+    def __init__(self, nlp=None, max_size: int = 100_000, window: int = WINDOW, confirm: int = 2,
+                 seed: dict | None = None):
+        self.nlp = nlp or lemmatization.nlp
+        self.max_size = max_size
+        self.window = window
+        self.confirm = confirm
+        self.ambiguous = set()
+        self._memo = OrderedDict()
+        self._pipes = [proc for name, proc in self.nlp.pipeline if name in LEMMA_PIPES]
+        self.token_hits = self.token_misses = 0
+        self.reviews = self.reviews_from_memo = 0
+
+        # Optional context-free seed, e.g. from load_lookup_table(); served without confirmation
+        for token, lemma in list((seed or {}).items())[:max_size]:
+            self._memo[token] = [lemma, confirm]
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of tokens served from the memo."""
+        total = self.token_hits + self.token_misses
+        return self.token_hits / total if total else 0.0
+
+    def stats(self) -> dict:
+        """
+        Summarize the cache behaviour.
+        Returns:
+            dict: Hit counters, hit rate, memo size and number of ambiguous tokens.
+        """
+        return {
+            "token_hits": self.token_hits,
+            "token_misses": self.token_misses,
+            "hit_rate": self.hit_rate,
+            "reviews": self.reviews,
+            "reviews_from_memo": self.reviews_from_memo,
+            "memo_size": len(self._memo),
+            "ambiguous_tokens": len(self.ambiguous),
+        }
+
+    def _learn(self, token: str, lemma: str):
+        """Record the in-context lemma of a token; conflicting lemmas mark it ambiguous."""
+        if token in self.ambiguous:
+            return
+        entry = self._memo.get(token)
+        if entry is None:
+            self._memo[token] = entry = [lemma, 0]
+        elif entry[0] != lemma:
+            self.ambiguous.add(token)
+            del self._memo[token]
+            return
+
+        entry[1] += 1
+        self._memo.move_to_end(token)
+        if len(self._memo) > self.max_size:
+            self._memo.popitem(last=False)
+
+    def _windows(self, missing: list[int], n_tokens: int) -> list[tuple[int, int]]:
+        """Merge the context windows around missed positions into disjoint spans."""
+        spans = []
+        for i in missing:
+            start, end = max(0, i - self.window), min(n_tokens, i + self.window + 1)
+            if spans and start <= spans[-1][1]:
+                spans[-1] = (spans[-1][0], end)
+            else:
+                spans.append((start, end))
+        return spans
+
+    def lemmas(self, text: str) -> list[str]:
+        """
+        Lemmatize a text token by token.
+        Args:
+            text (str): Input text.
+        Returns:
+            list[str]: The lemma of every spaCy token.
+        """
+        doc = self.nlp.make_doc(text)
+        words = [token.text for token in doc]
+        lemmas = [None] * len(words)
+
+        # Serve cached, unambiguous tokens from the memo
+        missing = []
+        for i, word in enumerate(words):
+            entry = self._memo.get(word)
+            if entry is None or entry[1] < self.confirm:
+                missing.append(i)
+            else:
+                lemmas[i] = entry[0]
+        self.token_hits += len(words) - len(missing)
+        self.token_misses += len(missing)
+        self.reviews += 1
+        if not missing:
+            self.reviews_from_memo += 1
+            return lemmas
+
+        # Lemmatize the remaining tokens in context
+        missed = set(missing)
+        for start, end in self._windows(missing, len(words)):
+            span = doc[start:end].as_doc()
+            for proc in self._pipes:
+                span = proc(span)
+            for offset, token in enumerate(span):
+                i = start + offset
+                full_context = (i - start >= self.window or start == 0) and (end - i > self.window or end == len(words))
+                if i in missed:
+                    lemmas[i] = token.lemma_
+                    self._learn(words[i], token.lemma_)
+                elif full_context:
+                    # Cached tokens seen in full context also check the memo for ambiguity
+                    self._learn(words[i], token.lemma_)
+        return lemmas
+
+    def lemmatize_text(self, text: str) -> str:
+        """
+        Lemmatize a text in the format of lemmatization.lemmatize_text.
+        Args:
+            text (str): Input text.
+        Returns:
+            str: Lemmatized text.
+        """
+        return " ".join(self.lemmas(text))
+
+    def lemmatize_tokens(self, text: str) -> list[str]:
+        """
+        Lemmatize a text in the format of lemmatization.lemmatize_tokens.
+        Args:
+            text (str): Input text.
+        Returns:
+            list[str]: Lowercased lemma tokens.
+        """
+        return lemmatization.normalize_lemmas(self.lemmas(text))
+
+
+def divergence_report(texts: list[str], lemmatizer: MemoLemmatizer, top: int = 20) -> dict:
+    """
+    Compare the memoized lemmatizer against lemmatization.lemmatize_text.
+    Args:
+        texts (list[str]): Texts to lemmatize with both.
+        lemmatizer (MemoLemmatizer): The memoized lemmatizer.
+        top (int): Number of most frequent divergences to list.
+    Returns:
+        dict: Diverging review and token rates and the most frequent (token, memo, spaCy) triples.
+    """
+    diverging_reviews, diverging_tokens, n_tokens = 0, 0, 0
+    examples = Counter()
+    for text in texts:
+        reference = [token for token in lemmatization.nlp(text)]
+        memo = lemmatizer.lemmas(text)
+        diffs = [(token.text, lemma, token.lemma_) for token, lemma in zip(reference, memo) if token.lemma_ != lemma]
+        n_tokens += len(reference)
+        diverging_tokens += len(diffs)
+        diverging_reviews += bool(diffs)
+        examples.update(diffs)
+
+    return {
+        "reviews": len(texts),
+        "diverging_review_rate": diverging_reviews / max(len(texts), 1),
+        "diverging_token_rate": diverging_tokens / max(n_tokens, 1),
+        "top_divergences": [
+            {"token": token, "memo": memo, "spacy": spacy_lemma, "count": count}
+            for (token, memo, spacy_lemma), count in examples.most_common(top)
+        ],
+    }
@@ -22,14 +22,18 @@ logger = logging_config.configure_logging()
 
 
 # Ochestration of the preprocessing pipeline
-def preprocessing_pipeline(text: str | Bunch, name: str = "default") -> str | list[str]:
+def preprocessing_pipeline(text: str | Bunch, name: str = "default", tokens: bool = False, lemmatizer=None) -> str | list[str]:
     """
     Preprocess the input text by cleaning, filtering, and lemmatizing it.
     Args:
         text (str or list[str]): Input text or list of texts to be preprocessed.
         name (str): Name of the dataset or text source for logging purposes.
+        tokens (bool): If True, each text becomes a list of lowercased lemma tokens that the
+            vectorizer consumes directly instead of a lemmatized string.
+        lemmatizer (MemoLemmatizer, optional): Lemmatizer to use instead of the full spaCy pass,
+            e.g. the memoized one for online preprocessing.
     Returns:
-        str or list[str]: Preprocessed text or list of preprocessed texts.
+        str or list[str]: Preprocessed text or list of preprocessed texts (token lists if tokens=True).
     """
     logger.debug(f"Starting preprocessing pipeline for {name}")
 
@@ -41,7 +45,10 @@ def preprocessing_pipeline(text: str | Bunch, name: str = "default") -> str | li
         filtered_text = filters.filtering_pipeline(cleaned_text)
 
         # Step 3: Lemmatize the text
-        lemmatized_text = lemmatization.lemmatize_text(filtered_text)
+        lemmatize = lemmatizer or lemmatization
+        if tokens:
+            return lemmatize.lemmatize_tokens(filtered_text)
+        lemmatized_text = lemmatize.lemmatize_text(filtered_text)
 
         return lemmatized_text
 
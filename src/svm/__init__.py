@@ -1,2 +1,2 @@
-from . import training
-__all__ = ["training"]
\ No newline at end of file
+from . import training, inference
+__all__ = ["training", "inference"]
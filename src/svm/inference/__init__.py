@@ -0,0 +1,4 @@
+from . import batch_scorer, fused_predictor, hot_reload, prediction_cache, predictor, quantized, worker_pool
+
+__all__ = ["batch_scorer", "fused_predictor", "hot_reload", "prediction_cache", "predictor", "quantized",
+           "worker_pool"]
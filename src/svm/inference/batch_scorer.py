@@ -0,0 +1,247 @@
+"""Streaming batch scoring of JSONL review feeds.
+
+Reads reviews from JSONL files or stdin on a background thread, scores fixed-size
+batches through preprocessing, vectorization and the SVM, and streams predictions
+with decision scores as JSONL. Progress is checkpointed after every batch so large
+runs can be resumed, and memory stays bounded by the batch size and prefetch depth.
+"""
+
+# ─── Standard Library Imports ────────────────────────────────────────────────────
+import os
+import sys
+import json
+import queue
+import threading
+from pathlib import Path
+from typing import Iterable, Iterator
+
+# ─── Third-Party Imports ─────────────────────────────────────────────────────────
+import numpy as np
+
+# ─── Project Imports ─────────────────────────────────────────────────────────────
+from src.preprocessing import preprocessing_pipeline
+from src.svm.training.parallel_transform import ParallelTransformer
+from src.config import logging_config
+
+# ─── Logging Setup ───────────────────────────────────────────────────────────────
+logger = logging_config.configure_logging()
+
+TARGET_NAMES = ["neg", "pos"]
+
+# Marker put on the batch queue once the reader is exhausted
+_END_OF_INPUT = object()
+
+
+def iter_jsonl_records(sources: Iterable[str | Path], text_field: str = "text", id_field: str = "id",
+                       skip: int = 0) -> Iterator[tuple[int, object, str]]:
+    """
+    Yield reviews from JSONL files or stdin one line at a time.
+    Args:
+        sources (Iterable[str or Path]): Input files; '-' reads from stdin.
+        text_field (str): JSON field holding the review text.
+        id_field (str): JSON field holding the review id; the record number is used if missing.
+        skip (int): Number of leading records to skip, used when resuming from a checkpoint.
+    Yields:
+        tuple[int, object, str]: Record number, review id and review text. Malformed
+            lines are logged and yielded with a None text so record numbers stay stable.
+    """
+    record_no = 0
+    for source in sources:
+        stream = sys.stdin if str(source) == "-" else open(source, "r", encoding="utf-8")
+        try:
+            for line in stream:
+                if not line.strip():
+                    continue
+                record_no += 1
+                if record_no <= skip:
+                    continue
+                try:
+                    record = json.loads(line)
+                    text = record[text_field]
+                    if not isinstance(text, str):
+                        raise TypeError(f"'{text_field}' is {type(text).__name__}, not str")
+                    record_id = record.get(id_field, record_no)
+                except (json.JSONDecodeError, KeyError, TypeError, AttributeError) as e:
+                    logger.warning("Skipping malformed record %d in %s: %s", record_no, source, e)
+                    yield record_no, record_no, None
+                    continue
+                yield record_no, record_id, text
+        finally:
+            if stream is not sys.stdin:
+                stream.close()
+
+
+def _read_batches(records: Iterator, batch_size: int, batches: queue.Queue, stop: threading.Event):
+    """Group records into batches and put them on the bounded queue until the input is exhausted."""
+    try:
+        batch = []
+        for record in records:
+            batch.append(record)
+            if len(batch) == batch_size:
+                while not stop.is_set():
+                    try:
+                        batches.put(batch, timeout=0.1)
+                        break
+                    except queue.Full:
+                        continue
+                if stop.is_set():
+                    return
+                batch = []
+        if batch:
+            batches.put(batch)
+    except Exception as e:
+        batches.put(e)
+    finally:
+        batches.put(_END_OF_INPUT)
+
+
+def read_checkpoint(path: str | Path) -> dict:
+    """
+    Read a scoring checkpoint.
+    Args:
+        path (str or Path): The checkpoint file.
+    Returns:
+        dict: The checkpoint with 'records_done' and 'output_bytes', or zeros if it does not exist.
+    """
+    path = Path(path)
+    if not path.exists():
+        return {"records_done": 0, "output_bytes": 0}
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def write_checkpoint(path: str | Path, records_done: int, output_bytes: int):
+    """
+    Atomically write a scoring checkpoint.
+    Args:
+        path (str or Path): The checkpoint file.
+        records_done (int): Number of input records fully scored and written.
+        output_bytes (int): Size of the output file after those records.
+    Returns:
+        None
+    """
+    path = Path(path)
+    tmp_path = path.with_name(path.name + ".tmp")
+    tmp_path.write_text(json.dumps({"records_done": records_done, "output_bytes": output_bytes}), encoding="utf-8")
+    os.replace(tmp_path, path)
+
+
+def score_batch(texts: list[str], vectorizer, model, preprocess: bool = True,
+                lemmatizer=None) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Score one batch of raw reviews.
+    Args:
+        texts (list[str]): Raw review texts.
+        vectorizer (TfidfVectorizer or ParallelTransformer): The fitted TF-IDF vectorizer.
+        model: The fitted SVM (LinearSVC or GridSearchCV).
+        preprocess (bool): If True, apply the training preprocessing pipeline first.
+        lemmatizer (MemoLemmatizer, optional): Lemmatizer used by the preprocessing pipeline.
+    Returns:
+        tuple[np.ndarray, np.ndarray]: Predicted labels and decision scores.
+    """
+    if preprocess:
+        texts = [preprocessing_pipeline.preprocessing_pipeline(t, lemmatizer=lemmatizer) for t in texts]
+    scores = np.asarray(model.decision_function(vectorizer.transform(texts))).ravel()
+    labels = (scores > 0).astype(np.int64)
+    return labels, scores
+
+
+def score_stream(sources: Iterable[str | Path], vectorizer, model,
+                 output: str | Path | None = None,
+                 checkpoint: str | Path | None = None,
+                 batch_size: int = 512,
+                 prefetch: int = 4,
+                 preprocess: bool = True,
+                 text_field: str = "text",
+                 id_field: str = "id",
+                 lemmatizer=None,
+                 transform_n_jobs: int = 1,
+                 reloader=None) -> int:
+    """
+    Score a JSONL review feed in fixed-size batches and stream the predictions.
+    A reader thread parses the input while the current batch is being scored; the
+    bounded queue keeps at most `prefetch` batches in memory.
+    Args:
+        sources (Iterable[str or Path]): Input JSONL files; '-' reads from stdin.
+        vectorizer (TfidfVectorizer): The fitted TF-IDF vectorizer.
+        model: The fitted SVM (LinearSVC or GridSearchCV).
+        output (str or Path, optional): Output JSONL file; stdout if None.
+        checkpoint (str or Path, optional): Checkpoint file enabling resumable runs. Requires `output`.
+        batch_size (int): Number of reviews scored per batch.
+        prefetch (int): Maximum number of parsed batches waiting to be scored.
+        preprocess (bool): If True, apply the training preprocessing pipeline to every review.
+        text_field (str): JSON field holding the review text.
+        id_field (str): JSON field holding the review id.
+        lemmatizer (MemoLemmatizer, optional): Lemmatizer used by the preprocessing pipeline.
+        transform_n_jobs (int): Worker processes vectorizing every batch in chunks; the pool
+            and the vectorizer shipped to it are reused for the whole stream.
+        reloader (HotReloader, optional): Reloader loading (vectorizer, model) pairs; every batch
+            is scored with its active pair, which replaces `vectorizer` and `model` after a swap.
+    Returns:
+        int: Total number of records processed, including records from resumed runs.
+    """
+    if checkpoint is not None and output is None:
+        raise ValueError("A checkpoint requires an output file")
+
+    # Resume: drop any output written after the last checkpoint and skip the records it covers
+    state = read_checkpoint(checkpoint) if checkpoint is not None else {"records_done": 0, "output_bytes": 0}
+    if output is not None:
+        out = open(output, "a+b")
+        out.truncate(state["output_bytes"])
+        out.seek(0, os.SEEK_END)
+    else:
+        out = sys.stdout.buffer
+    records_done = state["records_done"]
+    if records_done:
+        logger.info("Resuming from checkpoint after %d records", records_done)
+
+    records = iter_jsonl_records(sources, text_field=text_field, id_field=id_field, skip=records_done)
+    batches = queue.Queue(maxsize=prefetch)
+    stop = threading.Event()
+    reader = threading.Thread(target=_read_batches, args=(records, batch_size, batches, stop), daemon=True)
+    reader.start()
+    encoder = ParallelTransformer(vectorizer, n_jobs=transform_n_jobs)
+    active = reloader.active if reloader is not None else None
+
+    try:
+        while True:
+            batch = batches.get()
+            if batch is _END_OF_INPUT:
+                break
+            if isinstance(batch, Exception):
+                raise batch
+
+            # Pick up a reloaded model between batches
+            if reloader is not None and reloader.active is not active:
+                active = reloader.active
+                vectorizer, model = active.artifact
+                encoder.close()
+                encoder = ParallelTransformer(vectorizer, n_jobs=transform_n_jobs)
+                logger.info("Scoring with model %s from record %d", active.version, batch[0][0])
+
+            valid = [i for i, (_, _, text) in enumerate(batch) if text is not None]
+            labels, scores = score_batch([batch[i][2] for i in valid], encoder, model, preprocess, lemmatizer) if valid else ([], [])
+            results = dict(zip(valid, zip(labels, scores)))
+
+            lines = []
+            for i, (record_no, record_id, _) in enumerate(batch):
+                if i in results:
+                    label, score = results[i]
+                    row = {"id": record_id, "prediction": int(label), "label": TARGET_NAMES[label], "score": float(score)}
+                else:
+                    row = {"id": record_id, "error": "malformed record"}
+                lines.append(json.dumps(row))
+            out.write(("\n".join(lines) + "\n").encode("utf-8"))
+            out.flush()
+
+            records_done = batch[-1][0]
+            if checkpoint is not None:
+                write_checkpoint(checkpoint, records_done, out.tell())
+            logger.debug("Scored batch ending at record %d", records_done)
+    finally:
+        stop.set()
+        encoder.close()
+        if out is not sys.stdout.buffer:
+            out.close()
+
+    logger.info("Scored %d records", records_done)
+    return records_done
@@ -0,0 +1,350 @@
+"""Single serializable predictor for the full raw-text → decision chain.
+
+Bundles the training preprocessing (regex cleaning, contraction and slang filters, spaCy
+lemmas), the fitted TF-IDF vectorizer and the linear SVM into one object that is saved
+and loaded with one call and scores batches of raw reviews. The time spent in every
+stage is accumulated, so online latency can be attributed to cleaning, filtering,
+lemmatization, vectorization or scoring.
+
+Stages can be swapped for faster implementations:
+- lemmatize: 'spacy' runs the training lemmatizer per review, 'spacy_batch' streams the
+  batch through nlp.pipe without parser and NER (same lemmas), 'memo' serves repeated
+  tokens from a MemoLemmatizer (approximate, see memo_lemmatizer), and 'none' skips
+  lemmatization.
+- vectorize: 'sklearn' uses vectorizer.transform and the model's decision_function,
+  'predictor' the NumPy encoder and weight vector of Predictor (same scores).
+
+Lemmas are handed to the vectorizer as lowercased token lists, as with the preprocessing
+token handoff, so no stage re-joins, re-lowercases or re-tokenizes the reviews.
+
+With a PredictionCache, reviews whose cleaned text was scored before by the same weights
+and stages take their score from the cache right after the clean stage, and only the
+misses are filtered, lemmatized, vectorized and scored.
+"""
+
+# ─── Standard Library Imports ────────────────────────────────────────────────────
+import copy
+import time
+import hashlib
+import threading
+from pathlib import Path
+
+# ─── Third-Party Imports ─────────────────────────────────────────────────────────
+import joblib
+import numpy as np
+from sklearn.feature_extraction.text import TfidfVectorizer
+
+# ─── Project Imports ─────────────────────────────────────────────────────────────
+from src.data import data_loader
+from src.preprocessing import clean_text, filters, lemmatization, memo_lemmatizer
+from src.svm.inference.predictor import Predictor
+from src.svm.inference.prediction_cache import PredictionCache, text_key
+from src.config import logging_config
+from src.config.paths import MODEL_DIR
+
+# ─── Logging Setup ───────────────────────────────────────────────────────────────
+logger = logging_config.configure_logging()
+
+# Stages in execution order
+STAGES = ("clean", "filter", "lemmatize", "vectorize", "score")
+
+# Implementations of every swappable stage; the first one reproduces training
+STAGE_OPTIONS = {
+    "clean": ("regex", "none"),
+    "filter": ("default", "none"),
+    "lemmatize": ("spacy", "spacy_batch", "memo", "none"),
+    "vectorize": ("sklearn", "predictor"),
+}
+
+# spaCy components that do not affect lemmas
+_NON_LEMMA_PIPES = ("parser", "ner")
+
+
+def _identity(doc):
+    """Pass token lists through the vectorizer's preprocessor and tokenizer unchanged."""
+    return doc
+
+
+def token_vectorizer(vectorizer: TfidfVectorizer) -> TfidfVectorizer:
+    """
+    Copy of a fitted vectorizer that encodes lowercased token lists instead of texts.
+    Args:
+        vectorizer (TfidfVectorizer): The fitted vectorizer; it is not modified.
+    Returns:
+        TfidfVectorizer: A shallow copy sharing the vocabulary and idf; stop words and
+            n-grams are still applied by its analyzer.
+    """
+    tokens = copy.copy(vectorizer)
+    tokens.set_params(lowercase=False, preprocessor=_identity, tokenizer=_identity, token_pattern=None)
+    # Stop words match tokens as they are; skip sklearn's check of them against the identity tokenizer
+    tokens._stop_words_id = id(tokens.stop_words)
+    return tokens
+
+
+class FusedPredictor:
+    """
+    Raw-text sentiment predictor covering preprocessing, vectorization and the SVM.
+
+    Attributes:
+    - vectorizer: The fitted TF-IDF vectorizer from training.
+    - model: The fitted SVM (LinearSVC or GridSearchCV).
+    - stages: Implementation chosen for every swappable stage.
+    - version: Free-form identifier of the artifacts.
+    - classes: Class labels of the model, negative class first.
+    - cache: Optional PredictionCache of decision scores; not saved with the predictor.
+    """
+
+    def __init__(self, vectorizer: TfidfVectorizer, model, stages: dict | None = None, version: str = "",
+                 cache: PredictionCache | None = None):
+        stages = {**{name: options[0] for name, options in STAGE_OPTIONS.items()}, **(stages or {})}
+        for name, option in stages.items():
+            if option not in STAGE_OPTIONS.get(name, ()):
+                raise ValueError(f"Unknown {name} stage '{option}'. Choose one of {STAGE_OPTIONS.get(name, ())}.")
+        self.vectorizer = vectorizer
+        self.model = model
+        self.stages = stages
+        self.version = version
+        self.cache = cache
+
+        estimator = getattr(model, "best_estimator_", model)
+        self.classes = np.asarray(estimator.classes_)
+        self._coef = np.asarray(estimator.coef_, dtype=np.float64).ravel()
+        self._intercept = float(np.ravel(estimator.intercept_)[0])
+        self._weights_digest = self._digest(vectorizer)
+        self._preprocess = vectorizer.build_preprocessor()
+        self._tokenize = vectorizer.build_tokenizer()
+        self._tokens = token_vectorizer(vectorizer)
+        self._predictor = Predictor(self._tokens, model, version) if stages["vectorize"] == "predictor" else None
+        self._memo = memo_lemmatizer.MemoLemmatizer() if stages["lemmatize"] == "memo" else None
+        self._lock = threading.Lock()
+        self.reset_latency()
+
+    def __reduce__(self):
+        # Pickle the artifacts and stage choices only; stage resources are rebuilt on load
+        return type(self), (self.vectorizer, self.model, self.stages, self.version)
+
+    def _digest(self, vectorizer: TfidfVectorizer) -> str:
+        """Digest of the SVM weights and the idf, unique to the fitted artifacts whatever their file names."""
+        digest = hashlib.blake2b(digest_size=8)
+        digest.update(self._coef.tobytes())
+        digest.update(np.float64(self._intercept).tobytes())
+        if vectorizer.use_idf:
+            digest.update(np.asarray(vectorizer.idf_, dtype=np.float64).tobytes())
+        return digest.hexdigest()
+
+    @property
+    def cache_version(self) -> str:
+        """Version under which cached scores are valid: the weights and the stages that computed them."""
+        stages = ",".join(f"{name}={option}" for name, option in sorted(self.stages.items()))
+        return f"{self.version}|{self._weights_digest}|{stages}"
+
+    # ─── Construction ───────────────────────────────────────────────────────────
+    @classmethod
+    def from_files(cls, vectorizer_path: str | Path, model_path: str | Path,
+                   cache: PredictionCache | None = None, **stages) -> "FusedPredictor":
+        """
+        Build a fused predictor from the saved training artifacts.
+        Args:
+            vectorizer_path (str or Path): The joblib file of the vectorizer.
+            model_path (str or Path): The joblib file of the SVM model.
+            cache (PredictionCache, optional): Cache of decision scores.
+            **stages: Stage implementations, see STAGE_OPTIONS.
+        Returns:
+            FusedPredictor: The predictor.
+        """
+        return cls(data_loader.load_encoder(vectorizer_path), data_loader.load_svm_model(model_path),
+                   stages=stages, version=Path(model_path).stem, cache=cache)
+
+    @classmethod
+    def from_model_dir(cls, path: str | Path = MODEL_DIR, cache: PredictionCache | None = None,
+                       **stages) -> "FusedPredictor":
+        """
+        Build a fused predictor from the most recent vectorizer and model in a model directory.
+        Args:
+            path (str or Path): The model directory.
+            cache (PredictionCache, optional): Cache of decision scores.
+            **stages: Stage implementations, see STAGE_OPTIONS.
+        Returns:
+            FusedPredictor: The predictor.
+        """
+        return cls.from_files(*data_loader.find_model_artifacts(path), cache=cache, **stages)
+
+    def save(self, path: str | Path) -> Path:
+        """
+        Save the predictor as one joblib file.
+        Args:
+            path (str or Path): Destination file.
+        Returns:
+            Path: The written file.
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        data_loader.dump_atomic(self, path)
+        logger.info("Fused predictor saved to %s with stages %s", path, self.stages)
+        return path
+
+    @classmethod
+    def load(cls, path: str | Path, cache: PredictionCache | None = None, **stages) -> "FusedPredictor":
+        """
+        Load a saved fused predictor, optionally swapping stages.
+        Args:
+            path (str or Path): The joblib file written by save.
+            cache (PredictionCache, optional): Cache of decision scores.
+            **stages: Stage implementations overriding the saved ones.
+        Returns:
+            FusedPredictor: The predictor.
+        """
+        predictor = joblib.load(path)
+        if not isinstance(predictor, cls):
+            raise TypeError(f"{path} does not hold a {cls.__name__}")
+        logger.info("Fused predictor loaded from %s", path)
+        predictor.cache = cache
+        return predictor.with_stages(**stages) if stages else predictor
+
+    def with_stages(self, **stages) -> "FusedPredictor":
+        """
+        Copy of the predictor with some stages swapped.
+        Args:
+            **stages: Stage implementations, see STAGE_OPTIONS.
+        Returns:
+            FusedPredictor: The new predictor sharing the fitted artifacts and the cache.
+        """
+        return type(self)(self.vectorizer, self.model, {**self.stages, **stages}, self.version, self.cache)
+
+    # ─── Latency Accounting ─────────────────────────────────────────────────────
+    def reset_latency(self):
+        """
+        Clear the per-stage latency counters.
+        Returns:
+            None
+        """
+        with self._lock:
+            self._seconds = dict.fromkeys(STAGES, 0.0)
+            self._texts = 0
+            self._batches = 0
+
+    def latency(self) -> dict:
+        """
+        Accumulated time per stage since the last reset.
+        Returns:
+            dict: Per stage the total 'seconds' and 'ms_per_text', plus the 'texts' and 'batches' scored.
+        """
+        with self._lock:
+            per_text = 1000 / max(self._texts, 1)
+            stats = {stage: {"seconds": seconds, "ms_per_text": seconds * per_text}
+                     for stage, seconds in self._seconds.items()}
+            stats.update(texts=self._texts, batches=self._batches)
+        return stats
+
+    def _record(self, timings: dict, n_texts: int):
+        with self._lock:
+            for stage, seconds in timings.items():
+                self._seconds[stage] += seconds
+            self._texts += n_texts
+            self._batches += 1
+
+    # ─── Stages ─────────────────────────────────────────────────────────────────
+    def _lemmatize(self, texts: list[str]) -> list[list[str]]:
+        """Lowercased lemma tokens of every text with the configured lemmatizer."""
+        option = self.stages["lemmatize"]
+        if option == "spacy":
+            return [lemmatization.lemmatize_tokens(text) for text in texts]
+        if option == "spacy_batch":
+            nlp = lemmatization.nlp
+            disable = [name for name in _NON_LEMMA_PIPES if name in nlp.pipe_names]
+            return [lemmatization.normalize_lemmas(token.lemma_ for token in doc)
+                    for doc in nlp.pipe(texts, disable=disable)]
+        if option == "memo":
+            return [self._memo.lemmatize_tokens(text) for text in texts]
+        return [self._tokenize(self._preprocess(text)) for text in texts]
+
+    def transform(self, texts: list[str]):
+        """
+        Preprocess and encode raw texts.
+        Args:
+            texts (list[str]): Raw review texts.
+        Returns:
+            csr_matrix: TF-IDF matrix of shape (len(texts), n_features).
+        """
+        return self._run(list(texts), score=False)[0]
+
+    def _run(self, texts: list[str], score: bool = True) -> tuple:
+        """Run the stages on a batch and return the matrix or scores with the seconds spent per stage."""
+        timings = {}
+        start = time.perf_counter()
+
+        n_texts = len(texts)
+        if self.stages["clean"] == "regex":
+            texts = [clean_text.regex_cleaning_pipeline(text) for text in texts]
+
+        # Serve repeated cleaned texts from the cache; only the misses run the later stages
+        cache = self.cache if score else None
+        if cache is not None:
+            version = self.cache_version
+            keys = [text_key(text) for text in texts]
+            cached = cache.get_many(keys, version)
+            missed = [i for i, value in enumerate(cached) if value is None]
+            texts = [texts[i] for i in missed]
+        timings["clean"], start = time.perf_counter() - start, time.perf_counter()
+
+        if self.stages["filter"] == "default":
+            texts = [filters.filtering_pipeline(text) for text in texts]
+        timings["filter"], start = time.perf_counter() - start, time.perf_counter()
+
+        tokens = self._lemmatize(texts)
+        timings["lemmatize"], start = time.perf_counter() - start, time.perf_counter()
+
+        if cache is not None and not texts:
+            # Every text was served from the cache
+            scores = np.empty(0, dtype=np.float64)
+            timings["vectorize"], start = time.perf_counter() - start, time.perf_counter()
+        else:
+            X = self._predictor.transform(tokens) if self._predictor is not None else self._tokens.transform(tokens)
+            timings["vectorize"], start = time.perf_counter() - start, time.perf_counter()
+            if not score:
+                return X, timings
+            if self._predictor is not None:
+                scores = X @ self._coef + self._intercept
+            else:
+                scores = np.asarray(self.model.decision_function(X)).ravel()
+
+        if cache is not None:
+            cache.put_many([keys[i] for i in missed], scores, version)
+            merged = np.asarray([np.nan if value is None else value for value in cached], dtype=np.float64)
+            merged[missed] = scores
+            scores = merged
+        timings["score"] = time.perf_counter() - start
+
+        self._record(timings, n_texts)
+        return scores, timings
+
+    # ─── Prediction ─────────────────────────────────────────────────────────────
+    def decision_function(self, texts: list[str]) -> np.ndarray:
+        """
+        Compute signed distances to the separating hyperplane for raw texts.
+        Args:
+            texts (list[str]): Raw review texts.
+        Returns:
+            np.ndarray: Decision score per text; positive means the second class.
+        """
+        return self._run(list(texts))[0]
+
+    def decision_function_timed(self, texts: list[str]) -> tuple[np.ndarray, dict[str, float]]:
+        """
+        Compute decision scores and report the time every stage took for this batch.
+        Args:
+            texts (list[str]): Raw review texts.
+        Returns:
+            tuple[np.ndarray, dict[str, float]]: Decision score per text and seconds per stage.
+        """
+        return self._run(list(texts))
+
+    def predict(self, texts: list[str]) -> np.ndarray:
+        """
+        Predict class labels for raw texts.
+        Args:
+            texts (list[str]): Raw review texts.
+        Returns:
+            np.ndarray: Predicted label per text.
+        """
+        return self.classes[(self.decision_function(texts) > 0).astype(np.int64)]
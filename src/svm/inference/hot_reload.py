@@ -0,0 +1,247 @@
+"""Zero-downtime model hot-reload for long-running scorers.
+
+A HotReloader holds the active model artifacts of a model directory and polls the
+directory on a background thread. When the manifest written by the training pipeline
+(or, without a manifest, the set of vectorizer__/svm__ files) changes, the new pair is
+loaded on that thread while requests keep being served by the old one. The new artifacts
+then replace the old ones in one reference assignment. A scorer that reads `active` once
+per batch therefore scores every batch entirely with one version.
+
+Without a manifest a change must be seen on two consecutive polls before it is loaded,
+so files still being written are not picked up. The version of a load is the one named in
+the manifest (unique per training run), or the model file name with its modification time,
+so a retrain that reuses the file name is still a new version. A failed load is logged and counted, the
+old version keeps serving, and the load is retried on the next poll.
+"""
+
+# ─── Standard Library Imports ────────────────────────────────────────────────────
+import time
+import threading
+from pathlib import Path
+from dataclasses import dataclass
+from typing import Callable
+
+# ─── Third-Party Imports ─────────────────────────────────────────────────────────
+import numpy as np
+
+# ─── Project Imports ─────────────────────────────────────────────────────────────
+from src.data import data_loader
+from src.svm.inference.fused_predictor import FusedPredictor
+from src.config import logging_config
+from src.config.paths import MODEL_DIR
+
+# ─── Logging Setup ───────────────────────────────────────────────────────────────
+logger = logging_config.configure_logging()
+
+
+def artifacts_fingerprint(path: str | Path) -> tuple | None:
+    """
+    Cheap identity of the artifacts in a model directory.
+    Args:
+        path (str or Path): The model directory.
+    Returns:
+        tuple or None: The manifest's or the artifact files' names, sizes and modification
+            times; None if a file vanished while it was read.
+    """
+    path = Path(path)
+    manifest = path / data_loader.MODEL_MANIFEST
+    try:
+        if manifest.exists():
+            stat = manifest.stat()
+            return ("manifest", stat.st_mtime_ns, stat.st_size)
+        files = sorted([*path.glob("vectorizer__*.joblib"), *path.glob("svm__*.joblib")])
+        return tuple((file.name, file.stat().st_mtime_ns, file.stat().st_size) for file in files)
+    except FileNotFoundError:
+        return None
+
+
+def load_artifacts(vectorizer_path: str | Path, model_path: str | Path) -> tuple:
+    """
+    Load a vectorizer and SVM model pair.
+    Args:
+        vectorizer_path (str or Path): The joblib file of the vectorizer.
+        model_path (str or Path): The joblib file of the SVM model.
+    Returns:
+        tuple: The fitted vectorizer and model.
+    """
+    return data_loader.load_encoder(vectorizer_path), data_loader.load_svm_model(model_path)
+
+
+@dataclass(frozen=True)
+class LoadedModel:
+    """
+    Artifacts of one model version as loaded by a HotReloader.
+
+    Attributes:
+    - version: Unique identifier of the artifacts, from the manifest or the model file.
+    - artifact: What the loader returned, e.g. a FusedPredictor.
+    - loaded_at: Unix time the load finished.
+    - load_seconds: Time the load took.
+    """
+    version: str
+    artifact: object
+    loaded_at: float
+    load_seconds: float
+
+
+class HotReloader:
+    """
+    Active model of a model directory, swapped in the background when the artifacts change.
+
+    Attributes:
+    - path: The watched model directory.
+    - loader: Builds the served object from (vectorizer_path, model_path).
+    - interval: Seconds between polls of the directory.
+    - reloads: Number of successful swaps.
+    - failures: Number of failed loads.
+    - last_error: Message of the last failed load.
+    """
+
+    def __init__(self, path: str | Path = MODEL_DIR, loader: Callable | None = None, interval: float = 2.0):
+        self.path = Path(path)
+        self.loader = loader or FusedPredictor.from_files
+        self.interval = interval
+        self.reloads = 0
+        self.failures = 0
+        self.last_error = None
+        self._fingerprint = artifacts_fingerprint(self.path)
+        self._pending = None
+        self._active = self._load()
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+        logger.info("Serving model %s (loaded in %.2fs)", self._active.version, self._active.load_seconds)
+
+    def _load(self) -> LoadedModel:
+        """Load the artifacts the directory currently points to."""
+        manifest = data_loader.read_model_manifest(self.path)
+        if manifest is not None:
+            vectorizer_path, model_path = self.path / manifest["vectorizer"], self.path / manifest["model"]
+            version = manifest["version"]
+        else:
+            vectorizer_path, model_path = data_loader.find_model_artifacts(self.path)
+            version = f"{Path(model_path).stem}@{Path(model_path).stat().st_mtime_ns}"
+        start = time.perf_counter()
+        artifact = self.loader(vectorizer_path, model_path)
+        return LoadedModel(version=version, artifact=artifact, loaded_at=time.time(),
+                           load_seconds=time.perf_counter() - start)
+
+    # ─── Active Model ───────────────────────────────────────────────────────────
+    @property
+    def active(self) -> LoadedModel:
+        """The active model; read it once per batch to score the batch with one version."""
+        return self._active
+
+    @property
+    def version(self) -> str:
+        """Identifier of the active model."""
+        return self._active.version
+
+    def current(self):
+        """
+        The object served by the active model.
+        Returns:
+            object: What the loader returned for the active artifacts.
+        """
+        return self._active.artifact
+
+    def stats(self) -> dict:
+        """
+        Active version and reload timing.
+        Returns:
+            dict: 'version', 'loaded_at', 'load_seconds', 'reloads', 'failures' and 'last_error'.
+        """
+        active = self._active
+        return {"version": active.version, "loaded_at": active.loaded_at, "load_seconds": active.load_seconds,
+                "reloads": self.reloads, "failures": self.failures, "last_error": self.last_error}
+
+    # ─── Reloading ──────────────────────────────────────────────────────────────
+    def check(self) -> bool:
+        """
+        Poll the directory once and swap in changed artifacts once they load.
+        Returns:
+            bool: True if a new model became active.
+        """
+        with self._lock:
+            fingerprint = artifacts_fingerprint(self.path)
+            if fingerprint == self._fingerprint:
+                self._pending = None
+                return False
+            # A manifest is replaced atomically; loose files must stop changing first
+            settled = fingerprint is not None and (fingerprint[:1] == ("manifest",) or fingerprint == self._pending)
+            if not settled:
+                self._pending = fingerprint
+                return False
+
+            try:
+                loaded = self._load()
+            except Exception as e:
+                self.failures += 1
+                self.last_error = repr(e)
+                logger.warning("Reloading %s failed; still serving %s: %s", self.path, self._active.version, e)
+                return False
+
+            previous, self._active = self._active, loaded
+            self._fingerprint = fingerprint
+            self._pending = None
+            self.reloads += 1
+            logger.info("Swapped model %s for %s (loaded in %.2fs)", previous.version, loaded.version,
+                        loaded.load_seconds)
+            return True
+
+    def _watch(self):
+        while not self._stop.wait(self.interval):
+            try:
+                self.check()
+            except Exception as e:
+                logger.error("Model watcher error: %s", e)
+
+    def start(self) -> "HotReloader":
+        """
+        Start polling the directory on a background thread.
+        Returns:
+            HotReloader: self.
+        """
+        if self._thread is None:
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._watch, name="model-watcher", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self):
+        """
+        Stop the background polling.
+        Returns:
+            None
+        """
+        if self._thread is not None:
+            self._stop.set()
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self) -> "HotReloader":
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    # ─── Prediction ─────────────────────────────────────────────────────────────
+    def decision_function(self, texts: list[str]) -> np.ndarray:
+        """
+        Score raw texts with the active predictor.
+        Args:
+            texts (list[str]): Raw review texts.
+        Returns:
+            np.ndarray: Decision score per text.
+        """
+        return self._active.artifact.decision_function(texts)
+
+    def predict(self, texts: list[str]) -> np.ndarray:
+        """
+        Predict class labels with the active predictor.
+        Args:
+            texts (list[str]): Raw review texts.
+        Returns:
+            np.ndarray: Predicted label per text.
+        """
+        return self._active.artifact.predict(texts)
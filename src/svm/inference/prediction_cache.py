@@ -0,0 +1,159 @@
+"""Bounded cache of decision scores for repeated reviews.
+
+Online traffic repeats itself: reposts, templated spam and client retries send the same
+review again, and every copy would go through the filters, spaCy lemmatization,
+vectorization and the SVM once more. The regex cleaning stage is cheap and already folds
+markup and whitespace differences, so the cache is keyed by a 128-bit BLAKE2b digest of
+the cleaned text and stores the decision score. Only the digest is kept, not the text.
+
+Entries are evicted least recently used beyond max_size and, with a ttl, once they are
+older than ttl seconds. Every lookup names the model version it scores with; the fused
+predictor derives it from a digest of the weights, so a retrain under the same file name
+is a new version. When the version differs from the one the entries were computed with,
+all entries are dropped, so a reloaded model never serves scores of its predecessor.
+"""
+
+# ─── Standard Library Imports ────────────────────────────────────────────────────
+import time
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Callable
+
+# ─── Project Imports ─────────────────────────────────────────────────────────────
+from src.config import logging_config
+
+# ─── Logging Setup ───────────────────────────────────────────────────────────────
+logger = logging_config.configure_logging()
+
+
+def text_key(text: str) -> bytes:
+    """
+    Cache key of a cleaned text.
+    Args:
+        text (str): The text after the cleaning stage.
+    Returns:
+        bytes: 16-byte BLAKE2b digest of the UTF-8 text.
+    """
+    return hashlib.blake2b(text.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+
+
+class PredictionCache:
+    """
+    Thread-safe LRU/TTL cache of decision scores keyed by cleaned-text digests.
+
+    Attributes:
+    - max_size: Largest number of cached scores; least recently used entries are evicted.
+    - ttl: Seconds an entry is served after it was stored; None keeps entries until evicted.
+    - version: Model version of the cached scores.
+    - hits, misses: Lookups served from the cache and lookups that had to be scored.
+    - evictions, expirations: Entries dropped for size and for age.
+    - invalidations: Times the entries were dropped for a new model version.
+    """
+
+    def __init__(self, max_size: int = 100_000, ttl: float | None = None, clock: Callable[[], float] = time.monotonic):
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1")
+        self.max_size = max_size
+        self.ttl = ttl
+        self.version = None
+        self.hits = self.misses = 0
+        self.evictions = self.expirations = self.invalidations = 0
+        self._clock = clock
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups served from the cache."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def stats(self) -> dict:
+        """
+        Summarize the cache behaviour.
+        Returns:
+            dict: Hit and eviction counters, hit rate, size and the cached model version.
+        """
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hit_rate,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "invalidations": self.invalidations,
+                "size": len(self._entries),
+                "version": self.version,
+            }
+
+    def clear(self):
+        """
+        Drop all entries; the counters are kept.
+        Returns:
+            None
+        """
+        with self._lock:
+            self._entries.clear()
+
+    def _bind(self, version: str):
+        """Drop the entries of another model version. Call with the lock held."""
+        if version != self.version:
+            if self._entries:
+                self.invalidations += 1
+                logger.info("Dropping %d cached scores of model %s for %s", len(self._entries), self.version, version)
+                self._entries.clear()
+            self.version = version
+
+    # ─── Lookups ────────────────────────────────────────────────────────────────
+    def get_many(self, keys: list[bytes], version: str) -> list[float | None]:
+        """
+        Look up the scores of a batch.
+        Args:
+            keys (list[bytes]): Keys from text_key.
+            version (str): Model version the batch is scored with.
+        Returns:
+            list[float or None]: The cached score per key; None on a miss.
+        """
+        now = self._clock()
+        scores = []
+        with self._lock:
+            self._bind(version)
+            for key in keys:
+                entry = self._entries.get(key)
+                if entry is not None and self.ttl is not None and now - entry[1] > self.ttl:
+                    del self._entries[key]
+                    self.expirations += 1
+                    entry = None
+                if entry is None:
+                    scores.append(None)
+                    continue
+                self._entries.move_to_end(key)
+                scores.append(entry[0])
+            hits = sum(score is not None for score in scores)
+            self.hits += hits
+            self.misses += len(keys) - hits
+        return scores
+
+    def put_many(self, keys: list[bytes], scores, version: str):
+        """
+        Store the scores of a batch.
+        Args:
+            keys (list[bytes]): Keys from text_key.
+            scores (Iterable[float]): Decision score per key.
+            version (str): Model version that computed the scores.
+        Returns:
+            None
+        """
+        now = self._clock()
+        with self._lock:
+            self._bind(version)
+            for key, score in zip(keys, scores):
+                self._entries[key] = (float(score), now)
+                self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
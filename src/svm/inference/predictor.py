@@ -0,0 +1,171 @@
+"""Thread-safe shared predictor for multi-threaded hosts.
+
+Loads the fitted TF-IDF vectorizer and linear SVM once and copies everything scoring
+needs into read-only arrays. Calls share no mutable state, so a single Predictor can
+serve many threads at once. Counting, TF-IDF weighting, normalization and the sparse
+decision product run in NumPy/SciPy kernels that release the GIL; only tokenization
+and the vocabulary lookup hold it.
+"""
+
+# ─── Standard Library Imports ────────────────────────────────────────────────────
+from pathlib import Path
+
+# ─── Third-Party Imports ─────────────────────────────────────────────────────────
+import numpy as np
+from scipy.sparse import csr_matrix
+from sklearn.feature_extraction.text import TfidfVectorizer
+
+# ─── Project Imports ─────────────────────────────────────────────────────────────
+from src.data import data_loader
+from src.config import logging_config
+from src.config.paths import MODEL_DIR
+
+# ─── Logging Setup ───────────────────────────────────────────────────────────────
+logger = logging_config.configure_logging()
+
+
+def _read_only(array: np.ndarray) -> np.ndarray:
+    """Return a private read-only copy of an array."""
+    array = np.array(array, copy=True)
+    array.setflags(write=False)
+    return array
+
+
+class Predictor:
+    """
+    Immutable scorer around a fitted TfidfVectorizer and a linear SVM.
+
+    Attributes:
+    - n_features: Number of TF-IDF features.
+    - classes: Class labels of the model, negative class first.
+    - version: Free-form identifier of the loaded artifacts.
+    """
+
+    def __init__(self, vectorizer: TfidfVectorizer, model, version: str = ""):
+        # Accept a fitted GridSearchCV as well as a bare linear model
+        estimator = getattr(model, "best_estimator_", model)
+
+        self.version = version
+        self.n_features = len(vectorizer.vocabulary_)
+        self.classes = _read_only(estimator.classes_)
+
+        # Everything below is only read after construction
+        self._analyze = vectorizer.build_analyzer()
+        self._vocabulary = dict(vectorizer.vocabulary_)
+        self._idf = _read_only(vectorizer.idf_) if vectorizer.use_idf else None
+        self._sublinear_tf = vectorizer.sublinear_tf
+        self._binary = vectorizer.binary
+        self._norm = vectorizer.norm
+        self._dtype = np.dtype(vectorizer.dtype)
+        self._coef = _read_only(np.asarray(estimator.coef_, dtype=np.float64).ravel())
+        self._intercept = float(np.ravel(estimator.intercept_)[0])
+        if len(self._coef) != self.n_features:
+            raise ValueError(f"Model has {len(self._coef)} coefficients but the vectorizer {self.n_features} features")
+
+    @classmethod
+    def from_files(cls, vectorizer_path: str | Path, model_path: str | Path) -> "Predictor":
+        """
+        Load a predictor from saved vectorizer and model files.
+        Args:
+            vectorizer_path (str or Path): The joblib file of the vectorizer.
+            model_path (str or Path): The joblib file of the SVM model.
+        Returns:
+            Predictor: The loaded predictor.
+        """
+        vectorizer = data_loader.load_encoder(vectorizer_path)
+        model = data_loader.load_svm_model(model_path)
+        return cls(vectorizer, model, version=Path(model_path).stem)
+
+    @classmethod
+    def from_model_dir(cls, path: str | Path = MODEL_DIR) -> "Predictor":
+        """
+        Load the most recent matching vectorizer and model from a model directory.
+        Args:
+            path (str or Path): The model directory.
+        Returns:
+            Predictor: The loaded predictor.
+        """
+        return cls.from_files(*data_loader.find_model_artifacts(path))
+
+    def _lookup(self, texts: list[str]) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Analyze texts and map every in-vocabulary feature occurrence to its column.
+        Args:
+            texts (list[str]): Texts to encode.
+        Returns:
+            tuple[np.ndarray, np.ndarray]: Row and column of every feature occurrence.
+        """
+        vocabulary = self._vocabulary
+        columns, lengths = [], []
+        for text in texts:
+            ids = [vocabulary[f] for f in self._analyze(text) if f in vocabulary]
+            columns.extend(ids)
+            lengths.append(len(ids))
+        rows = np.repeat(np.arange(len(texts), dtype=np.int64), lengths)
+        return rows, np.asarray(columns, dtype=np.int64)
+
+    def _count(self, texts: list[str]) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Count the feature occurrences of every text in CSR layout.
+        Args:
+            texts (list[str]): Texts to encode.
+        Returns:
+            tuple[np.ndarray, ...]: Row, column and count of every nonzero, sorted by row
+                and column, and the CSR row pointer.
+        """
+        rows, columns = self._lookup(texts)
+
+        # Count (row, column) pairs; the sorted codes yield a CSR layout with sorted indices
+        n_rows = len(texts)
+        codes, counts = np.unique(rows * self.n_features + columns, return_counts=True)
+        row_of, indices = np.divmod(codes, self.n_features)
+        indptr = np.zeros(n_rows + 1, dtype=np.int64)
+        np.cumsum(np.bincount(row_of, minlength=n_rows), out=indptr[1:])
+        return row_of, indices, counts, indptr
+
+    def transform(self, texts: list[str]) -> csr_matrix:
+        """
+        Encode texts exactly like the vectorizer's transform.
+        Args:
+            texts (list[str]): Texts to encode.
+        Returns:
+            csr_matrix: TF-IDF matrix of shape (len(texts), n_features).
+        """
+        row_of, indices, counts, indptr = self._count(texts)
+        n_rows = len(texts)
+
+        data = np.ones(len(counts), dtype=self._dtype) if self._binary else counts.astype(self._dtype)
+        if self._sublinear_tf:
+            np.log(data, out=data)
+            data += 1
+        if self._idf is not None:
+            data *= self._idf[indices]
+        if self._norm is not None:
+            values = data * data if self._norm == "l2" else np.abs(data)
+            row_norms = np.bincount(row_of, weights=values, minlength=n_rows)
+            if self._norm == "l2":
+                row_norms = np.sqrt(row_norms)
+            row_norms[row_norms == 0.0] = 1.0
+            data /= row_norms[row_of].astype(self._dtype)
+
+        return csr_matrix((data, indices, indptr), shape=(n_rows, self.n_features))
+
+    def decision_function(self, texts: list[str]) -> np.ndarray:
+        """
+        Compute signed distances to the separating hyperplane.
+        Args:
+            texts (list[str]): Texts to score.
+        Returns:
+            np.ndarray: Decision score per text; positive means the second class.
+        """
+        return self.transform(texts) @ self._coef + self._intercept
+
+    def predict(self, texts: list[str]) -> np.ndarray:
+        """
+        Predict class labels.
+        Args:
+            texts (list[str]): Texts to classify.
+        Returns:
+            np.ndarray: Predicted label per text.
+        """
+        return self.classes[(self.decision_function(texts) > 0).astype(np.int64)]
@@ -0,0 +1,276 @@
+"""Integer-quantized predictor for memory-constrained scoring.
+
+A linear SVM on TF-IDF features scores a text as
+
+    decision = Σ_j tf_j · idf_j · coef_j / ‖tf ∘ idf‖ + intercept
+
+so idf and coef can be folded into one weight per term. The folded weights are quantized
+to int8 or int16 with one scale per model, and the decision product is accumulated in
+int64 over fixed-point term frequencies (16 fractional bits, exact for raw counts). The
+row norm still needs idf on its own; it is stored as unsigned integers of the same width
+and the per-row norm is computed in floating point. transform encodes texts with the same
+dequantized idf, so the predictor still works wherever a Predictor's TF-IDF matrix is used.
+
+The artifact keeps the vocabulary, the analyzer settings and the integer arrays only, so
+it drops the float64 coef_ and idf_ as well as the pruned-term set sklearn keeps in
+stop_words_. quantization_report measures the cost on held-out texts: the worst-case and
+mean decision-value error against the float model and the predictions that flip.
+"""
+
+# ─── Standard Library Imports ────────────────────────────────────────────────────
+from pathlib import Path
+
+# ─── Third-Party Imports ─────────────────────────────────────────────────────────
+import joblib
+import numpy as np
+from scipy.sparse import csr_matrix
+from sklearn.base import clone
+from sklearn.feature_extraction.text import TfidfVectorizer
+
+# ─── Project Imports ─────────────────────────────────────────────────────────────
+from src.data import data_loader
+from src.svm.inference.predictor import Predictor, _read_only
+from src.config import logging_config
+from src.config.paths import MODEL_DIR
+
+# ─── Logging Setup ───────────────────────────────────────────────────────────────
+logger = logging_config.configure_logging()
+
+# Supported integer widths of the quantized weights
+QUANTIZATION_BITS = (8, 16)
+
+# Fractional bits of the fixed-point term frequencies
+TF_FRACTION_BITS = 16
+
+
+def quantize(values: np.ndarray, bits: int, signed: bool = True) -> tuple[np.ndarray, float]:
+    """
+    Quantize an array linearly with one scale.
+    Args:
+        values (np.ndarray): The float values.
+        bits (int): Integer width, see QUANTIZATION_BITS.
+        signed (bool): Signed symmetric range; unsigned for non-negative values.
+    Returns:
+        tuple[np.ndarray, float]: The integers and the scale that maps them back (values ≈ q · scale).
+    """
+    if bits not in QUANTIZATION_BITS:
+        raise ValueError(f"Unsupported quantization width {bits}. Choose one of {QUANTIZATION_BITS}.")
+    dtype = np.dtype(f"int{bits}" if signed else f"uint{bits}")
+    peak = float(np.max(np.abs(values))) if len(values) else 0.0
+    scale = peak / np.iinfo(dtype).max if peak > 0 else 1.0
+    return np.rint(np.asarray(values, dtype=np.float64) / scale).astype(dtype), scale
+
+
+class QuantizedPredictor(Predictor):
+    """
+    Predictor scoring with integer-quantized folded idf × coef weights.
+
+    Attributes:
+    - bits: Width of the quantized weights (8 or 16).
+    - n_features: Number of TF-IDF features.
+    - classes: Class labels of the model, negative class first.
+    - version: Free-form identifier of the artifacts.
+    """
+
+    def __init__(self, vectorizer: TfidfVectorizer, model, bits: int = 8, version: str = ""):
+        estimator = getattr(model, "best_estimator_", model)
+        coef = np.asarray(estimator.coef_, dtype=np.float64).ravel()
+        idf = np.asarray(vectorizer.idf_, dtype=np.float64) if vectorizer.use_idf else None
+        if len(coef) != len(vectorizer.vocabulary_):
+            raise ValueError(f"Model has {len(coef)} coefficients but the vectorizer "
+                             f"{len(vectorizer.vocabulary_)} features")
+
+        weights, weight_scale = quantize(coef if idf is None else idf * coef, bits)
+        idf, idf_scale = quantize(idf, bits, signed=False) if idf is not None else (None, 1.0)
+        self.__setstate__({
+            "bits": bits,
+            "version": version,
+            "settings": clone(vectorizer),
+            "vocabulary": dict(vectorizer.vocabulary_),
+            "classes": np.asarray(estimator.classes_),
+            "intercept": float(np.ravel(estimator.intercept_)[0]),
+            "weights": weights,
+            "weight_scale": weight_scale,
+            "idf": idf,
+            "idf_scale": idf_scale,
+        })
+
+    def __getstate__(self) -> dict:
+        # The analyzer is rebuilt from the unfitted settings on load
+        return {"bits": self.bits, "version": self.version, "settings": self._settings,
+                "vocabulary": self._vocabulary, "classes": self.classes, "intercept": self._intercept,
+                "weights": self._weights, "weight_scale": self._weight_scale,
+                "idf": self._idf, "idf_scale": self._idf_scale}
+
+    def __setstate__(self, state: dict):
+        settings = state["settings"]
+        self.bits = state["bits"]
+        self.version = state["version"]
+        self.n_features = len(state["vocabulary"])
+        self.classes = _read_only(state["classes"])
+
+        self._settings = settings
+        self._analyze = settings.build_analyzer()
+        self._vocabulary = state["vocabulary"]
+        self._sublinear_tf = settings.sublinear_tf
+        self._binary = settings.binary
+        self._norm = settings.norm
+        self._dtype = np.dtype(settings.dtype)
+        self._intercept = state["intercept"]
+        self._weights = _read_only(state["weights"])
+        self._weight_scale = state["weight_scale"]
+        self._idf = None if state["idf"] is None else _read_only(state["idf"])
+        self._idf_scale = state["idf_scale"]
+
+    @classmethod
+    def from_files(cls, vectorizer_path: str | Path, model_path: str | Path, bits: int = 8) -> "QuantizedPredictor":
+        """
+        Quantize the saved training artifacts.
+        Args:
+            vectorizer_path (str or Path): The joblib file of the vectorizer.
+            model_path (str or Path): The joblib file of the SVM model.
+            bits (int): Width of the quantized weights.
+        Returns:
+            QuantizedPredictor: The predictor.
+        """
+        return cls(data_loader.load_encoder(vectorizer_path), data_loader.load_svm_model(model_path),
+                   bits=bits, version=Path(model_path).stem)
+
+    @classmethod
+    def from_model_dir(cls, path: str | Path = MODEL_DIR, bits: int = 8) -> "QuantizedPredictor":
+        """
+        Quantize the most recent matching vectorizer and model of a model directory.
+        Args:
+            path (str or Path): The model directory.
+            bits (int): Width of the quantized weights.
+        Returns:
+            QuantizedPredictor: The predictor.
+        """
+        return cls.from_files(*data_loader.find_model_artifacts(path), bits=bits)
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the quantized weight and idf arrays."""
+        return self._weights.nbytes + (0 if self._idf is None else self._idf.nbytes)
+
+    def save(self, path: str | Path) -> Path:
+        """
+        Save the quantized predictor as one joblib file.
+        Args:
+            path (str or Path): Destination file.
+        Returns:
+            Path: The written file.
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        data_loader.dump_atomic(self, path)
+        logger.info("Quantized int%d predictor saved to %s (%.1f KiB)", self.bits, path, path.stat().st_size / 1024)
+        return path
+
+    @classmethod
+    def load(cls, path: str | Path) -> "QuantizedPredictor":
+        """
+        Load a saved quantized predictor.
+        Args:
+            path (str or Path): The joblib file written by save.
+        Returns:
+            QuantizedPredictor: The predictor.
+        """
+        predictor = joblib.load(path)
+        if not isinstance(predictor, cls):
+            raise TypeError(f"{path} does not hold a {cls.__name__}")
+        return predictor
+
+    def _tf(self, counts: np.ndarray) -> np.ndarray:
+        """Term frequency of every nonzero count as the vectorizer weights it."""
+        if self._binary:
+            return np.ones(len(counts), dtype=np.float64)
+        if self._sublinear_tf:
+            return np.log(counts) + 1.0
+        return counts.astype(np.float64)
+
+    def _tfidf(self, tf: np.ndarray, indices: np.ndarray) -> np.ndarray:
+        """TF-IDF values of the nonzeros with the dequantized idf."""
+        return tf if self._idf is None else tf * (self._idf[indices] * self._idf_scale)
+
+    def _row_norms(self, tfidf: np.ndarray, row_of: np.ndarray, n_rows: int) -> np.ndarray:
+        """Norm of every TF-IDF row; 1 for empty rows."""
+        values = tfidf * tfidf if self._norm == "l2" else np.abs(tfidf)
+        row_norms = np.bincount(row_of, weights=values, minlength=n_rows)
+        if self._norm == "l2":
+            row_norms = np.sqrt(row_norms)
+        row_norms[row_norms == 0.0] = 1.0
+        return row_norms
+
+    def transform(self, texts: list[str]) -> csr_matrix:
+        """
+        Encode texts as TF-IDF with the dequantized idf.
+        Args:
+            texts (list[str]): Texts to encode.
+        Returns:
+            csr_matrix: TF-IDF matrix of shape (len(texts), n_features); equal to the
+                vectorizer's up to the idf quantization error.
+        """
+        row_of, indices, counts, indptr = self._count(texts)
+        data = self._tfidf(self._tf(counts), indices)
+        if self._norm is not None:
+            data = data / self._row_norms(data, row_of, len(texts))[row_of]
+        return csr_matrix((data.astype(self._dtype), indices, indptr), shape=(len(texts), self.n_features))
+
+    def decision_function(self, texts: list[str]) -> np.ndarray:
+        """
+        Compute signed distances to the separating hyperplane with integer accumulation.
+        Args:
+            texts (list[str]): Texts to score.
+        Returns:
+            np.ndarray: Decision score per text; positive means the second class.
+        """
+        row_of, indices, counts, indptr = self._count(texts)
+        tf = self._tf(counts)
+
+        # Σ tf_j · w_j in int64; segment sums over the row pointer stay exact
+        products = np.rint(tf * (1 << TF_FRACTION_BITS)).astype(np.int64) * self._weights[indices]
+        sums = np.concatenate(([0], np.cumsum(products)))
+        dots = sums[indptr[1:]] - sums[indptr[:-1]]
+        scores = dots * (self._weight_scale / (1 << TF_FRACTION_BITS))
+
+        if self._norm is not None:
+            scores /= self._row_norms(self._tfidf(tf, indices), row_of, len(texts))
+        return scores + self._intercept
+
+
+def quantization_report(predictor: QuantizedPredictor, vectorizer: TfidfVectorizer, model,
+                        texts: list[str], y: np.ndarray | None = None) -> dict:
+    """
+    Compare a quantized predictor with the float vectorizer and model on held-out texts.
+    Args:
+        predictor (QuantizedPredictor): The quantized predictor.
+        vectorizer (TfidfVectorizer): The fitted vectorizer it was built from.
+        model: The fitted SVM it was built from.
+        texts (list[str]): Held-out texts, e.g. the test split.
+        y (np.ndarray, optional): Labels of the texts; adds both accuracies.
+    Returns:
+        dict: Worst-case and mean absolute decision error, prediction flips, and the
+            bytes of the float vs quantized weight arrays.
+    """
+    estimator = getattr(model, "best_estimator_", model)
+    reference = np.asarray(model.decision_function(vectorizer.transform(texts))).ravel()
+    scores = predictor.decision_function(texts)
+    error = np.abs(scores - reference)
+    flips = int(np.sum((scores > 0) != (reference > 0)))
+
+    report = {
+        "bits": predictor.bits,
+        "max_abs_error": float(error.max()) if len(error) else 0.0,
+        "mean_abs_error": float(error.mean()) if len(error) else 0.0,
+        "flips": flips,
+        "flip_rate": flips / max(len(texts), 1),
+        "float_weight_bytes": np.asarray(estimator.coef_, dtype=np.float64).nbytes
+                              + (np.asarray(vectorizer.idf_).nbytes if vectorizer.use_idf else 0),
+        "quantized_weight_bytes": predictor.nbytes,
+    }
+    if y is not None:
+        positive = np.asarray(estimator.classes_)[1]
+        report["float_accuracy"] = float(np.mean((reference > 0) == (np.asarray(y) == positive)))
+        report["quantized_accuracy"] = float(np.mean((scores > 0) == (np.asarray(y) == positive)))
+    return report
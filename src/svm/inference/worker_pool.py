@@ -0,0 +1,406 @@
+"""Pre-fork scoring worker pool that shares one memory-mapped copy of the model.
+
+Independent scoring processes each unpickle the vectorizer vocabulary, idf_ and coef_,
+so memory grows linearly with the number of processes. Here the parent loads the
+artifacts once and writes everything scoring needs as .npy files that are memory-mapped
+read-only: idf, SVM weights and a vocabulary index of sorted term hashes with their
+columns, which replaces the vocabulary dict. The fitted vectorizer and model are dropped
+before forking and the few remaining Python objects are frozen out of the garbage
+collector, so forked workers read the parent's pages without copying them. Workers take
+batches from one shared request queue and put decision scores on a shared result queue.
+
+The vocabulary index hashes terms with Python's string hash, which is salted per
+interpreter but inherited by forked children; it is therefore only valid in the process
+that built it and its forks. A collision between an unseen feature and a vocabulary term
+has a probability of about 2^-64 per lookup and is ignored.
+"""
+
+# ─── Standard Library Imports ────────────────────────────────────────────────────
+import gc
+import os
+import queue
+import shutil
+import tempfile
+import multiprocessing
+from pathlib import Path
+from typing import Callable, Iterable, Iterator
+
+# ─── Third-Party Imports ─────────────────────────────────────────────────────────
+import joblib
+import numpy as np
+from sklearn.base import clone
+from sklearn.feature_extraction.text import TfidfVectorizer
+
+# ─── Project Imports ─────────────────────────────────────────────────────────────
+from src.data import data_loader
+from src.svm.inference.predictor import Predictor, _read_only
+from src.svm.training.shared_memory import SHARED_MEMORY_DIR
+from src.config import logging_config
+from src.config.paths import MODEL_DIR
+
+# ─── Logging Setup ───────────────────────────────────────────────────────────────
+logger = logging_config.configure_logging()
+
+# Hash of a fixed string, stored with the index to detect a different hash salt on attach
+_HASH_CHECK = "svm-vocabulary-index"
+
+# Seconds to wait for a result before checking that the workers are still alive
+RESULT_POLL_SECONDS = 0.5
+
+# Seconds close() waits for a worker to exit before terminating it
+JOIN_TIMEOUT_SECONDS = 5.0
+
+
+def vocabulary_index(vocabulary: dict[str, int]) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Build a sorted hash index of a vocabulary.
+    Args:
+        vocabulary (dict[str, int]): Term → column mapping of a fitted vectorizer.
+    Returns:
+        tuple[np.ndarray, np.ndarray]: Sorted int64 term hashes and the column of each hash.
+    """
+    hashes = np.fromiter(map(hash, vocabulary), dtype=np.int64, count=len(vocabulary))
+    columns = np.fromiter(vocabulary.values(), dtype=np.int64, count=len(vocabulary))
+    order = np.argsort(hashes, kind="stable")
+    hashes, columns = hashes[order], columns[order]
+    if np.any(hashes[1:] == hashes[:-1]):
+        raise ValueError("Two vocabulary terms share a hash; the vocabulary index cannot be built")
+    return hashes, columns
+
+
+def export_shared_model(vectorizer: TfidfVectorizer, model, directory: str | Path, version: str = "") -> Path:
+    """
+    Write the arrays a SharedPredictor needs as memory-mappable files.
+    Args:
+        vectorizer (TfidfVectorizer): The fitted TF-IDF vectorizer.
+        model: The fitted SVM (LinearSVC or GridSearchCV).
+        directory (str or Path): Target directory; created if missing.
+        version (str): Free-form identifier of the artifacts.
+    Returns:
+        Path: The directory to pass to SharedPredictor.
+    """
+    estimator = getattr(model, "best_estimator_", model)
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+
+    hashes, columns = vocabulary_index(vectorizer.vocabulary_)
+    np.save(directory / "hashes.npy", hashes)
+    np.save(directory / "columns.npy", columns)
+    np.save(directory / "coef.npy", np.asarray(estimator.coef_, dtype=np.float64).ravel())
+    if vectorizer.use_idf:
+        np.save(directory / "idf.npy", np.asarray(vectorizer.idf_))
+
+    # An unfitted clone carries the analyzer settings without the vocabulary
+    joblib.dump({
+        "vectorizer": clone(vectorizer),
+        "classes": np.asarray(estimator.classes_),
+        "intercept": float(np.ravel(estimator.intercept_)[0]),
+        "n_features": len(vectorizer.vocabulary_),
+        "version": version,
+        "hash_check": hash(_HASH_CHECK),
+    }, directory / "meta.joblib")
+    return directory
+
+
+def _attach(path: Path) -> np.ndarray:
+    """Memory-map a .npy file read-only as a plain ndarray."""
+    return np.asarray(np.load(path, mmap_mode="r"))
+
+
+class SharedPredictor(Predictor):
+    """
+    Predictor whose vocabulary, idf and weights live in read-only memory-mapped files.
+
+    Scores are identical to Predictor's; the vocabulary dict is replaced by a sorted
+    hash index searched with NumPy, so no per-term Python objects are shared with forks.
+
+    Attributes:
+    - directory: Directory of the memory-mapped files.
+    - n_features: Number of TF-IDF features.
+    - classes: Class labels of the model, negative class first.
+    - version: Free-form identifier of the loaded artifacts.
+    """
+
+    def __init__(self, directory: str | Path):
+        self.directory = Path(directory)
+        meta = joblib.load(self.directory / "meta.joblib")
+        if meta["hash_check"] != hash(_HASH_CHECK):
+            raise ValueError(f"The vocabulary index in {self.directory} was built under a different string hash "
+                             "salt; attach it only in the building process or its forks")
+        vectorizer = meta["vectorizer"]
+
+        self.version = meta["version"]
+        self.n_features = meta["n_features"]
+        self.classes = _read_only(meta["classes"])
+
+        self._analyze = vectorizer.build_analyzer()
+        self._hashes = _attach(self.directory / "hashes.npy")
+        self._columns = _attach(self.directory / "columns.npy")
+        idf_path = self.directory / "idf.npy"
+        self._idf = _attach(idf_path) if idf_path.exists() else None
+        self._sublinear_tf = vectorizer.sublinear_tf
+        self._binary = vectorizer.binary
+        self._norm = vectorizer.norm
+        self._dtype = np.dtype(vectorizer.dtype)
+        self._coef = _attach(self.directory / "coef.npy")
+        self._intercept = meta["intercept"]
+
+    @classmethod
+    def from_files(cls, vectorizer_path: str | Path, model_path: str | Path,
+                   directory: str | Path | None = None) -> "SharedPredictor":
+        """
+        Load saved artifacts once, export them as memory-mapped files and attach to them.
+        Args:
+            vectorizer_path (str or Path): The joblib file of the vectorizer.
+            model_path (str or Path): The joblib file of the SVM model.
+            directory (str or Path, optional): Parent directory for the files; /dev/shm if available.
+        Returns:
+            SharedPredictor: The attached predictor; the unpickled artifacts are released.
+        """
+        root = tempfile.mkdtemp(prefix="svm_serving_", dir=directory or SHARED_MEMORY_DIR)
+        vectorizer = data_loader.load_encoder(vectorizer_path)
+        model = data_loader.load_svm_model(model_path)
+        export_shared_model(vectorizer, model, root, version=Path(model_path).stem)
+        del vectorizer, model
+        gc.collect()
+        return cls(root)
+
+    @classmethod
+    def from_model_dir(cls, path: str | Path = MODEL_DIR, directory: str | Path | None = None) -> "SharedPredictor":
+        """
+        Load the most recent matching vectorizer and model from a model directory.
+        Args:
+            path (str or Path): The model directory.
+            directory (str or Path, optional): Parent directory for the memory-mapped files.
+        Returns:
+            SharedPredictor: The attached predictor.
+        """
+        return cls.from_files(*data_loader.find_model_artifacts(path), directory=directory)
+
+    def release(self):
+        """
+        Delete the memory-mapped files; existing mappings stay readable on POSIX systems.
+        Returns:
+            None
+        """
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def _lookup(self, texts: list[str]) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Analyze texts and map every in-vocabulary feature occurrence to its column.
+        Args:
+            texts (list[str]): Texts to encode.
+        Returns:
+            tuple[np.ndarray, np.ndarray]: Row and column of every feature occurrence.
+        """
+        features, lengths = [], []
+        for text in texts:
+            analyzed = self._analyze(text)
+            features.extend(analyzed)
+            lengths.append(len(analyzed))
+        rows = np.repeat(np.arange(len(texts), dtype=np.int64), lengths)
+        hashes = np.fromiter(map(hash, features), dtype=np.int64, count=len(features))
+
+        index = np.minimum(np.searchsorted(self._hashes, hashes), len(self._hashes) - 1)
+        found = self._hashes[index] == hashes
+        return rows[found], self._columns[index[found]]
+
+
+def process_memory_kib(pid: int) -> dict[str, int]:
+    """
+    Resident memory of a process from /proc/<pid>/smaps_rollup (Linux only).
+    Args:
+        pid (int): The process id.
+    Returns:
+        dict[str, int]: RSS, PSS, USS (private pages) and shared pages in KiB; zeros if unavailable.
+    """
+    fields = {"Rss": 0, "Pss": 0, "Private_Clean": 0, "Private_Dirty": 0, "Shared_Clean": 0, "Shared_Dirty": 0}
+    try:
+        for line in Path(f"/proc/{pid}/smaps_rollup").read_text().splitlines():
+            name, _, value = line.partition(":")
+            if name in fields:
+                fields[name] = int(value.split()[0])
+    except (OSError, ValueError, IndexError):
+        pass
+    return {
+        "rss": fields["Rss"],
+        "pss": fields["Pss"],
+        "uss": fields["Private_Clean"] + fields["Private_Dirty"],
+        "shared": fields["Shared_Clean"] + fields["Shared_Dirty"],
+    }
+
+
+def _serve(predictor: Predictor, requests, results, preprocess: Callable[[str], str] | None):
+    """Worker loop: score batches from the request queue until the stop sentinel arrives."""
+    pid = os.getpid()
+    for request_id, texts in iter(requests.get, None):
+        try:
+            if preprocess is not None:
+                texts = [preprocess(text) for text in texts]
+            results.put((request_id, pid, predictor.decision_function(texts)))
+        except Exception as e:
+            results.put((request_id, pid, e))
+
+
+class ScoringPool:
+    """
+    Forked scoring workers sharing one predictor and one request queue.
+
+    Attributes:
+    - predictor: The predictor inherited by every worker.
+    - n_workers: Number of worker processes.
+    - pids: Process ids of the workers.
+    - served: Number of batches scored per worker pid.
+    """
+
+    def __init__(self, predictor: Predictor, n_workers: int, preprocess: Callable[[str], str] | None = None,
+                 max_pending: int | None = None):
+        """
+        Fork the workers.
+        Args:
+            predictor (Predictor): Loaded before the fork; a SharedPredictor keeps its arrays shared.
+            n_workers (int): Number of worker processes.
+            preprocess (callable, optional): Applied to every text inside the workers before scoring.
+            max_pending (int, optional): Batches in flight at once; 2 per worker by default.
+        """
+        if n_workers < 1:
+            raise ValueError("A scoring pool needs at least one worker")
+        context = multiprocessing.get_context("fork")
+        self.predictor = predictor
+        self.n_workers = n_workers
+        self.max_pending = max_pending or 2 * n_workers
+        self._owns_predictor = False
+        self._requests = context.Queue()
+        self._results = context.Queue()
+        self._next_id = 0
+
+        # Keep the collector from touching (and so copying) the parent's objects in the workers
+        gc.collect()
+        gc.freeze()
+        self._workers = [
+            context.Process(target=_serve, args=(predictor, self._requests, self._results, preprocess), daemon=True)
+            for _ in range(n_workers)
+        ]
+        for worker in self._workers:
+            worker.start()
+        gc.unfreeze()
+        self.pids = [worker.pid for worker in self._workers]
+        self.served = dict.fromkeys(self.pids, 0)
+        logger.info("Started %d scoring workers for model %s", n_workers, predictor.version or "<unnamed>")
+
+    @classmethod
+    def from_model_dir(cls, n_workers: int, path: str | Path = MODEL_DIR, **kwargs) -> "ScoringPool":
+        """
+        Load a SharedPredictor from a model directory and fork workers around it.
+        Args:
+            n_workers (int): Number of worker processes.
+            path (str or Path): The model directory.
+            **kwargs: Further ScoringPool arguments.
+        Returns:
+            ScoringPool: The running pool; close() also deletes the memory-mapped files.
+        """
+        pool = cls(SharedPredictor.from_model_dir(path), n_workers, **kwargs)
+        pool._owns_predictor = True
+        return pool
+
+    def map(self, batches: Iterable[list[str]]) -> Iterator[np.ndarray]:
+        """
+        Score batches on the workers and yield their decision scores in input order.
+        Args:
+            batches (Iterable[list[str]]): Batches of texts.
+        Yields:
+            np.ndarray: Decision scores of each batch.
+        """
+        batches = iter(batches)
+        done = {}
+        next_out = self._next_id
+        exhausted = False
+        while True:
+            # Keep at most max_pending batches queued or in progress
+            while not exhausted and self._next_id - next_out < self.max_pending:
+                batch = next(batches, None)
+                if batch is None:
+                    exhausted = True
+                    break
+                self._requests.put((self._next_id, batch))
+                self._next_id += 1
+            if next_out == self._next_id:
+                return
+
+            while next_out not in done:
+                try:
+                    request_id, pid, scores = self._results.get(timeout=RESULT_POLL_SECONDS)
+                except queue.Empty:
+                    self._check_workers()
+                    continue
+                self.served[pid] = self.served.get(pid, 0) + 1
+                done[request_id] = scores
+            scores = done.pop(next_out)
+            next_out += 1
+            if isinstance(scores, Exception):
+                raise scores
+            yield scores
+
+    def _check_workers(self):
+        """Raise if a worker exited; the batch it held would never be answered."""
+        dead = [worker for worker in self._workers if not worker.is_alive()]
+        if dead:
+            exits = ", ".join(f"{worker.pid} (exit code {worker.exitcode})" for worker in dead)
+            raise RuntimeError(f"Scoring worker(s) {exits} died; the pool cannot complete its batches")
+
+    def decision_function(self, texts: list[str]) -> np.ndarray:
+        """
+        Score one batch on a worker.
+        Args:
+            texts (list[str]): Texts to score.
+        Returns:
+            np.ndarray: Decision score per text.
+        """
+        return next(self.map([texts]))
+
+    def predict(self, texts: list[str]) -> np.ndarray:
+        """
+        Predict class labels on a worker.
+        Args:
+            texts (list[str]): Texts to classify.
+        Returns:
+            np.ndarray: Predicted label per text.
+        """
+        return self.predictor.classes[(self.decision_function(texts) > 0).astype(np.int64)]
+
+    def memory(self) -> dict[int, dict[str, int]]:
+        """
+        Resident memory of every worker.
+        Returns:
+            dict[int, dict[str, int]]: process_memory_kib of each worker pid.
+        """
+        return {pid: process_memory_kib(pid) for pid in self.pids}
+
+    def close(self):
+        """
+        Stop and join the workers.
+        Returns:
+            None
+        """
+        for _ in self._workers:
+            self._requests.put(None)
+        for worker in self._workers:
+            worker.join(JOIN_TIMEOUT_SECONDS)
+            if worker.is_alive():
+                logger.warning("Terminating scoring worker %d that did not stop", worker.pid)
+                worker.terminate()
+                worker.join()
+        if any(worker.exitcode != 0 for worker in self._workers):
+            # Unread requests of dead workers must not block the interpreter's exit
+            self._requests.cancel_join_thread()
+        self._requests.close()
+        self._results.close()
+        if self._owns_predictor:
+            self.predictor.release()
+        logger.info("Stopped %d scoring workers; batches served per worker: %s", self.n_workers, self.served)
+
+    def __enter__(self) -> "ScoringPool":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
@@ -1,3 +1,3 @@
-from . import  gridsearch_trainer, vectorizer
+from . import  gridsearch_trainer, vectorizer, feature_selection, shared_memory, scheduler, solvers, streaming, screening, ngram_counter, evaluation, result_store, parallel_transform, incremental_tfidf
 
-__all__ = ["vectorizer", "gridsearch_trainer"]
\ No newline at end of file
+__all__ = ["vectorizer", "gridsearch_trainer", "feature_selection", "shared_memory", "scheduler", "solvers", "streaming", "screening", "ngram_counter", "evaluation", "result_store", "parallel_transform", "incremental_tfidf"]
@@ -0,0 +1,113 @@
+"""Batched evaluation of many linear models on the same encoded matrix.
+
+The weight vectors of all models are stacked into one dense (n_features × n_models)
+matrix, so a single sparse × dense product yields every model's decision values.
+Precision, recall, F1 and accuracy are then computed column-wise for all models at once.
+Every model must be a fitted binary linear classifier (coef_, intercept_, classes_), which
+holds for all solver backends in solvers.SOLVERS.
+"""
+
+# ─── Third-Party Imports ─────────────────────────────────────────────────────────
+import numpy as np
+
+# ─── Project Module Imports ──────────────────────────────────────────────────────
+from src.config import logging_config
+
+# ─── Logging Setup ───────────────────────────────────────────────────────────────
+logger = logging_config.configure_logging()
+
+# Metrics returned by binary_metrics, in report order
+METRICS = ("precision", "recall", "f1", "accuracy")
+
+
+def stack_linear_models(models: list) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Stack the weights of binary linear models.
+    Args:
+        models (list): Fitted linear classifiers sharing their classes.
+    Returns:
+        tuple[np.ndarray, np.ndarray, np.ndarray]: Weights (n_features × n_models),
+            intercepts (n_models,) and the shared classes.
+    """
+    classes = models[0].classes_
+    for model in models:
+        if model.coef_.shape[0] != 1 or not np.array_equal(model.classes_, classes):
+            raise ValueError("Batched evaluation needs binary linear models with the same classes")
+    W = np.column_stack([np.ravel(model.coef_) for model in models])
+    b = np.array([float(np.ravel(model.intercept_)[0]) for model in models])
+    return W, b, classes
+
+
+def decision_scores(X, W: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """
+    Decision values of every stacked model with one sparse × dense product.
+    Args:
+        X (csr_matrix): Encoded samples.
+        W (np.ndarray): Stacked weights (n_features × n_models).
+        b (np.ndarray): Stacked intercepts (n_models,).
+    Returns:
+        np.ndarray: Decision values (n_samples × n_models).
+    """
+    return np.asarray(X @ W) + b
+
+
+def binary_metrics(y_true: np.ndarray, positive: np.ndarray) -> dict[str, np.ndarray]:
+    """
+    Precision, recall, F1 and accuracy of many prediction columns at once.
+    Undefined ratios are 0, as with sklearn's default zero_division.
+    Args:
+        y_true (np.ndarray): True positive-class indicator (n_samples,).
+        positive (np.ndarray): Predicted positive-class indicators (n_samples × n_models).
+    Returns:
+        dict[str, np.ndarray]: One value per model for every name in METRICS.
+    """
+    y_true = np.asarray(y_true, dtype=bool)
+    true_positives = np.count_nonzero(positive & y_true[:, None], axis=0)
+    predicted = np.count_nonzero(positive, axis=0)
+    actual = np.count_nonzero(y_true)
+    correct = np.count_nonzero(positive == y_true[:, None], axis=0)
+
+    def ratio(numerator, denominator):
+        denominator = np.broadcast_to(denominator, numerator.shape)
+        return np.divide(numerator, denominator, out=np.zeros(numerator.shape), where=denominator > 0)
+
+    return {
+        "precision": ratio(true_positives, predicted),
+        "recall": ratio(true_positives, actual),
+        "f1": ratio(2 * true_positives, actual + predicted),
+        "accuracy": correct / max(len(y_true), 1),
+    }
+
+
+def evaluate_models(X, y, models: list) -> dict[str, np.ndarray]:
+    """
+    Score many linear models on the same samples in one pass.
+    Args:
+        X (csr_matrix): Encoded samples shared by all models.
+        y (np.ndarray): True labels.
+        models (list): Fitted binary linear classifiers.
+    Returns:
+        dict[str, np.ndarray]: One value per model for every name in METRICS; the positive
+            class is classes_[1], as in LinearSVC.predict and sklearn's f1_score.
+    """
+    W, b, classes = stack_linear_models(models)
+    positive = decision_scores(X, W, b) > 0
+    return binary_metrics(np.asarray(y) == classes[1], positive)
+
+
+def format_report(names: list[str], metrics: dict[str, np.ndarray], extra: dict[str, list] | None = None) -> str:
+    """
+    Format per-model metrics as a table, best F1 first.
+    Args:
+        names (list[str]): Model names in the order of the metric arrays.
+        metrics (dict[str, np.ndarray]): Output of evaluate_models or binary_metrics.
+        extra (dict[str, list], optional): Additional numeric columns, e.g. the CV score.
+    Returns:
+        str: The report.
+    """
+    columns = {**(extra or {}), **{name: metrics[name] for name in METRICS}}
+    width = max([len(name) for name in names] + [5])
+    lines = [f"{'model':<{width}}  " + "  ".join(f"{column:>9}" for column in columns)]
+    for i in np.argsort(-np.asarray(metrics["f1"]), kind="stable"):
+        lines.append(f"{names[i]:<{width}}  " + "  ".join(f"{values[i]:>9.4f}" for values in columns.values()))
+    return "\n".join(lines)
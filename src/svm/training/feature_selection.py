@@ -0,0 +1,172 @@
+"""Supervised feature selection between TF-IDF encoding and SVM training.
+
+Scores every column of the encoded training matrix with chi² or mutual information,
+keeps the top-k features and remaps the fitted vectorizer so inference produces the
+reduced feature set directly.
+"""
+
+# ─── Third-Party Imports ─────────────────────────────────────────────────────────
+import numpy as np
+from scipy.sparse import csr_matrix
+from sklearn.base import clone
+from sklearn.preprocessing import LabelBinarizer, normalize
+from sklearn.feature_extraction.text import TfidfVectorizer
+
+# ─── Project Module Imports ──────────────────────────────────────────────────────
+from src.data.data_classes import TfidfDataset
+from src.config import logging_config
+
+# ─── Logging Setup ───────────────────────────────────────────────────────────────
+logger = logging_config.configure_logging()
+
+
+def _class_indicator(y: np.ndarray) -> np.ndarray:
+    """Return a dense (n_samples, n_classes) indicator matrix for the labels y."""
+    Y = LabelBinarizer().fit_transform(y)
+    if Y.shape[1] == 1:
+        Y = np.hstack([1 - Y, Y])
+    return Y.astype(np.float64)
+
+
+def chi2_scores(X: csr_matrix, y: np.ndarray) -> np.ndarray:
+    """
+    Compute chi² statistics between every feature and the class labels.
+    The observed per-class feature mass is a single sparse product over the CSR matrix.
+    Args:
+        X (csr_matrix): Non-negative feature matrix of shape (n_samples, n_features).
+        y (np.ndarray): Class labels of shape (n_samples,).
+    Returns:
+        np.ndarray: chi² score per feature.
+    """
+    Y = _class_indicator(y)
+    observed = np.asarray((X.T @ Y).T)                       # (n_classes, n_features)
+    class_prob = Y.mean(axis=0).reshape(-1, 1)
+    feature_count = np.asarray(X.sum(axis=0)).reshape(1, -1)
+    expected = class_prob @ feature_count
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        chi2 = (observed - expected) ** 2 / expected
+    return np.nan_to_num(chi2).sum(axis=0)
+
+
+def mutual_information_scores(X: csr_matrix, y: np.ndarray) -> np.ndarray:
+    """
+    Compute the mutual information between term presence and the class labels.
+    Document counts per class are a single sparse product over the binarized matrix.
+    Args:
+        X (csr_matrix): Feature matrix of shape (n_samples, n_features).
+        y (np.ndarray): Class labels of shape (n_samples,).
+    Returns:
+        np.ndarray: Mutual information (in nats) per feature.
+    """
+    Y = _class_indicator(y)
+    presence = csr_matrix((np.ones_like(X.data, dtype=np.float64), X.indices, X.indptr), shape=X.shape)
+    n_samples = X.shape[0]
+
+    # Joint counts for term present (n11) and absent (n01) per class
+    n11 = np.asarray((presence.T @ Y).T)                     # (n_classes, n_features)
+    n01 = Y.sum(axis=0).reshape(-1, 1) - n11
+    n_term = n11.sum(axis=0, keepdims=True)
+    n_class = Y.sum(axis=0).reshape(-1, 1)
+
+    mi = np.zeros(X.shape[1])
+    for joint, marginal in ((n11, n_term), (n01, n_samples - n_term)):
+        with np.errstate(divide="ignore", invalid="ignore"):
+            term = joint / n_samples * np.log(joint * n_samples / (marginal * n_class))
+        mi += np.nan_to_num(term).sum(axis=0)
+    return mi
+
+
+SCORE_FUNCTIONS = {
+    "chi2": chi2_scores,
+    "mutual_info": mutual_information_scores,
+}
+
+
+def select_top_k(scores: np.ndarray, k: int) -> np.ndarray:
+    """
+    Return the column indices of the k highest scores in ascending column order.
+    Args:
+        scores (np.ndarray): Score per feature.
+        k (int): Number of features to keep.
+    Returns:
+        np.ndarray: Sorted indices of the kept features.
+    """
+    k = min(k, len(scores))
+    top = np.argpartition(-scores, k - 1)[:k]
+    return np.sort(top)
+
+
+def rebuild_vectorizer(vectorizer: TfidfVectorizer, vocabulary: dict[str, int],
+                       idf: np.ndarray | None = None) -> TfidfVectorizer:
+    """
+    Build a fitted vectorizer with the settings of another one and a given vocabulary and idf.
+    Only public sklearn API is used: the vocabulary is passed as a fixed vocabulary and idf
+    through the idf_ setter.
+    Args:
+        vectorizer (TfidfVectorizer): Provides the settings; it is not modified.
+        vocabulary (dict[str, int]): Term → column mapping of the new vectorizer.
+        idf (np.ndarray, optional): Inverse document frequency per column; required with use_idf.
+    Returns:
+        TfidfVectorizer: The fitted vectorizer.
+    """
+    rebuilt = clone(vectorizer).set_params(vocabulary=vocabulary)
+    if rebuilt.use_idf:
+        rebuilt.idf_ = np.asarray(idf, dtype=np.float64)
+    else:
+        # Without idf there is nothing to learn; fitting on an empty document marks it as fitted
+        rebuilt.fit([""])
+    return rebuilt
+
+
+def reduce_vectorizer(vectorizer: TfidfVectorizer, keep: np.ndarray) -> TfidfVectorizer:
+    """
+    Return a copy of a fitted vectorizer restricted to the kept feature columns.
+    Args:
+        vectorizer (TfidfVectorizer): The fitted TF-IDF vectorizer.
+        keep (np.ndarray): Sorted column indices to keep.
+    Returns:
+        TfidfVectorizer: A vectorizer whose transform produces only the kept columns.
+    """
+    new_index = np.full(len(vectorizer.vocabulary_), -1, dtype=np.int64)
+    new_index[keep] = np.arange(len(keep))
+    vocabulary = {
+        term: int(new_index[idx]) for term, idx in vectorizer.vocabulary_.items() if new_index[idx] >= 0
+    }
+    return rebuild_vectorizer(vectorizer, vocabulary, vectorizer.idf_[keep] if vectorizer.use_idf else None)
+
+
+def select_features(data: TfidfDataset, k: int, score_func: str = "chi2") -> TfidfDataset:
+    """
+    Keep the top-k features of an encoded dataset and remap its vectorizer.
+    TF-IDF terms are scaled independently of each other, so renormalizing the kept
+    columns reproduces exactly what the reduced vectorizer produces at inference time.
+    Args:
+        data (TfidfDataset): The encoded dataset.
+        k (int): Number of features to keep.
+        score_func (str): 'chi2' or 'mutual_info'.
+    Returns:
+        TfidfDataset: The reduced dataset with the remapped vectorizer.
+    """
+    if score_func not in SCORE_FUNCTIONS:
+        raise ValueError(f"Unknown score function: {score_func}")
+    logger.info("Selecting top %d of %d features with %s", k, data.X_train.shape[1], score_func)
+
+    scores = SCORE_FUNCTIONS[score_func](data.X_train, data.y_train)
+    keep = select_top_k(scores, k)
+
+    def _reduce(X):
+        X = X[:, keep]
+        return normalize(X, norm=data.vectorizer.norm, copy=False) if data.vectorizer.norm else X
+
+    reduced = TfidfDataset(
+        name=f"{data.name}-k={len(keep)}",
+        X_train=_reduce(data.X_train),
+        y_train=data.y_train,
+        X_test=_reduce(data.X_test),
+        y_test=data.y_test,
+        vectorizer=reduce_vectorizer(data.vectorizer, keep),
+    )
+    logger.info("Reduced training matrix to shape %s", reduced.X_train.shape)
+
+    return reduced
@@ -6,17 +6,19 @@ and logs performance metrics.
 
 # ─── Standard Library Imports ────────────────────────────────────────────────────
 import yaml
+from functools import partial
 
 # ─── Project Module Imports ──────────────────────────────────────────────────────
-from src.config.paths import TRAINING_PARAMS
+from src.config.paths import TRAINING_PARAMS, DATA_DIR
 from src.data.data_classes import TfidfDataset
+from src.svm.training.shared_memory import shared_grid_search
+from src.svm.training import solvers, evaluation
+from src.svm.training.result_store import ResultStore
 from src.config import logging_config
 
 
 # ─── Third-Party Imports ─────────────────────────────────────────────────────────
 from tqdm import tqdm
-from sklearn.svm import LinearSVC
-from sklearn.metrics import classification_report
 from sklearn.model_selection import GridSearchCV
 
 # ─── Logging Setup ───────────────────────────────────────────────────────────────
@@ -26,27 +28,44 @@ logger = logging_config.configure_logging()
 with open(TRAINING_PARAMS, "r") as f:
     training_params = yaml.load(f, Loader=yaml.FullLoader)
 
+# Default location of the grid-search result store
+RESULT_STORE_PATH = DATA_DIR / "grid_results.sqlite"
 
 
+def open_result_store() -> ResultStore | None:
+    """
+    Open the grid-search result store configured under 'result_store'.
+    Returns:
+        ResultStore or None: The store, or None if it is disabled.
+    """
+    store_params = training_params.get("result_store", {})
+    if not store_params.get("enabled", False):
+        return None
+    return ResultStore(store_params.get("path") or RESULT_STORE_PATH)
+
 
-def train_svm_model(data: TfidfDataset):
+def train_svm_model(data: TfidfDataset, shared_memory: bool | None = None, n_jobs: int | None = None,
+                    solver: str | None = None):
     """
-    Train a LinearSVC model using the provided data.
+    Train a linear SVM model using the provided data.
     Args:
         data (TfidfDataset): The dataset containing training and test data.
+        shared_memory (bool, optional): If True, workers attach to memory-mapped, pre-sliced
+            folds instead of receiving copies of X_train. Defaults to the 'trainer' config.
+            With 'result_store' enabled the fold-level search is always used, so fold
+            results recorded by earlier runs are reused.
+        n_jobs (int, optional): Number of parallel fits. Defaults to the 'trainer' config.
+        solver (str, optional): Solver backend (see solvers.SOLVERS) or 'auto'. Defaults to the 'trainer' config.
     Returns:
-        grid (GridSearchCV): A fitted GridSearchCV object. 
-            - `grid.best_estimator_` gives the best LinearSVC model.
+        grid (GridSearchCV or SharedGridSearch): A fitted grid search object. 
+            - `grid.best_estimator_` gives the best linear SVM model.
             - `grid.best_params_` provides the best hyperparameter combination.
             - `grid.best_score_` contains the best cross-validated score.
             - `grid.predict(...)` can be used to make predictions with the best model. 
+            - `grid.test_metrics_` holds the test-set precision, recall, F1 and accuracy of the best model.
     """
-    logger.info("Starting SVM model training...")
+    logger.info("Starting SVM model training on %s features with shape %s...", data.X_train.dtype, data.X_train.shape)
     
-    # Define SVM model
-    svm = LinearSVC()
-    logger.info("Initialized LinearSVC model.")
-
     # Get grid parameters from training params
     grid_params = training_params.get("grid_search_params", {})
 
@@ -58,22 +77,50 @@ def train_svm_model(data: TfidfDataset):
         "class_weight": grid_params["class_weight"],}
     logger.info("Using parameter grid for Grid Search: %s", param_grid)
 
+    # Get trainer settings from training params
+    trainer_params = training_params.get("trainer", {})
+    cv = trainer_params.get("cv", 3)
+    if n_jobs is None:
+        n_jobs = trainer_params.get("n_jobs", -1)
+    if shared_memory is None:
+        shared_memory = trainer_params.get("shared_memory", False)
+    if solver is None:
+        solver = trainer_params.get("solver", "liblinear")
+
+    # Pick the solver backend, calibrating on a subsample in auto mode
+    if solver == "auto":
+        calibration_params = {name: values[len(values) // 2] for name, values in param_grid.items()}
+        solver = solvers.select_solver(data.X_train, data.y_train, params=calibration_params)
+    svm = solvers.make_estimator(solver)
+    logger.info("Initialized %s SVM model.", solver)
+
     # Grid Search
     tqdm.write("Starting Grid Search...")
-    grid = GridSearchCV(svm, param_grid, cv=3, scoring='f1', n_jobs=-1)
-    grid.fit(data.X_train, data.y_train)
+    store = open_result_store()
+    # Spawn-started joblib workers log next to this run's log file
+    with logging_config.worker_log_environment():
+        if shared_memory or store is not None:
+            # The fold-level search is the one that can skip cells already in the result store
+            logger.info("Running Grid Search on memory-mapped folds%s.", " with the result store" if store else "")
+            try:
+                grid = shared_grid_search(data, param_grid, cv=cv, n_jobs=n_jobs,
+                                          estimator_factory=partial(solvers.make_estimator, solver),
+                                          store=store, solver=solver)
+            finally:
+                if store is not None:
+                    store.close()
+        else:
+            grid = GridSearchCV(svm, param_grid, cv=cv, scoring='f1', n_jobs=n_jobs)
+            grid.fit(data.X_train, data.y_train)
     tqdm.write("Grid Search completed.")
 
     # Write the best parameters to the log file
     logger.info("Best parameters found: %s", grid.best_params_)
 
-    # Evaluate the best model
-    y_pred = grid.predict(data.X_test)
-
-    # Create a classification report and write it to the log file
-    target_names = ["neg", "pos"]
-    report = classification_report(data.y_test, y_pred, target_names=target_names)
-    logger.info("Classification Report:\n%s", report)
+    # Evaluate the best model on the test set and write the report to the log file
+    metrics = evaluation.evaluate_models(data.X_test, data.y_test, [grid.best_estimator_])
+    grid.test_metrics_ = {name: float(values[0]) for name, values in metrics.items()}
+    logger.info("Test-set report (positive class 'pos'):\n%s", evaluation.format_report([data.name], metrics))
 
     return grid
 
@@ -0,0 +1,152 @@
+"""Bounded-memory vocabulary construction for max_features selection.
+
+To keep the max_features most frequent n-grams, TfidfVectorizer first counts every
+distinct n-gram of the corpus into a full vocabulary and count matrix, which for
+ngram_range (1, 3) holds millions of entries only to keep 30k–80k columns. This builder
+selects the same columns in two passes with fixed memory:
+
+1. A streaming pass adds the n-gram occurrences of every chunk of documents to a
+   count-min sketch (depth × width int32 counters, hashed in bulk with NumPy) and keeps
+   the oversample × max_features n-grams with the highest estimates as candidates.
+   Estimates never undercount, so a frequent n-gram can only be missed if enough
+   colliding ones outrank it while it is pruned.
+2. An exact pass counts the candidates only and keeps the top max_features.
+
+The result is handed to the vectorizer as a fixed vocabulary, so its count matrix has
+only the kept columns. Ties at the cut-off are broken by term order, where sklearn's
+unstable argsort may keep other tied n-grams. A fixed vocabulary disables the vectorizer's
+document-frequency limits, and binary counts rank n-grams by document frequency, so only
+the settings in SUPPORTED_PARAMS are accepted.
+"""
+
+# ─── Third-Party Imports ─────────────────────────────────────────────────────────
+import numpy as np
+from sklearn.feature_extraction.text import TfidfVectorizer
+
+# ─── Project Module Imports ──────────────────────────────────────────────────────
+from src.config import logging_config
+
+# ─── Logging Setup ───────────────────────────────────────────────────────────────
+logger = logging_config.configure_logging()
+
+# Vectorizer settings the selection reproduces; others are rejected
+SUPPORTED_PARAMS = {"binary": False, "min_df": 1, "max_df": 1.0, "vocabulary": None}
+
+# Odd multipliers of the multiply-shift hash of every sketch row
+_MULTIPLIERS = np.array([0x9E3779B97F4A7C15, 0xC2B2AE3D27D4EB4F, 0x165667B19E3779F9, 0xD6E8FEB86659FD93,
+                         0xFF51AFD7ED558CCD, 0xC4CEB9FE1A85EC53, 0x94D049BB133111EB, 0xBF58476D1CE4E5B9],
+                        dtype=np.uint64)
+
+
+class CountMinSketch:
+    """
+    Fixed-size frequency estimator over 64-bit item hashes.
+
+    Attributes:
+    - width: Counters per row; a power of two.
+    - depth: Number of independently hashed rows.
+    - table: The (depth, width) int32 counters.
+    """
+
+    def __init__(self, width: int = 2**20, depth: int = 4):
+        if width < 2 or width & (width - 1) or not 1 <= depth <= len(_MULTIPLIERS):
+            raise ValueError(f"width must be a power of two and depth between 1 and {len(_MULTIPLIERS)}")
+        self.width = width
+        self.depth = depth
+        self.table = np.zeros((depth, width), dtype=np.int32)
+        self._shift = np.uint64(64 - (width.bit_length() - 1))
+
+    def _buckets(self, hashes: np.ndarray) -> np.ndarray:
+        """Counter index of every hash in every row, shape (depth, n)."""
+        keys = hashes.astype(np.uint64)
+        return ((keys[None, :] * _MULTIPLIERS[:self.depth, None]) >> self._shift).astype(np.int64)
+
+    def add(self, hashes: np.ndarray, counts: np.ndarray):
+        """
+        Add occurrence counts of distinct items.
+        Args:
+            hashes (np.ndarray): int64 hashes of distinct items.
+            counts (np.ndarray): Occurrences of every item.
+        Returns:
+            None
+        """
+        for row, buckets in enumerate(self._buckets(hashes)):
+            np.add.at(self.table[row], buckets, counts.astype(np.int32))
+
+    def estimate(self, hashes: np.ndarray) -> np.ndarray:
+        """
+        Estimate the counts of items; never below the true count.
+        Args:
+            hashes (np.ndarray): int64 item hashes.
+        Returns:
+            np.ndarray: Estimated count of every item.
+        """
+        buckets = self._buckets(hashes)
+        return np.min(self.table[np.arange(self.depth)[:, None], buckets], axis=0)
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the counters."""
+        return self.table.nbytes
+
+
+def _top(terms: list[str], counts: np.ndarray, k: int) -> list[str]:
+    """The k terms with the highest counts; ties go to the term that sorts first."""
+    if len(terms) <= k:
+        return list(terms)
+    order = sorted(range(len(terms)), key=lambda i: (-counts[i], terms[i]))
+    return [terms[i] for i in order[:k]]
+
+
+def build_vocabulary(docs, vectorizer: TfidfVectorizer, max_features: int, width: int = 2**20, depth: int = 4,
+                     oversample: int = 4, chunk_size: int = 2000) -> dict[str, int]:
+    """
+    Select the max_features most frequent n-grams with a count-min sketch and an exact candidate pass.
+    Args:
+        docs (list): Training texts or token lists; iterated twice.
+        vectorizer (TfidfVectorizer): Provides the analyzer (n-grams, stop words, tokenization).
+        max_features (int): Number of n-grams to keep.
+        width (int): Counters per sketch row; a power of two.
+        depth (int): Sketch rows.
+        oversample (int): Candidates kept per selected n-gram between the passes.
+        chunk_size (int): Documents hashed into the sketch at once.
+    Returns:
+        dict[str, int]: Vocabulary with columns in term order, for TfidfVectorizer(vocabulary=...).
+    """
+    unsupported = {name: getattr(vectorizer, name) for name, value in SUPPORTED_PARAMS.items()
+                   if getattr(vectorizer, name) != value}
+    if unsupported:
+        raise ValueError(f"The sketch vocabulary does not support the vectorizer settings {unsupported}")
+    analyze = vectorizer.build_analyzer()
+    sketch = CountMinSketch(width=width, depth=depth)
+    n_candidates = oversample * max_features
+    candidates = {}
+
+    # Pass 1: estimate frequencies and keep the heaviest n-grams seen so far
+    for start in range(0, len(docs), chunk_size):
+        ngrams = [ngram for doc in docs[start:start + chunk_size] for ngram in analyze(doc)]
+        if not ngrams:
+            continue
+        hashes = np.fromiter(map(hash, ngrams), dtype=np.int64, count=len(ngrams))
+        distinct, first, counts = np.unique(hashes, return_index=True, return_counts=True)
+        sketch.add(distinct, counts)
+        candidates.update(zip([ngrams[i] for i in first], sketch.estimate(distinct).tolist()))
+        if len(candidates) > 2 * n_candidates:
+            terms = list(candidates)
+            estimates = np.fromiter(candidates.values(), dtype=np.int64, count=len(terms))
+            keep = np.argpartition(-estimates, n_candidates)[:n_candidates]
+            candidates = {terms[i]: int(estimates[i]) for i in keep}
+
+    # Pass 2: exact counts of the candidates only
+    exact = dict.fromkeys(_top(list(candidates), np.fromiter(candidates.values(), dtype=np.int64),
+                               n_candidates), 0)
+    for doc in docs:
+        for ngram in analyze(doc):
+            if ngram in exact:
+                exact[ngram] += 1
+
+    terms = list(exact)
+    kept = sorted(_top(terms, np.fromiter(exact.values(), dtype=np.int64, count=len(terms)), max_features))
+    logger.debug("Kept %d of %d candidate n-grams with a %.1f MiB sketch",
+                 len(kept), len(terms), sketch.nbytes / 2**20)
+    return {term: column for column, term in enumerate(kept)}
@@ -0,0 +1,159 @@
+"""Incrementally updatable TF-IDF encoder.
+
+A fitted TfidfVectorizer freezes idf_ at training time, and refreshing it for new reviews
+means fitting on the whole corpus again. IncrementalTfidf keeps the sufficient statistics
+instead: the number of documents and, per vocabulary column, the number of documents
+containing the term. partial_fit adds one pass over a new batch to those counts and idf
+is recomputed from them in O(vocabulary) with sklearn's formula, so after absorbing batch
+B an encoder fitted on A has exactly the idf of a fit on A + B with the same vocabulary.
+
+With a capacity, terms outside the vocabulary can be admitted: a new term joins when it
+occurs in at least min_df documents of one batch (counting starts at admission), and if
+the vocabulary then exceeds the capacity the terms with the lowest document counts are
+evicted. Admission and eviction change the feature columns, so an SVM trained on the old
+columns must be retrained; with capacity=None the vocabulary and columns stay fixed and
+only idf is refreshed.
+"""
+
+# ─── Standard Library Imports ────────────────────────────────────────────────────
+from collections import Counter
+
+# ─── Third-Party Imports ─────────────────────────────────────────────────────────
+import numpy as np
+from scipy.sparse import csr_matrix
+from sklearn.feature_extraction.text import TfidfVectorizer
+
+# ─── Project Module Imports ──────────────────────────────────────────────────────
+from src.data.data_classes import TfidfDataset
+from src.svm.training.feature_selection import rebuild_vectorizer
+from src.config import logging_config
+
+# ─── Logging Setup ───────────────────────────────────────────────────────────────
+logger = logging_config.configure_logging()
+
+
+class IncrementalTfidf:
+    """
+    TF-IDF encoder whose document frequencies absorb new batches without refitting.
+
+    Attributes:
+    - vocabulary_: Term → column mapping.
+    - document_counts_: Number of documents containing each column's term (int64).
+    - n_documents_: Number of documents absorbed.
+    - capacity: Maximum vocabulary size when admitting new terms; None keeps it fixed.
+    - min_df: Documents of one batch a new term must occur in to be admitted.
+    """
+
+    def __init__(self, vectorizer: TfidfVectorizer, document_counts: np.ndarray, n_documents: int,
+                 capacity: int | None = None, min_df: int = 2):
+        if len(document_counts) != len(vectorizer.vocabulary_):
+            raise ValueError(f"Got {len(document_counts)} document counts for {len(vectorizer.vocabulary_)} terms")
+        self.vocabulary_ = dict(vectorizer.vocabulary_)
+        self.document_counts_ = np.asarray(document_counts, dtype=np.int64).copy()
+        self.n_documents_ = int(n_documents)
+        self.capacity = capacity
+        self.min_df = min_df
+        self._base = vectorizer
+        self._vectorizer = None
+
+    @classmethod
+    def from_dataset(cls, data: TfidfDataset, **kwargs) -> "IncrementalTfidf":
+        """
+        Take the document counts from an encoded training matrix, without another pass over the texts.
+        Args:
+            data (TfidfDataset): The encoded dataset; X_train rows are the fitted documents.
+            **kwargs: capacity and min_df.
+        Returns:
+            IncrementalTfidf: The encoder, equivalent to data.vectorizer.
+        """
+        X = csr_matrix(data.X_train)
+        document_counts = np.bincount(X.indices, minlength=X.shape[1])
+        return cls(data.vectorizer, document_counts, X.shape[0], **kwargs)
+
+    @classmethod
+    def from_documents(cls, vectorizer: TfidfVectorizer, docs: list[str], **kwargs) -> "IncrementalTfidf":
+        """
+        Fit a vectorizer on documents and keep its document counts.
+        Args:
+            vectorizer (TfidfVectorizer): An unfitted or fitted vectorizer; it is refitted.
+            docs (list[str]): The documents.
+            **kwargs: capacity and min_df.
+        Returns:
+            IncrementalTfidf: The encoder.
+        """
+        X = vectorizer.fit_transform(docs).tocsr()
+        return cls(vectorizer, np.bincount(X.indices, minlength=X.shape[1]), X.shape[0], **kwargs)
+
+    # ─── Statistics ─────────────────────────────────────────────────────────────
+    @property
+    def idf_(self) -> np.ndarray:
+        """Inverse document frequencies from the current counts, as TfidfTransformer computes them."""
+        smooth = int(self._base.smooth_idf)
+        return np.log((self.n_documents_ + smooth) / (self.document_counts_ + smooth)) + 1.0
+
+    def partial_fit(self, docs: list[str]) -> "IncrementalTfidf":
+        """
+        Absorb a batch of documents into the document counts.
+        Args:
+            docs (list[str]): New documents, as accepted by the vectorizer.
+        Returns:
+            IncrementalTfidf: self.
+        """
+        analyze = self._base.build_analyzer()
+        vocabulary = self.vocabulary_
+        columns, candidates = [], Counter()
+        for doc in docs:
+            for feature in set(analyze(doc)):
+                column = vocabulary.get(feature)
+                if column is not None:
+                    columns.append(column)
+                elif self.capacity is not None:
+                    candidates[feature] += 1
+
+        self.document_counts_ += np.bincount(np.asarray(columns, dtype=np.int64), minlength=len(vocabulary))
+        self.n_documents_ += len(docs)
+        admitted = {term: count for term, count in candidates.items() if count >= self.min_df}
+        if admitted or (self.capacity is not None and len(vocabulary) > self.capacity):
+            self._resize(admitted)
+        self._vectorizer = None
+        logger.debug("Absorbed %d documents; %d new terms admitted, vocabulary of %d",
+                     len(docs), len(admitted), len(self.vocabulary_))
+        return self
+
+    def _resize(self, admitted: dict[str, int]):
+        """Add admitted terms, evict the lowest document counts above capacity and re-sort the columns."""
+        terms = list(self.vocabulary_) + list(admitted)
+        counts = np.concatenate([self.document_counts_[list(self.vocabulary_.values())],
+                                 np.fromiter(admitted.values(), dtype=np.int64, count=len(admitted))])
+        if len(terms) > self.capacity:
+            # Highest counts first; ties keep the term that sorts first
+            order = sorted(range(len(terms)), key=lambda i: (-counts[i], terms[i]))[:self.capacity]
+            logger.debug("Evicting %d low-frequency terms", len(terms) - self.capacity)
+            terms, counts = [terms[i] for i in order], counts[order]
+
+        # Columns in term order, as a fitted vectorizer assigns them
+        order = sorted(range(len(terms)), key=terms.__getitem__)
+        self.vocabulary_ = {terms[i]: column for column, i in enumerate(order)}
+        self.document_counts_ = counts[order]
+
+    # ─── Encoding ───────────────────────────────────────────────────────────────
+    def to_vectorizer(self) -> TfidfVectorizer:
+        """
+        Fitted TfidfVectorizer with the current vocabulary and idf.
+        Returns:
+            TfidfVectorizer: A new vectorizer with the base's settings; the base is not modified.
+        """
+        if self._vectorizer is None:
+            self._vectorizer = rebuild_vectorizer(self._base, dict(self.vocabulary_),
+                                                  self.idf_ if self._base.use_idf else None)
+        return self._vectorizer
+
+    def transform(self, docs: list[str]) -> csr_matrix:
+        """
+        Encode documents with the current vocabulary and idf.
+        Args:
+            docs (list[str]): Documents to encode.
+        Returns:
+            csr_matrix: TF-IDF matrix of shape (len(docs), len(vocabulary_)).
+        """
+        return self.to_vectorizer().transform(docs)
@@ -0,0 +1,212 @@
+"""Vectorized n-gram counting engine for TF-IDF encodings with large n-gram ranges.
+
+sklearn's word analyzer builds every n-gram occurrence as a Python string and counts it
+in a dict, so encoding time grows with the number of n-gram occurrences. This engine maps
+tokens to integer ids once, builds the ids of longer n-grams arithmetically with NumPy
+over the token-id array and counts all occurrences into a CSR matrix in bulk. Strings are
+built once per distinct n-gram, only to order the vocabulary like sklearn does.
+
+The code of an n-gram is derived from the rank of its (n-1)-gram prefix and its last
+token, code = prefix * n_tokens + token, so codes stay far below the int64 range for any
+n-gram length and vocabulary size.
+
+The fitted vocabulary, idf and matrices are identical to TfidfVectorizer's, including the
+max_features tie-breaking and the in-row entry order of fit_transform, and the wrapped
+vectorizer ends up as a regular fitted TfidfVectorizer for saving and inference.
+"""
+
+# ─── Third-Party Imports ─────────────────────────────────────────────────────────
+import numpy as np
+import scipy.sparse as sp
+from sklearn.feature_extraction.text import TfidfTransformer, TfidfVectorizer
+
+# ─── Project Module Imports ──────────────────────────────────────────────────────
+from src.config import logging_config
+
+# ─── Logging Setup ───────────────────────────────────────────────────────────────
+logger = logging_config.configure_logging()
+
+# Vectorizer settings the engine reproduces; anything else needs sklearn's own counting
+SUPPORTED_PARAMS = {"analyzer": "word", "binary": False, "min_df": 1, "max_df": 1.0, "vocabulary": None}
+
+
+def _positions(lengths: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Document index and number of tokens left in the document for every token position."""
+    rows = np.repeat(np.arange(len(lengths)), lengths)
+    doc_starts = np.repeat(np.cumsum(lengths) - lengths, lengths)
+    remaining = np.repeat(lengths, lengths) - (np.arange(len(rows)) - doc_starts)
+    return rows, remaining
+
+
+def _lookup(sorted_codes: np.ndarray, codes: np.ndarray) -> np.ndarray:
+    """Index of every code in a sorted code array, -1 where it is absent."""
+    if len(sorted_codes) == 0:
+        return np.full(len(codes), -1, dtype=np.int64)
+    index = np.minimum(np.searchsorted(sorted_codes, codes), len(sorted_codes) - 1)
+    return np.where((sorted_codes[index] == codes) & (codes >= 0), index, -1)
+
+
+class NgramCounter:
+    """
+    Drop-in fit_transform/transform for a word-level TfidfVectorizer.
+
+    Attributes:
+    - vectorizer: The wrapped TfidfVectorizer; fit_transform fits it in place.
+    - unigrams_: Token → id of every training token left after stop-word removal.
+    """
+
+    def __init__(self, vectorizer: TfidfVectorizer):
+        unsupported = {name: getattr(vectorizer, name) for name, value in SUPPORTED_PARAMS.items()
+                       if getattr(vectorizer, name) != value}
+        if unsupported:
+            raise ValueError(f"NgramCounter does not support the vectorizer settings {unsupported}")
+        self.vectorizer = vectorizer
+        self.unigrams_ = {}
+        self._prefixes = {}  # n → sorted codes of every training n-gram, to rank prefixes of (n+1)-grams
+        self._features = {}  # n → (sorted codes of the kept n-grams, their columns)
+
+    def _token_ids(self, docs, grow: bool) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Tokenize like the word analyzer and map the tokens to ids.
+        Args:
+            docs (iterable): Texts or token lists, as accepted by the vectorizer.
+            grow (bool): Add unseen tokens to unigrams_; otherwise they map to -1.
+        Returns:
+            tuple[np.ndarray, np.ndarray]: Concatenated token ids and the number of tokens per document.
+        """
+        v = self.vectorizer
+        preprocess, tokenize, stop_words = v.build_preprocessor(), v.build_tokenizer(), v.get_stop_words()
+        lookup = self.unigrams_
+        ids, lengths = [], []
+        for doc in docs:
+            tokens = tokenize(preprocess(v.decode(doc)))
+            if stop_words:
+                tokens = [token for token in tokens if token not in stop_words]
+            if grow:
+                ids.extend([lookup.setdefault(token, len(lookup)) for token in tokens])
+            else:
+                ids.extend([lookup.get(token, -1) for token in tokens])
+            lengths.append(len(tokens))
+        return np.array(ids, dtype=np.int64), np.array(lengths, dtype=np.int64)
+
+    def fit_transform(self, docs) -> sp.csr_matrix:
+        """
+        Learn the vocabulary and idf and return the TF-IDF matrix of the training documents.
+        Args:
+            docs (iterable): Training texts or token lists.
+        Returns:
+            csr_matrix: The same matrix as vectorizer.fit_transform(docs).
+        """
+        v = self.vectorizer
+        min_n, max_n = v.ngram_range
+        self.unigrams_, self._prefixes, self._features = {}, {}, {}
+        ids, lengths = self._token_ids(docs, grow=True)
+        n_tokens = len(self.unigrams_)
+        if n_tokens == 0:
+            raise ValueError("empty vocabulary; perhaps the documents only contain stop words")
+        rows, remaining = _positions(lengths)
+        tokens = np.array(list(self.unigrams_), dtype=object)
+
+        # One level per n-gram length: distinct codes, their strings, counts and first occurrences
+        levels = []
+        prefix, names = ids, tokens
+        for n in range(1, max_n + 1):
+            starts = np.flatnonzero(remaining >= n)
+            codes = ids[starts] if n == 1 else prefix[starts] * n_tokens + ids[starts + n - 1]
+            uniq, first, types = np.unique(codes, return_index=True, return_inverse=True)
+            if n > 1:
+                names = names[uniq // n_tokens] + " " + tokens[uniq % n_tokens]
+            if n >= min_n:
+                levels.append({"n": n, "codes": uniq, "names": names, "rows": rows[starts], "types": types,
+                               "counts": np.bincount(types, minlength=len(uniq)),
+                               "first_row": rows[starts[first]], "first_pos": starts[first]})
+            if n < max_n:
+                self._prefixes[n] = uniq
+                prefix = np.zeros(len(ids), dtype=np.int64)
+                prefix[starts] = types
+
+        offsets = np.cumsum([0] + [len(level["codes"]) for level in levels])
+        names = np.concatenate([level["names"] for level in levels])
+        counts = np.concatenate([level["counts"] for level in levels])
+
+        # Vocabulary in term order, cut to max_features exactly like CountVectorizer._limit_features
+        terms = names.tolist()
+        order = np.array(sorted(range(len(terms)), key=terms.__getitem__), dtype=np.int64)
+        kept = np.arange(len(names))
+        if v.max_features is not None and len(names) > v.max_features:
+            kept = np.sort((-counts[order].astype(v.dtype)).argsort()[:v.max_features])
+        kept = order[kept]
+        column = np.full(len(names), -1, dtype=np.int64)
+        column[kept] = np.arange(len(kept))
+        for level, start in zip(levels, offsets):
+            level_columns = column[start:start + len(level["codes"])]
+            mask = level_columns >= 0
+            self._features[level["n"]] = (level["codes"][mask], level_columns[mask])
+
+        # CountVectorizer leaves each row in order of first occurrence in the corpus; keep it
+        first = np.lexsort((
+            np.concatenate([level["first_pos"] for level in levels]),
+            np.concatenate([np.full(len(level["codes"]), level["n"]) for level in levels]),
+            np.concatenate([level["first_row"] for level in levels]),
+        ))
+        by_first = first[column[first] >= 0]
+        rank = np.full(len(names), -1, dtype=np.int64)
+        rank[by_first] = np.arange(len(by_first))
+
+        X = sp.csr_matrix((len(lengths), len(kept)), dtype=v.dtype)
+        for level, start in zip(levels, offsets):
+            level_rank = rank[start + level["types"]]
+            mask = level_rank >= 0
+            X = X + sp.csr_matrix((np.ones(mask.sum(), dtype=v.dtype), (level["rows"][mask], level_rank[mask])),
+                                  shape=X.shape)
+        X.sum_duplicates()
+        X = sp.csr_matrix((X.data, column[by_first][X.indices].astype(X.indices.dtype), X.indptr), shape=X.shape)
+
+        v.vocabulary_ = {terms[i]: j for j, i in enumerate(kept.tolist())}
+        v.fixed_vocabulary_ = False
+        v._tfidf = TfidfTransformer(norm=v.norm, use_idf=v.use_idf, smooth_idf=v.smooth_idf,
+                                    sublinear_tf=v.sublinear_tf)
+        v._tfidf.fit(X)
+        logger.debug("Counted %d distinct n-grams over %d tokens; kept %d", len(names), len(ids), len(kept))
+        return v._tfidf.transform(X, copy=False)
+
+    def transform(self, docs) -> sp.csr_matrix:
+        """
+        Encode documents with the fitted vocabulary and idf.
+        Args:
+            docs (iterable): Texts or token lists.
+        Returns:
+            csr_matrix: The same matrix as vectorizer.transform(docs).
+        """
+        v = self.vectorizer
+        if not self._features:
+            raise ValueError("NgramCounter is not fitted; call fit_transform first")
+        min_n, max_n = v.ngram_range
+        n_tokens = len(self.unigrams_)
+        ids, lengths = self._token_ids(docs, grow=False)
+        rows, remaining = _positions(lengths)
+
+        row_parts, column_parts = [], []
+        prefix = ids
+        for n in range(1, max_n + 1):
+            starts = np.flatnonzero(remaining >= n)
+            if n == 1:
+                codes = ids
+            else:
+                head, tail = prefix[starts], ids[starts + n - 1]
+                codes = np.where((head >= 0) & (tail >= 0), head * n_tokens + tail, -1)
+            if n >= min_n:
+                feature_codes, feature_columns = self._features[n]
+                index = _lookup(feature_codes, codes)
+                mask = index >= 0
+                row_parts.append(rows[starts[mask]])
+                column_parts.append(feature_columns[index[mask]])
+            if 1 < n < max_n:
+                prefix = np.full(len(ids), -1, dtype=np.int64)
+                prefix[starts] = _lookup(self._prefixes[n], codes)
+
+        row_index, column_index = np.concatenate(row_parts), np.concatenate(column_parts)
+        X = sp.csr_matrix((np.ones(len(row_index), dtype=v.dtype), (row_index, column_index)),
+                          shape=(len(lengths), len(v.vocabulary_)))
+        X.sum_duplicates()
+        return v._tfidf.transform(X, copy=False)
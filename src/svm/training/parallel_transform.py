@@ -0,0 +1,148 @@
+"""Chunked parallel transform with a fitted vectorizer.
+
+Once fitted, TfidfVectorizer.transform (and NgramCounter.transform) is stateless, so a
+large document list can be split into chunks and encoded by a pool of worker processes.
+The fitted transformer is handed to every worker once, through the pool initializer
+(inherited without pickling where workers are forked), and each task only carries its
+chunk of documents. The CSR pieces come back in input order and are stacked by
+concatenating their arrays, without the COO round trip of a generic sparse vstack.
+
+Inputs smaller than two chunks, or a single effective job, are transformed in-process.
+"""
+
+# ─── Standard Library Imports ────────────────────────────────────────────────────
+import math
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+# ─── Third-Party Imports ─────────────────────────────────────────────────────────
+import numpy as np
+import scipy.sparse as sp
+from joblib import effective_n_jobs
+
+# ─── Project Module Imports ──────────────────────────────────────────────────────
+from src.config import logging_config
+
+# ─── Logging Setup ───────────────────────────────────────────────────────────────
+logger = logging_config.configure_logging()
+
+# Chunks per worker, so a slow chunk does not leave the other workers idle at the end
+CHUNKS_PER_WORKER = 4
+
+# Smallest chunk worth a round trip to a worker
+MIN_CHUNK_SIZE = 256
+
+# Fitted transformer of a worker process, set once by the pool initializer
+_WORKER_TRANSFORMER = {}
+
+
+def _set_transformer(transformer):
+    """Pool initializer: keep the fitted transformer for all chunks of this worker."""
+    _WORKER_TRANSFORMER["transformer"] = transformer
+
+
+def _transform_chunk(docs: list) -> sp.csr_matrix:
+    """Transform one chunk with the worker's transformer."""
+    return _WORKER_TRANSFORMER["transformer"].transform(docs).tocsr()
+
+
+def stack_csr(pieces: list[sp.csr_matrix]) -> sp.csr_matrix:
+    """
+    Stack CSR matrices with the same number of columns row-wise.
+    Args:
+        pieces (list[csr_matrix]): The matrices in row order.
+    Returns:
+        csr_matrix: The stacked matrix; int32 indices if they fit, as scipy would choose.
+    """
+    if len(pieces) == 1:
+        return pieces[0]
+    n_columns = pieces[0].shape[1]
+    nnz = np.cumsum([0] + [piece.nnz for piece in pieces])
+    index_dtype = np.int32 if max(nnz[-1], n_columns) <= np.iinfo(np.int32).max else np.int64
+
+    indptr = np.empty(sum(piece.shape[0] for piece in pieces) + 1, dtype=index_dtype)
+    indptr[0] = 0
+    row = 0
+    for piece, offset in zip(pieces, nnz):
+        n_rows = piece.shape[0]
+        np.add(piece.indptr[1:], offset, out=indptr[row + 1:row + n_rows + 1], casting="unsafe")
+        row += n_rows
+    data = np.concatenate([piece.data for piece in pieces])
+    indices = np.concatenate([piece.indices for piece in pieces]).astype(index_dtype, copy=False)
+    return sp.csr_matrix((data, indices, indptr), shape=(row, n_columns))
+
+
+class ParallelTransformer:
+    """
+    Worker pool transforming chunks of documents with one fitted transformer.
+
+    Attributes:
+    - transformer: The fitted vectorizer (anything with a stateless transform).
+    - n_jobs: Number of worker processes.
+    - chunk_size: Documents per task; derived from the input size if None.
+    """
+
+    def __init__(self, transformer, n_jobs: int = -1, chunk_size: int | None = None):
+        self.transformer = transformer
+        self.n_jobs = effective_n_jobs(n_jobs)
+        self.chunk_size = chunk_size
+        self._pool = None
+
+    def _chunks(self, docs: list) -> list[list]:
+        """Split documents into ordered chunks."""
+        size = self.chunk_size or max(MIN_CHUNK_SIZE, math.ceil(len(docs) / (self.n_jobs * CHUNKS_PER_WORKER)))
+        return [docs[i:i + size] for i in range(0, len(docs), size)]
+
+    def transform(self, docs) -> sp.csr_matrix:
+        """
+        Transform documents in parallel chunks.
+        Args:
+            docs (list): Texts or token lists, as accepted by the transformer.
+        Returns:
+            csr_matrix: The same matrix as transformer.transform(docs).
+        """
+        docs = list(docs)
+        chunks = self._chunks(docs)
+        if self.n_jobs == 1 or len(chunks) < 2:
+            return self.transformer.transform(docs).tocsr()
+
+        if self._pool is None:
+            # Forked workers inherit the transformer; elsewhere it is pickled once per worker
+            method = "fork" if "fork" in multiprocessing.get_all_start_methods() else None
+            self._pool = ProcessPoolExecutor(max_workers=self.n_jobs, mp_context=multiprocessing.get_context(method),
+                                             initializer=_set_transformer, initargs=(self.transformer,))
+        logger.debug("Transforming %d documents in %d chunks on %d workers", len(docs), len(chunks), self.n_jobs)
+        # Workers are started on demand while tasks are submitted
+        with logging_config.worker_log_environment():
+            return stack_csr(list(self._pool.map(_transform_chunk, chunks)))
+
+    def close(self):
+        """
+        Shut down the worker pool.
+        Returns:
+            None
+        """
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    def __enter__(self) -> "ParallelTransformer":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def parallel_transform(transformer, docs, n_jobs: int = -1, chunk_size: int | None = None) -> sp.csr_matrix:
+    """
+    Transform documents with a fitted transformer on a temporary worker pool.
+    Args:
+        transformer: The fitted vectorizer (TfidfVectorizer or NgramCounter).
+        docs (list): Texts or token lists.
+        n_jobs (int): Number of worker processes; -1 uses all cores.
+        chunk_size (int, optional): Documents per task.
+    Returns:
+        csr_matrix: The same matrix as transformer.transform(docs).
+    """
+    with ParallelTransformer(transformer, n_jobs=n_jobs, chunk_size=chunk_size) as pool:
+        return pool.transform(docs)
@@ -0,0 +1,232 @@
+"""Persistent store of grid-search fold results for incremental grid extension.
+
+Every fold fit of the SVM grid search is recorded in a SQLite database, keyed by a
+fingerprint of the encoded training set and its CV splitter, the solver backend, the
+SVM hyperparameters and the fold. A search then only fits the (candidate, fold) cells
+missing from the store, so adding C=4 to grid_search_params fits only the new cells,
+and unchanged encodings are not re-searched at all.
+
+The store also answers cost/accuracy questions across all recorded searches: mean CV
+F1, total fit time and convergence of every candidate, and the candidates on the
+accuracy/fit-time Pareto front.
+"""
+
+# ─── Standard Library Imports ────────────────────────────────────────────────────
+import json
+import time
+import sqlite3
+import hashlib
+from pathlib import Path
+
+# ─── Third-Party Imports ─────────────────────────────────────────────────────────
+import numpy as np
+from sklearn.model_selection import check_cv
+
+# ─── Project Module Imports ──────────────────────────────────────────────────────
+from src.config import logging_config
+
+# ─── Logging Setup ───────────────────────────────────────────────────────────────
+logger = logging_config.configure_logging()
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS encodings (
+    fingerprint TEXT PRIMARY KEY,
+    name        TEXT,
+    n_samples   INTEGER,
+    n_features  INTEGER,
+    recorded    REAL
+);
+CREATE TABLE IF NOT EXISTS fold_results (
+    fingerprint TEXT NOT NULL,
+    solver      TEXT NOT NULL,
+    params      TEXT NOT NULL,
+    fold        INTEGER NOT NULL,
+    n_folds     INTEGER NOT NULL,
+    score       REAL NOT NULL,
+    fit_time    REAL NOT NULL,
+    converged   INTEGER NOT NULL,
+    recorded    REAL NOT NULL,
+    PRIMARY KEY (fingerprint, solver, params, n_folds, fold)
+);
+"""
+
+
+def params_key(params: dict) -> str:
+    """
+    Canonical text of a hyperparameter combination.
+    Args:
+        params (dict): SVM hyperparameters.
+    Returns:
+        str: JSON with sorted keys; tuples and NumPy scalars are stored as plain values.
+    """
+    return json.dumps(params, sort_keys=True, default=lambda value: value.item() if hasattr(value, "item") else str(value))
+
+
+def encoding_fingerprint(X, y, cv=3) -> str:
+    """
+    Fingerprint of an encoded training set and the folds it is split into.
+    Args:
+        X (csr_matrix): The training matrix.
+        y (np.ndarray): The training labels.
+        cv (int or cross-validation generator): Cross-validation strategy of the search.
+    Returns:
+        str: Hex digest over the matrix contents, the labels and the splitter.
+    """
+    X = X.tocsr()
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(repr((X.shape, str(X.dtype))).encode())
+    for array in (X.indptr, X.indices, X.data, np.asarray(y)):
+        digest.update(np.ascontiguousarray(array).view(np.uint8))
+    digest.update(repr(check_cv(cv, np.asarray(y), classifier=True)).encode())
+    return digest.hexdigest()
+
+
+class ResultStore:
+    """
+    SQLite-backed record of grid-search fold results.
+
+    Attributes:
+    - path: Location of the database file.
+    """
+
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # Parallel grid searches of the scheduler may write at the same time
+        self._connection = sqlite3.connect(self.path, timeout=60)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.executescript(_SCHEMA)
+
+    def close(self):
+        """
+        Close the database connection.
+        Returns:
+            None
+        """
+        self._connection.close()
+
+    def __enter__(self) -> "ResultStore":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def record_encoding(self, fingerprint: str, name: str, n_samples: int, n_features: int):
+        """
+        Remember the name and shape of an encoding for reports.
+        Args:
+            fingerprint (str): The encoding fingerprint.
+            name (str): Name of the encoded dataset.
+            n_samples (int): Number of training samples.
+            n_features (int): Number of features.
+        Returns:
+            None
+        """
+        with self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO encodings VALUES (?, ?, ?, ?, ?)",
+                (fingerprint, name, int(n_samples), int(n_features), time.time()),
+            )
+
+    def fold_results(self, fingerprint: str, solver: str, candidates: list[dict], n_folds: int) -> dict:
+        """
+        Recorded results of a grid on one encoding.
+        Args:
+            fingerprint (str): The encoding fingerprint.
+            solver (str): The solver backend.
+            candidates (list[dict]): Hyperparameter combinations of the grid.
+            n_folds (int): Number of CV folds.
+        Returns:
+            dict: (candidate index, fold) → {'score', 'fit_time', 'converged'} for every recorded cell.
+        """
+        index = {params_key(params): i for i, params in enumerate(candidates)}
+        rows = self._connection.execute(
+            "SELECT params, fold, score, fit_time, converged FROM fold_results "
+            "WHERE fingerprint = ? AND solver = ? AND n_folds = ?",
+            (fingerprint, solver, n_folds),
+        )
+        return {
+            (index[key], fold): {"score": score, "fit_time": fit_time, "converged": bool(converged)}
+            for key, fold, score, fit_time, converged in rows if key in index
+        }
+
+    def record_folds(self, fingerprint: str, solver: str, n_folds: int, results: list[tuple[dict, int, dict]]):
+        """
+        Record the results of fitted cells in one transaction.
+        Args:
+            fingerprint (str): The encoding fingerprint.
+            solver (str): The solver backend.
+            n_folds (int): Number of CV folds.
+            results (list[tuple[dict, int, dict]]): (params, fold, {'score', 'fit_time', 'converged'}) per cell.
+        Returns:
+            None
+        """
+        now = time.time()
+        with self._connection:
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO fold_results VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                [(fingerprint, solver, params_key(params), fold, n_folds, float(result["score"]),
+                  float(result["fit_time"]), int(result["converged"]), now)
+                 for params, fold, result in results],
+            )
+
+    def summary(self, fingerprint: str | None = None, solver: str | None = None) -> list[dict]:
+        """
+        Cost and accuracy of every fully recorded candidate, best mean score first.
+        Args:
+            fingerprint (str, optional): Restrict to one encoding.
+            solver (str, optional): Restrict to one solver backend.
+        Returns:
+            list[dict]: Encoding name and fingerprint, solver, params, n_folds, mean_score,
+                std_score, total_fit_time and whether every fold converged.
+        """
+        rows = self._connection.execute(
+            """
+            SELECT r.fingerprint, e.name, r.solver, r.params, r.n_folds,
+                   AVG(r.score), AVG(r.score * r.score), SUM(r.fit_time), MIN(r.converged), COUNT(*)
+            FROM fold_results r LEFT JOIN encodings e ON e.fingerprint = r.fingerprint
+            WHERE (? IS NULL OR r.fingerprint = ?) AND (? IS NULL OR r.solver = ?)
+            GROUP BY r.fingerprint, r.solver, r.params, r.n_folds
+            HAVING COUNT(*) = r.n_folds
+            ORDER BY AVG(r.score) DESC, SUM(r.fit_time) ASC
+            """,
+            (fingerprint, fingerprint, solver, solver),
+        )
+        return [{
+            "fingerprint": fp, "encoding": name, "solver": solver_name, "params": json.loads(params),
+            "n_folds": n_folds, "mean_score": mean, "std_score": float(np.sqrt(max(mean_sq - mean * mean, 0.0))),
+            "total_fit_time": fit_time, "converged": bool(converged),
+        } for fp, name, solver_name, params, n_folds, mean, mean_sq, fit_time, converged, _ in rows]
+
+    def pareto_front(self, fingerprint: str | None = None, solver: str | None = None) -> list[dict]:
+        """
+        Candidates no other candidate beats on both mean score and total fit time.
+        Args:
+            fingerprint (str, optional): Restrict to one encoding.
+            solver (str, optional): Restrict to one solver backend.
+        Returns:
+            list[dict]: Summary rows on the front, best mean score first.
+        """
+        front, cheapest = [], float("inf")
+        for row in self.summary(fingerprint, solver):
+            # Rows arrive by falling score, so a row is on the front iff it is cheaper than all better ones
+            if row["total_fit_time"] < cheapest:
+                front.append(row)
+                cheapest = row["total_fit_time"]
+        return front
+
+
+def format_summary(rows: list[dict]) -> str:
+    """
+    Format summary or pareto_front rows as a table.
+    Args:
+        rows (list[dict]): Output of ResultStore.summary or ResultStore.pareto_front.
+    Returns:
+        str: The report.
+    """
+    lines = [f"{'encoding':<40} {'solver':<16} {'mean_f1':>8} {'std':>7} {'fit_s':>9} {'conv':>5}  params"]
+    for row in rows:
+        lines.append(f"{(row['encoding'] or row['fingerprint'][:12]):<40} {row['solver']:<16} "
+                     f"{row['mean_score']:>8.4f} {row['std_score']:>7.4f} {row['total_fit_time']:>9.2f} "
+                     f"{'yes' if row['converged'] else 'no':>5}  {params_key(row['params'])}")
+    return "\n".join(lines)
@@ -0,0 +1,257 @@
+"""Global CPU and memory scheduler for the encoder × SVM grid.
+
+Encoding and SVM fitting are both submitted as tasks with an estimated number of cores
+and bytes of memory. The scheduler admits tasks only while the sum of running estimates
+stays within the core budget and the memory ceiling, pins the native thread pools
+(BLAS/OpenMP) and joblib of every task to its allocated cores, and schedules the
+follow-up training task of an encoding as soon as that encoding is saved. This replaces
+the nested encode-all-then-train-all loops whose inner n_jobs=-1 grid searches
+oversubscribed the machine.
+"""
+
+# ─── Standard Library Imports ────────────────────────────────────────────────────
+import os
+import time
+import multiprocessing
+from pathlib import Path
+from dataclasses import dataclass, field
+from typing import Callable
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+
+# ─── Third-Party Imports ─────────────────────────────────────────────────────────
+import numpy as np
+from joblib import parallel_config
+from threadpoolctl import threadpool_limits
+
+# ─── Project Module Imports ──────────────────────────────────────────────────────
+from src.data import data_loader
+from src.config import logging_config
+from src.config.paths import ENCODED_DATA_DIR
+
+# ─── Logging Setup ───────────────────────────────────────────────────────────────
+logger = logging_config.configure_logging()
+
+# Rough per-unit costs behind the memory estimates
+_BYTES_PER_TOKEN_ORDER = 64     # vocabulary entry, feature id and count per n-gram during fit
+_BYTES_PER_NNZ = 12             # float64 value + int32 index of the stored matrix
+_FIT_BYTES_PER_NNZ = 28         # fold slice and liblinear's internal copy per concurrent fit
+_CHARS_PER_TOKEN = 5
+
+# Corpus shared with forked workers by the pool initializer
+_CORPUS = {}
+
+
+@dataclass
+class Task:
+    """
+    Unit of work with its resource estimate.
+
+    Attributes:
+    - name: Identifier used as key of the result.
+    - fn: Picklable callable executed in a worker process.
+    - args, kwargs: Arguments of fn.
+    - cpus: Number of cores the task may use.
+    - memory_bytes: Estimated peak memory of the task.
+    - priority: Lower values are admitted first among fitting tasks.
+    - on_done: Optional callback mapping the result to follow-up tasks.
+    """
+    name: str
+    fn: Callable
+    args: tuple = ()
+    kwargs: dict = field(default_factory=dict)
+    cpus: int = 1
+    memory_bytes: int = 0
+    priority: int = 0
+    on_done: Callable | None = None
+
+
+def _run_pinned(fn: Callable, args: tuple, kwargs: dict, cpus: int):
+    """Run fn with native thread pools and joblib limited to the allocated cores."""
+    # Threads instead of nested worker processes: liblinear releases the GIL
+    with threadpool_limits(limits=cpus), parallel_config(backend="threading", n_jobs=cpus):
+        return fn(*args, **kwargs)
+
+
+def _set_corpus(train_set, test_set):
+    """Pool initializer: make the datasets available to forked workers without pickling per task."""
+    _CORPUS["train"] = train_set
+    _CORPUS["test"] = test_set
+
+
+class ResourceScheduler:
+    """
+    Run tasks in worker processes within a core budget and a memory ceiling.
+
+    Attributes:
+    - max_cpus: Cores shared by all running tasks.
+    - memory_limit_bytes: Ceiling on the summed memory estimates of running tasks (None: no limit).
+    - peak_cpus, peak_memory_bytes: Highest concurrent allocation observed.
+    """
+
+    def __init__(self, max_cpus: int | None = None, memory_limit_bytes: int | None = None,
+                 initializer: Callable | None = None, initargs: tuple = ()):
+        self.max_cpus = max_cpus or os.cpu_count() or 1
+        self.memory_limit_bytes = memory_limit_bytes
+        self.peak_cpus = 0
+        self.peak_memory_bytes = 0
+        self._initializer = initializer
+        self._initargs = initargs
+        self._pending: list[Task] = []
+
+    def submit(self, task: Task):
+        """
+        Queue a task; it starts once its resources are free.
+        Args:
+            task (Task): The task to queue.
+        Returns:
+            None
+        """
+        # A task never gets more cores than the budget
+        task.cpus = max(1, min(task.cpus, self.max_cpus))
+        self._pending.append(task)
+
+    def _fits(self, task: Task, used_cpus: int, used_memory: int) -> bool:
+        """Check whether a task fits next to the running ones."""
+        if used_cpus + task.cpus > self.max_cpus:
+            return False
+        return self.memory_limit_bytes is None or used_memory + task.memory_bytes <= self.memory_limit_bytes
+
+    def run(self) -> dict:
+        """
+        Run all queued tasks and their follow-ups to completion.
+        Returns:
+            dict: Result of every task by task name.
+        """
+        results = {}
+        running = {}
+        used_cpus, used_memory = 0, 0
+
+        context = multiprocessing.get_context("fork")
+        with ProcessPoolExecutor(max_workers=self.max_cpus, mp_context=context,
+                                 initializer=self._initializer, initargs=self._initargs) as pool:
+            while self._pending or running:
+                # Admit every pending task that fits, lowest priority value first
+                self._pending.sort(key=lambda t: t.priority)
+                for task in list(self._pending):
+                    fits = self._fits(task, used_cpus, used_memory)
+                    if not fits and not running:
+                        # An oversized task still runs, but alone
+                        logger.warning("Task %s needs %.1f MiB, above the memory limit; running it alone",
+                                       task.name, task.memory_bytes / 2**20)
+                        fits = True
+                    if not fits:
+                        continue
+
+                    self._pending.remove(task)
+                    future = pool.submit(_run_pinned, task.fn, task.args, task.kwargs, task.cpus)
+                    running[future] = (task, time.perf_counter())
+                    used_cpus += task.cpus
+                    used_memory += task.memory_bytes
+                    self.peak_cpus = max(self.peak_cpus, used_cpus)
+                    self.peak_memory_bytes = max(self.peak_memory_bytes, used_memory)
+                    logger.info("Started %s on %d core(s), est. %.1f MiB (in use: %d cores, %.1f MiB)",
+                                task.name, task.cpus, task.memory_bytes / 2**20, used_cpus, used_memory / 2**20)
+
+                # Wait for the next task to finish and release its resources
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    task, start = running.pop(future)
+                    used_cpus -= task.cpus
+                    used_memory -= task.memory_bytes
+                    results[task.name] = future.result()
+                    logger.info("Finished %s in %.2fs", task.name, time.perf_counter() - start)
+                    if task.on_done is not None:
+                        for follow_up in task.on_done(results[task.name]):
+                            self.submit(follow_up)
+
+        return results
+
+
+def estimate_encode_memory(texts: list[str], ngram_range: tuple[int, int]) -> int:
+    """
+    Estimate the peak memory of fitting a TF-IDF vectorizer.
+    Args:
+        texts (list[str]): The training texts.
+        ngram_range (tuple[int, int]): The n-gram range of the vectorizer.
+    Returns:
+        int: Estimated bytes.
+    """
+    tokens = sum(len(text) for text in texts) / _CHARS_PER_TOKEN
+    orders = ngram_range[1] - ngram_range[0] + 1
+    return int(tokens * orders * _BYTES_PER_TOKEN_ORDER)
+
+
+def estimate_train_memory(nnz: int, cpus: int) -> int:
+    """
+    Estimate the peak memory of a grid search on an encoded training matrix.
+    Args:
+        nnz (int): Number of stored values of the training matrix.
+        cpus (int): Number of concurrent fits.
+    Returns:
+        int: Estimated bytes.
+    """
+    return int(nnz * _BYTES_PER_NNZ + cpus * nnz * _FIT_BYTES_PER_NNZ)
+
+
+def _encode_task(param_dict: dict, fs_params: dict | None, dtype, directory: Path) -> tuple:
+    """Encode the shared corpus with one parameter combination and save it; return its location."""
+    from src.svm.training.vectorizer import encode_and_save
+
+    name, data_set, param_dict, path = encode_and_save(
+        _CORPUS["train"], _CORPUS["test"], param_dict, fs_params=fs_params, dtype=dtype, directory=directory,
+        transform_n_jobs=1,  # encode tasks hold a single core of the budget
+    )
+    return name, path, param_dict, int(data_set.X_train.nnz)
+
+
+def _train_task(path: Path, cpus: int):
+    """Grid-search an SVM on a saved encoding with the allocated number of jobs."""
+    from src.svm.training.gridsearch_trainer import train_svm_model
+
+    return train_svm_model(data_loader.load_encoded_dataset_joblib(path), n_jobs=cpus)
+
+
+def run_encoder_grid(train_set, test_set, combinations: list[dict], fs_params: dict | None = None,
+                     dtype=np.float64, max_cpus: int | None = None, memory_limit_bytes: int | None = None,
+                     train_cpus: int | None = None, directory: Path = ENCODED_DATA_DIR) -> dict:
+    """
+    Encode and grid-search every vectorizer combination under one resource budget.
+    Args:
+        train_set (sklearn.utils.Bunch): The training dataset.
+        test_set (sklearn.utils.Bunch): The test dataset.
+        combinations (list[dict]): TF-IDF parameter combinations.
+        fs_params (dict, optional): The 'feature_selection' config.
+        dtype (np.dtype): Precision of the encodings.
+        max_cpus (int, optional): Core budget; all cores by default.
+        memory_limit_bytes (int, optional): Memory ceiling; no limit by default.
+        train_cpus (int, optional): Cores per grid search; half the budget by default.
+        directory (Path): Directory of the saved encodings.
+    Returns:
+        dict: (grid, param_dict, path) of every encoding by encoding name.
+    """
+    scheduler = ResourceScheduler(max_cpus=max_cpus, memory_limit_bytes=memory_limit_bytes,
+                                  initializer=_set_corpus, initargs=(train_set, test_set))
+    train_cpus = train_cpus or max(1, scheduler.max_cpus // 2)
+    encoded = {}
+
+    def schedule_training(result):
+        name, path, param_dict, nnz = result
+        encoded[name] = (param_dict, path)
+        # Training frees memory sooner than further encodings, so it goes first
+        return [Task(name=f"train:{name}", fn=_train_task, args=(path, train_cpus), cpus=train_cpus,
+                     memory_bytes=estimate_train_memory(nnz, train_cpus), priority=0)]
+
+    for i, param_dict in enumerate(combinations):
+        scheduler.submit(Task(
+            name=f"encode:{i}", fn=_encode_task, args=(param_dict, fs_params, dtype, directory), cpus=1,
+            memory_bytes=estimate_encode_memory(train_set.data, param_dict.get("ngram_range", (1, 1))),
+            priority=1, on_done=schedule_training,
+        ))
+
+    logger.info("Scheduling %d encodings on %d cores (memory limit: %s)", len(combinations), scheduler.max_cpus,
+                "none" if memory_limit_bytes is None else f"{memory_limit_bytes / 2**30:.1f} GiB")
+    results = scheduler.run()
+    logger.info("Scheduler peak allocation: %d cores, %.1f MiB estimated", scheduler.peak_cpus,
+                scheduler.peak_memory_bytes / 2**20)
+
+    return {name: (results[f"train:{name}"], param_dict, path) for name, (param_dict, path) in encoded.items()}
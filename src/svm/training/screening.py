@@ -0,0 +1,106 @@
+"""Cheap screening pass that prunes the encoder grid before the full SVM grid search.
+
+Every vectorizer combination is scored with a proxy: the vectorizer is fitted on a
+stratified subsample of the training reviews and a fixed-C LinearSVC is scored on a
+single holdout of that subsample. Only the top-k combinations go on to full encoding
+and the full train_svm_model grid search.
+"""
+
+# ─── Standard Library Imports ────────────────────────────────────────────────────
+import time
+
+# ─── Third-Party Imports ─────────────────────────────────────────────────────────
+import numpy as np
+from sklearn.svm import LinearSVC
+from sklearn.utils import Bunch
+from sklearn.metrics import f1_score
+from sklearn.model_selection import ParameterGrid, train_test_split
+
+# ─── Project Module Imports ──────────────────────────────────────────────────────
+from src.svm.training import vectorizer
+from src.config import logging_config
+
+# ─── Logging Setup ───────────────────────────────────────────────────────────────
+logger = logging_config.configure_logging()
+
+
+def proxy_score(train_set, param_dict: dict, subsample: int = 5000, holdout: float = 0.25, C: float = 1.0,
+                random_state: int = 0, dtype=np.float64) -> float:
+    """
+    Score one vectorizer combination with a fixed-C linear model on a subsample.
+    Args:
+        train_set (sklearn.utils.Bunch): The training dataset (texts or token lists).
+        param_dict (dict): TF-IDF parameters of the combination.
+        subsample (int): Number of training reviews used; all if the split is smaller.
+        holdout (float): Fraction of the subsample used for scoring.
+        C (float): Regularization of the proxy LinearSVC.
+        random_state (int): Seed of the subsample and holdout split.
+        dtype (np.dtype): Precision of the encoding.
+    Returns:
+        float: F1 of the proxy model on the holdout.
+    """
+    y = np.asarray(train_set.target)
+    rows = np.arange(len(y))
+    if subsample < len(y):
+        rows, _ = train_test_split(rows, train_size=subsample, stratify=y, random_state=random_state)
+    fit_rows, val_rows = train_test_split(rows, test_size=holdout, stratify=y[rows], random_state=random_state)
+
+    data = vectorizer.tfidf_vectorizer(
+        Bunch(data=[train_set.data[i] for i in fit_rows], target=y[fit_rows]),
+        Bunch(data=[train_set.data[i] for i in val_rows], target=y[val_rows]),
+        **param_dict, dtype=dtype,
+    )
+    model = LinearSVC(C=C).fit(data.X_train, data.y_train)
+    return float(f1_score(data.y_test, model.predict(data.X_test)))
+
+
+def screen_encodings(train_set, combinations: list[dict], top_k: int, subsample: int = 5000, holdout: float = 0.25,
+                     C: float = 1.0, random_state: int = 0, dtype=np.float64) -> tuple[list[dict], list[tuple[dict, float]], float]:
+    """
+    Keep the top-k vectorizer combinations by proxy score.
+    Args:
+        train_set (sklearn.utils.Bunch): The training dataset.
+        combinations (list[dict]): TF-IDF parameter combinations.
+        top_k (int): Number of combinations to keep.
+        subsample, holdout, C, random_state, dtype: Proxy settings, see proxy_score.
+    Returns:
+        tuple: The kept combinations in grid order, (combination, proxy score) for all
+            combinations in grid order, and the screening time in seconds.
+    """
+    start = time.perf_counter()
+    scores = []
+    for param_dict in combinations:
+        score = proxy_score(train_set, param_dict, subsample=subsample, holdout=holdout, C=C,
+                            random_state=random_state, dtype=dtype)
+        scores.append((param_dict, score))
+        logger.info("Proxy F1 %.4f for %s", score, param_dict)
+    seconds = time.perf_counter() - start
+
+    # Stable ranking, then back to grid order so ties resolve as in the full grid
+    ranked = sorted(range(len(scores)), key=lambda i: scores[i][1], reverse=True)[:top_k]
+    kept = [combinations[i] for i in sorted(ranked)]
+    logger.info("Screening kept %d of %d encodings in %.1fs", len(kept), len(combinations), seconds)
+    return kept, scores, seconds
+
+
+def log_compute_saved(n_total: int, n_kept: int, screening_seconds: float, full_seconds: float,
+                      grid_params: dict, cv: int):
+    """
+    Log the fits and the estimated time the screening pass saved.
+    Args:
+        n_total (int): Number of encoder combinations in the grid.
+        n_kept (int): Number of combinations that got the full grid search.
+        screening_seconds (float): Time of the screening pass.
+        full_seconds (float): Time of encoding and grid-searching the kept combinations.
+        grid_params (dict): The SVM parameter grid.
+        cv (int): Number of cross-validation folds.
+    Returns:
+        None
+    """
+    fits_per_encoding = len(ParameterGrid(grid_params)) * cv + 1
+    skipped = n_total - n_kept
+    estimated = full_seconds / max(n_kept, 1) * skipped - screening_seconds
+    logger.info("Screening skipped %d encodings and %d SVM fits (%d proxy fits instead)",
+                skipped, skipped * fits_per_encoding, n_total)
+    logger.info("Estimated time saved: %.1fs (screening %.1fs, full search on %d encodings %.1fs)",
+                estimated, screening_seconds, n_kept, full_seconds)
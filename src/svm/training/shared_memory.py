@@ -0,0 +1,297 @@
+"""Memory-mapped training matrix for parallel grid-search workers.
+
+Writes X_train, y_train and the per-fold train/validation row indices of an encoded
+dataset to memory-mapped .npy files once, about 1x the size of X_train plus one index
+per row and fold. Grid-search workers receive only the file locations instead of a
+pickled copy of the training matrix, and each worker slices its fold from the shared
+pages itself, so the parent neither pickles X_train per task nor holds the fold slices.
+This does not make fitting copy-free: liblinear (LinearSVC.fit) converts its training
+slice into a private copy, about 1.5x the fold, so peak memory still grows with the
+number of workers fitting at once; only the pickling and parent-side slicing are saved.
+Workers only fit; the candidates of a fold are scored together in the parent with one
+batched product on the fold's validation slice (see evaluation.evaluate_models).
+With a ResultStore, only the (candidate, fold) cells not recorded yet are fitted.
+"""
+
+# ─── Standard Library Imports ────────────────────────────────────────────────────
+import time
+import shutil
+import tempfile
+import warnings
+from pathlib import Path
+from dataclasses import dataclass
+
+# ─── Third-Party Imports ─────────────────────────────────────────────────────────
+import numpy as np
+from scipy.sparse import csr_matrix
+from joblib import Parallel, delayed
+from sklearn.svm import LinearSVC
+from sklearn.exceptions import ConvergenceWarning
+from sklearn.model_selection import ParameterGrid, check_cv
+
+# ─── Project Module Imports ──────────────────────────────────────────────────────
+from src.data.data_classes import TfidfDataset
+from src.svm.training import evaluation
+from src.svm.training.result_store import ResultStore, encoding_fingerprint
+from src.config import logging_config
+
+# ─── Logging Setup ───────────────────────────────────────────────────────────────
+logger = logging_config.configure_logging()
+
+# Prefer RAM-backed storage where the platform provides it
+SHARED_MEMORY_DIR = Path("/dev/shm") if Path("/dev/shm").is_dir() else None
+
+
+def save_shared_csr(X: csr_matrix, directory: Path, name: str) -> Path:
+    """
+    Write the arrays of a CSR matrix as .npy files that can be memory-mapped.
+    Args:
+        X (csr_matrix): The matrix to store.
+        directory (Path): The target directory.
+        name (str): Prefix of the written files.
+    Returns:
+        Path: The common path prefix to pass to load_shared_csr.
+    """
+    X = X.tocsr()
+    prefix = Path(directory) / name
+    np.save(f"{prefix}.data.npy", X.data)
+    np.save(f"{prefix}.indices.npy", X.indices)
+    np.save(f"{prefix}.indptr.npy", X.indptr)
+    np.save(f"{prefix}.shape.npy", np.asarray(X.shape, dtype=np.int64))
+    return prefix
+
+
+def load_shared_csr(prefix: Path) -> csr_matrix:
+    """
+    Attach to a CSR matrix written by save_shared_csr without copying its arrays.
+    Args:
+        prefix (Path): The path prefix returned by save_shared_csr.
+    Returns:
+        csr_matrix: A read-only matrix backed by the memory-mapped files.
+    """
+    arrays = [np.load(f"{prefix}.{part}.npy", mmap_mode="r") for part in ("data", "indices", "indptr")]
+    shape = tuple(np.load(f"{prefix}.shape.npy"))
+    return csr_matrix(tuple(arrays), shape=shape, copy=False)
+
+
+@dataclass
+class SharedFolds:
+    """
+    Locations of a memory-mapped training set and its cross-validation folds.
+
+    Attributes:
+    - directory: Directory holding all memory-mapped files.
+    - X_train: Path prefix of the full training matrix.
+    - y_train: Path of the training labels.
+    - folds: One (train row indices, validation row indices) pair of paths per fold.
+    """
+    directory: Path
+    X_train: Path
+    y_train: Path
+    folds: list[tuple[Path, Path]]
+
+
+def prepare_shared_folds(X: csr_matrix, y: np.ndarray, cv=3, directory: str | Path | None = None) -> SharedFolds:
+    """
+    Store a training set and its per-fold train/validation row indices as memory-mapped files.
+    Folds are the same ones GridSearchCV would use for a classifier with this cv. The files
+    take about the size of X_train plus 8 bytes per row and fold. They are removed by
+    release_shared_folds; a process killed before that leaves the directory behind.
+    Args:
+        X (csr_matrix): The training matrix.
+        y (np.ndarray): The training labels.
+        cv (int or cross-validation generator): Cross-validation strategy.
+        directory (str or Path, optional): Parent directory for the files; /dev/shm if available.
+    Returns:
+        SharedFolds: Handle with the locations of all files.
+    """
+    root = Path(tempfile.mkdtemp(prefix="svm_folds_", dir=directory or SHARED_MEMORY_DIR))
+    y = np.asarray(y)
+
+    x_prefix = save_shared_csr(X, root, "X_train")
+    np.save(root / "y_train.npy", y)
+
+    folds = []
+    for i, (train_idx, val_idx) in enumerate(check_cv(cv, y, classifier=True).split(X, y)):
+        np.save(root / f"fold{i}_train_idx.npy", train_idx)
+        np.save(root / f"fold{i}_val_idx.npy", val_idx)
+        folds.append((root / f"fold{i}_train_idx.npy", root / f"fold{i}_val_idx.npy"))
+
+    logger.info("Prepared %d memory-mapped folds in %s", len(folds), root)
+    return SharedFolds(directory=root, X_train=x_prefix, y_train=root / "y_train.npy", folds=folds)
+
+
+def load_shared_fold(shared: SharedFolds, fold: int, split: str = "train") -> tuple[csr_matrix, np.ndarray]:
+    """
+    Slice one side of a fold from the memory-mapped training set.
+    Args:
+        shared (SharedFolds): The handle returned by prepare_shared_folds.
+        fold (int): Index of the fold.
+        split (str): 'train' or 'val'.
+    Returns:
+        tuple[csr_matrix, np.ndarray]: The fold's rows of X_train and their labels.
+    """
+    rows = np.load(shared.folds[fold][0 if split == "train" else 1])
+    X = load_shared_csr(shared.X_train)
+    y = np.load(shared.y_train, mmap_mode="r")
+    return X[rows], np.asarray(y[rows])
+
+
+def release_shared_folds(shared: SharedFolds):
+    """
+    Delete the memory-mapped files of a SharedFolds handle.
+    Args:
+        shared (SharedFolds): The handle returned by prepare_shared_folds.
+    Returns:
+        None
+    """
+    shutil.rmtree(shared.directory, ignore_errors=True)
+
+
+def fit_fold(shared: SharedFolds, fold: int, params: dict, estimator_factory=LinearSVC) -> dict:
+    """
+    Fit one estimator on the training rows of a memory-mapped fold, sliced in the worker.
+    Args:
+        shared (SharedFolds): The handle returned by prepare_shared_folds.
+        fold (int): Index of the fold.
+        params (dict): Estimator hyperparameters.
+        estimator_factory (callable): Builds the estimator from the hyperparameters.
+    Returns:
+        dict: The fitted 'estimator', 'fit_time' in seconds and 'converged'.
+    """
+    X_train, y_train = load_shared_fold(shared, fold, "train")
+
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always", ConvergenceWarning)
+        start = time.perf_counter()
+        estimator = estimator_factory(**params).fit(X_train, y_train)
+        fit_time = time.perf_counter() - start
+
+    return {
+        "estimator": estimator,
+        "fit_time": fit_time,
+        "converged": not any(issubclass(w.category, ConvergenceWarning) for w in caught),
+    }
+
+
+class SharedGridSearch:
+    """
+    Result of a grid search over memory-mapped folds.
+    Exposes the parts of the fitted GridSearchCV interface the pipeline relies on.
+
+    Attributes:
+    - best_params_: Hyperparameters with the highest mean validation F1.
+    - best_score_: Mean validation F1 of best_params_.
+    - best_estimator_: Estimator refitted on the full training set with best_params_.
+    - cv_results_: Per-candidate fold scores, mean/std scores, fit times and ranks.
+    """
+
+    def __init__(self, best_params_, best_score_, best_estimator_, cv_results_):
+        self.best_params_ = best_params_
+        self.best_score_ = best_score_
+        self.best_estimator_ = best_estimator_
+        self.cv_results_ = cv_results_
+
+    def predict(self, X):
+        return self.best_estimator_.predict(X)
+
+    def decision_function(self, X):
+        return self.best_estimator_.decision_function(X)
+
+
+def shared_grid_search(data: TfidfDataset, param_grid: dict, cv=3, n_jobs: int = -1,
+                       estimator_factory=LinearSVC, directory: str | Path | None = None,
+                       store: ResultStore | None = None, solver: str = "liblinear") -> SharedGridSearch:
+    """
+    Grid-search an estimator with every worker slicing its fold from the same memory-mapped X_train.
+    Args:
+        data (TfidfDataset): The encoded dataset.
+        param_grid (dict): Hyperparameter grid as for GridSearchCV.
+        cv (int or cross-validation generator): Cross-validation strategy.
+        n_jobs (int): Number of parallel workers.
+        estimator_factory (callable): Builds the estimator from hyperparameters.
+        directory (str or Path, optional): Parent directory for the memory-mapped files.
+        store (ResultStore, optional): Fold results already recorded are reused and only the
+            missing (candidate, fold) cells are fitted and recorded.
+        solver (str): Name of the estimator backend the results are recorded under.
+    Returns:
+        SharedGridSearch: The search result with the refitted best estimator.
+    """
+    candidates = list(ParameterGrid(param_grid))
+    n_folds = check_cv(cv, data.y_train, classifier=True).get_n_splits(data.X_train, data.y_train)
+    scores = np.empty((len(candidates), n_folds))
+    fit_times = np.empty((len(candidates), n_folds))
+    converged = np.ones((len(candidates), n_folds), dtype=bool)
+
+    # Fill in the cells the store already holds
+    known = {}
+    if store is not None:
+        fingerprint = encoding_fingerprint(data.X_train, data.y_train, cv)
+        store.record_encoding(fingerprint, data.name, *data.X_train.shape)
+        known = store.fold_results(fingerprint, solver, candidates, n_folds)
+        for (i, fold), result in known.items():
+            scores[i, fold], fit_times[i, fold], converged[i, fold] = (
+                result["score"], result["fit_time"], result["converged"])
+    missing = [[i for i in range(len(candidates)) if (i, fold) not in known] for fold in range(n_folds)]
+    n_missing = sum(len(cells) for cells in missing)
+    if store is not None:
+        logger.info("Result store holds %d of %d fold results; fitting %d",
+                    len(known), len(candidates) * n_folds, n_missing)
+
+    shared = prepare_shared_folds(data.X_train, data.y_train, cv=cv, directory=directory) if n_missing else None
+    try:
+        if n_missing:
+            logger.info("Fitting %d of %d fold fits (%d folds, %d candidates) on shared memory",
+                        n_missing, n_folds * len(candidates), n_folds, len(candidates))
+
+            # Workers only receive the small SharedFolds handle; fits arrive fold by fold
+            outcomes = Parallel(n_jobs=n_jobs, return_as="generator")(
+                delayed(fit_fold)(shared, fold, candidates[i], estimator_factory)
+                for fold in range(n_folds) for i in missing[fold]
+            )
+
+            # Score the candidates of a fold with one product on its validation slice
+            for fold in range(n_folds):
+                if not missing[fold]:
+                    continue
+                fitted = [next(outcomes) for _ in missing[fold]]
+                X_val, y_val = load_shared_fold(shared, fold, "val")
+                metrics = evaluation.evaluate_models(X_val, y_val, [o["estimator"] for o in fitted])
+                rows = missing[fold]
+                scores[rows, fold] = metrics["f1"]
+                fit_times[rows, fold] = [o["fit_time"] for o in fitted]
+                converged[rows, fold] = [o["converged"] for o in fitted]
+
+                # Record every finished fold so an interrupted search resumes from it
+                if store is not None:
+                    store.record_folds(fingerprint, solver, n_folds, [
+                        (candidates[i], fold, {"score": scores[i, fold], "fit_time": fit_times[i, fold],
+                                               "converged": converged[i, fold]})
+                        for i in rows
+                    ])
+
+        mean_scores = scores.mean(axis=1)
+        ranks = (-mean_scores).argsort(kind="stable").argsort() + 1
+        cv_results = {
+            "params": candidates,
+            "mean_test_score": mean_scores,
+            "std_test_score": scores.std(axis=1),
+            "rank_test_score": ranks,
+            "mean_fit_time": fit_times.mean(axis=1),
+            "converged": converged.all(axis=1),
+            **{f"split{i}_test_score": scores[:, i] for i in range(n_folds)},
+        }
+
+        # Refit the best candidate on the full training set, memory-mapped if the folds were prepared
+        best_index = int(np.argmax(mean_scores))
+        best_params = candidates[best_index]
+        if shared is not None:
+            X_train, y_train = load_shared_csr(shared.X_train), np.load(shared.y_train)
+        else:
+            X_train, y_train = data.X_train, data.y_train
+        best_estimator = estimator_factory(**best_params).fit(X_train, y_train)
+    finally:
+        if shared is not None:
+            release_shared_folds(shared)
+
+    return SharedGridSearch(best_params, float(mean_scores[best_index]), best_estimator, cv_results)
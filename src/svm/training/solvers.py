@@ -0,0 +1,275 @@
+"""Pluggable linear-SVM solver backends for the grid search.
+
+Every backend accepts the hyperparameters of the grid (C, tol, max_iter, class_weight)
+and exposes the fitted coef_, intercept_ and classes_ of a linear classifier, so grid
+search, model saving and inference stay unchanged whichever backend trained the model.
+
+Backends:
+- liblinear: LinearSVC with its default dual="auto".
+- liblinear_dual / liblinear_primal: LinearSVC with the dual or primal formulation forced.
+- sgd: SGDClassifier with hinge loss and the regularization matched to C.
+- averaged_sgd: Vectorized mini-batch averaged SGD on the LinearSVC objective.
+- auto: Picks the fastest backend whose accuracy matches LinearSVC on a calibration subsample.
+"""
+
+# ─── Standard Library Imports ────────────────────────────────────────────────────
+import time
+
+# ─── Third-Party Imports ─────────────────────────────────────────────────────────
+import numpy as np
+from sklearn.base import BaseEstimator, ClassifierMixin
+from sklearn.svm import LinearSVC
+from sklearn.metrics import f1_score
+from sklearn.linear_model import SGDClassifier
+from sklearn.model_selection import train_test_split
+from sklearn.utils.validation import check_is_fitted
+from sklearn.utils.class_weight import compute_sample_weight
+
+# ─── Project Module Imports ──────────────────────────────────────────────────────
+from src.config import logging_config
+
+# ─── Logging Setup ───────────────────────────────────────────────────────────────
+logger = logging_config.configure_logging()
+
+
+class LinearClassifier(ClassifierMixin, BaseEstimator):
+    """
+    Scoring of a fitted linear classifier from its coef_, intercept_ and classes_.
+    Backends set those attributes in fit; decision_function and predict follow sklearn's
+    linear classifiers (one score per row for two classes).
+    """
+
+    def decision_function(self, X) -> np.ndarray:
+        """
+        Compute signed distances to the separating hyperplane(s).
+        Args:
+            X (array or sparse matrix): Samples of shape (n_samples, n_features).
+        Returns:
+            np.ndarray: Score per sample, or per sample and class for more than two classes.
+        """
+        check_is_fitted(self, "coef_")
+        scores = np.asarray(X @ self.coef_.T) + self.intercept_
+        return scores.ravel() if scores.shape[1] == 1 else scores
+
+    def predict(self, X) -> np.ndarray:
+        """
+        Predict class labels.
+        Args:
+            X (array or sparse matrix): Samples of shape (n_samples, n_features).
+        Returns:
+            np.ndarray: Predicted label per sample.
+        """
+        scores = self.decision_function(X)
+        indices = (scores > 0).astype(np.int64) if scores.ndim == 1 else scores.argmax(axis=1)
+        return self.classes_[indices]
+
+
+class SGDHingeSVC(LinearClassifier):
+    """
+    SGDClassifier with hinge loss, parameterized like LinearSVC.
+    C is converted to SGD's per-sample regularization alpha = 1 / (C * n_samples).
+    """
+
+    def __init__(self, C=1.0, tol=1e-4, max_iter=1000, class_weight=None, random_state=0):
+        self.C = C
+        self.tol = tol
+        self.max_iter = max_iter
+        self.class_weight = class_weight
+        self.random_state = random_state
+
+    def fit(self, X, y):
+        sgd = SGDClassifier(
+            loss="hinge", alpha=1.0 / (self.C * X.shape[0]), tol=self.tol, max_iter=self.max_iter,
+            class_weight=self.class_weight, average=True, random_state=self.random_state,
+        ).fit(X, y)
+        self.coef_, self.intercept_, self.classes_ = sgd.coef_, sgd.intercept_, sgd.classes_
+        self.n_iter_ = sgd.n_iter_
+        return self
+
+
+class AveragedSGDSVC(LinearClassifier):
+    """
+    Mini-batch averaged SGD on the LinearSVC objective (L2 penalty, squared hinge loss).
+
+    Each step scores a whole mini-batch with one sparse product and builds the gradient
+    with a second one, so the per-sample work runs in SciPy/NumPy kernels. The returned
+    weights are the running (Polyak) average of the iterates after the first epoch. As in
+    SGDClassifier, fitting stops once n_iter_no_change epochs in a row improve the objective
+    of the averaged weights by less than tol, or after max_iter epochs.
+    """
+
+    def __init__(self, C=1.0, tol=1e-4, max_iter=1000, class_weight=None, batch_size=256, n_iter_no_change=5,
+                 random_state=0):
+        self.C = C
+        self.tol = tol
+        self.max_iter = max_iter
+        self.class_weight = class_weight
+        self.batch_size = batch_size
+        self.n_iter_no_change = n_iter_no_change
+        self.random_state = random_state
+
+    def fit(self, X, y):
+        y = np.asarray(y)
+        self.classes_ = np.unique(y)
+        if len(self.classes_) != 2:
+            raise ValueError(f"AveragedSGDSVC supports binary targets only, got {len(self.classes_)} classes")
+
+        n_samples, n_features = X.shape
+        signs = np.where(y == self.classes_[1], 1.0, -1.0)
+        weights = compute_sample_weight(self.class_weight, y)
+        lam = 1.0 / (self.C * n_samples)
+
+        rng = np.random.default_rng(self.random_state)
+        eta0 = self._initial_step(X, weights, lam, rng)
+
+        w, b = np.zeros(n_features), 0.0
+        w_avg, b_avg = np.zeros(n_features), 0.0
+        step, n_averaged = 0, 0
+        best_objective, stalled = np.inf, 0
+        self.n_iter_ = self.max_iter
+        for epoch in range(self.max_iter):
+            # Shuffle once per epoch so mini-batches are contiguous row slices
+            order = rng.permutation(n_samples)
+            X_epoch, s_epoch, w_epoch = X[order], signs[order], weights[order]
+
+            # Averaging starts after the first epoch, away from the zero start
+            if epoch == 1:
+                n_averaged = 0
+
+            for start in range(0, n_samples, self.batch_size):
+                X_batch = X_epoch[start:start + self.batch_size]
+                s_batch = s_epoch[start:start + self.batch_size]
+                slack = np.maximum(0.0, 1.0 - s_batch * (X_batch @ w + b))
+                residual = 2.0 * w_epoch[start:start + self.batch_size] * slack * s_batch
+
+                eta = eta0 / (1.0 + eta0 * lam * step)
+                w *= 1.0 - eta * lam
+                w += (eta / len(s_batch)) * (X_batch.T @ residual)
+                b += eta * residual.mean()
+                step += 1
+
+                # Running average of the iterates
+                n_averaged += 1
+                w_avg += (w - w_avg) / n_averaged
+                b_avg += (b - b_avg) / n_averaged
+
+            # Like SGDClassifier: stop after n_iter_no_change epochs improving by less than tol
+            objective = self._objective(X, signs, weights, lam, w_avg, b_avg)
+            stalled = stalled + 1 if objective > best_objective - self.tol else 0
+            best_objective = min(best_objective, objective)
+            if epoch > 0 and stalled >= self.n_iter_no_change:
+                self.n_iter_ = epoch + 1
+                break
+
+        self.coef_ = w_avg.reshape(1, -1)
+        self.intercept_ = np.array([b_avg])
+        return self
+
+    def _initial_step(self, X, weights, lam, rng) -> float:
+        """
+        Inverse smoothness of the mini-batch loss, from the largest eigenvalue of
+        X_b^T X_b / |b| on a sample batch (power iteration; the intercept adds a column of ones).
+        """
+        rows = rng.choice(X.shape[0], size=min(self.batch_size, X.shape[0]), replace=False)
+        X_batch = X[rows]
+        v = rng.standard_normal(X.shape[1] + 1)
+        eigenvalue = 0.0
+        for _ in range(20):
+            u = X_batch @ v[:-1] + v[-1]
+            v = np.append(X_batch.T @ u, u.sum()) / len(rows)
+            eigenvalue = np.linalg.norm(v)
+            v /= max(eigenvalue, 1e-12)
+        return 1.0 / (2.0 * weights.max() * eigenvalue + lam)
+
+    @staticmethod
+    def _objective(X, signs, weights, lam, w, b) -> float:
+        """Regularized mean squared hinge loss of the weights w and intercept b."""
+        slack = np.maximum(0.0, 1.0 - signs * (X @ w + b))
+        return 0.5 * lam * float(w @ w) + float(np.mean(weights * slack * slack))
+
+
+SOLVERS = {
+    "liblinear": lambda **params: LinearSVC(**params),
+    "liblinear_dual": lambda **params: LinearSVC(dual=True, **params),
+    "liblinear_primal": lambda **params: LinearSVC(dual=False, **params),
+    "sgd": lambda **params: SGDHingeSVC(**params),
+    "averaged_sgd": lambda **params: AveragedSGDSVC(**params),
+}
+
+
+def make_estimator(solver: str = "liblinear", **params):
+    """
+    Build an unfitted estimator of a solver backend.
+    Args:
+        solver (str): A key of SOLVERS.
+        **params: Hyperparameters of the estimator (C, tol, max_iter, class_weight).
+    Returns:
+        BaseEstimator: The estimator.
+    """
+    if solver not in SOLVERS:
+        raise ValueError(f"Unknown solver '{solver}'. Choose one of {sorted(SOLVERS)} or 'auto'.")
+    return SOLVERS[solver](**params)
+
+
+def calibrate_solvers(X, y, params: dict | None = None, candidates: list[str] | None = None,
+                      sample_size: int = 5000, random_state: int = 0) -> list[dict]:
+    """
+    Time every backend on a stratified subsample and score it on a holdout.
+    Args:
+        X (csr_matrix): The training matrix.
+        y (np.ndarray): The training labels.
+        params (dict, optional): Hyperparameters used for every backend.
+        candidates (list[str], optional): Backends to compare; all by default.
+        sample_size (int): Rows of the calibration subsample (train and holdout together).
+        random_state (int): Seed of the subsample split.
+    Returns:
+        list[dict]: Per backend 'solver', 'seconds', 'f1' and 'seconds_per_nnz'.
+    """
+    params = params or {}
+    n_rows = min(sample_size, X.shape[0])
+    rows = np.random.default_rng(random_state).permutation(X.shape[0])[:n_rows]
+    X_fit, X_val, y_fit, y_val = train_test_split(
+        X[rows], np.asarray(y)[rows], test_size=0.25, stratify=np.asarray(y)[rows], random_state=random_state
+    )
+
+    calibration = []
+    for solver in candidates or list(SOLVERS):
+        start = time.perf_counter()
+        estimator = make_estimator(solver, **params).fit(X_fit, y_fit)
+        seconds = time.perf_counter() - start
+        calibration.append({
+            "solver": solver,
+            "seconds": seconds,
+            "f1": float(f1_score(y_val, estimator.predict(X_val), pos_label=estimator.classes_[1])),
+            "seconds_per_nnz": seconds / max(X_fit.nnz, 1),
+        })
+    return calibration
+
+
+def select_solver(X, y, params: dict | None = None, tolerance: float = 0.005, sample_size: int = 5000) -> str:
+    """
+    Pick the fastest backend whose calibration F1 is within tolerance of LinearSVC.
+    The matrix shape decides which liblinear formulation competes: the primal problem is
+    smaller when there are more samples than features, the dual one otherwise.
+    Args:
+        X (csr_matrix): The training matrix.
+        y (np.ndarray): The training labels.
+        params (dict, optional): Hyperparameters used for the calibration fits.
+        tolerance (float): Largest accepted F1 drop against the liblinear reference.
+        sample_size (int): Rows of the calibration subsample.
+    Returns:
+        str: The selected key of SOLVERS.
+    """
+    n_samples, n_features = X.shape
+    liblinear = "liblinear_primal" if n_samples > n_features else "liblinear_dual"
+    calibration = calibrate_solvers(X, y, params, candidates=[liblinear, "sgd", "averaged_sgd"], sample_size=sample_size)
+
+    reference_f1 = calibration[0]["f1"]
+    accurate = [c for c in calibration if c["f1"] >= reference_f1 - tolerance]
+    best = min(accurate, key=lambda c: c["seconds_per_nnz"])
+
+    for c in calibration:
+        logger.info("Calibration %s: %.3fs on subsample, F1 %.4f, est. %.1fs on %d nnz",
+                    c["solver"], c["seconds"], c["f1"], c["seconds_per_nnz"] * X.nnz, X.nnz)
+    logger.info("Auto-selected solver %s for shape %s with %d nnz", best["solver"], X.shape, X.nnz)
+    return best["solver"]
@@ -0,0 +1,87 @@
+"""Bounded-memory encode → train → discard loop over the encoder grid.
+
+Each vectorizer combination is encoded, spilled to disk and grid-searched right away.
+Afterwards only its score is kept, plus the fitted SVM and vectorizer if it is the best
+so far. Peak memory is one encoding with its grid search plus the current best model
+and encoder, however many combinations the grid has.
+"""
+
+# ─── Standard Library Imports ────────────────────────────────────────────────────
+import gc
+from pathlib import Path
+from dataclasses import dataclass, field
+
+# ─── Third-Party Imports ─────────────────────────────────────────────────────────
+import numpy as np
+from sklearn.feature_extraction.text import TfidfVectorizer
+
+# ─── Project Module Imports ──────────────────────────────────────────────────────
+from src.svm.training import vectorizer, gridsearch_trainer
+from src.config import logging_config
+from src.config.paths import ENCODED_DATA_DIR
+
+# ─── Logging Setup ───────────────────────────────────────────────────────────────
+logger = logging_config.configure_logging()
+
+
+@dataclass
+class BestEncoding:
+    """
+    The best encoding of a streamed grid.
+
+    Attributes:
+    - name: Name of the encoding.
+    - params: Vectorizer parameters (including k if features were selected).
+    - score: Best cross-validated F1 of its grid search.
+    - model: The refitted best SVM estimator.
+    - vectorizer: The fitted vectorizer of the encoding.
+    - path: Location of the spilled encoded dataset.
+    - scores: Name, parameters and score of every encoding in grid order.
+    - test_metrics: Test-set metrics of every encoding's best model, by name.
+    """
+    name: str = ""
+    params: dict = field(default_factory=dict)
+    score: float = -np.inf
+    model: object = None
+    vectorizer: TfidfVectorizer | None = None
+    path: Path | None = None
+    scores: list[tuple[str, dict, float]] = field(default_factory=list)
+    test_metrics: dict[str, dict] = field(default_factory=dict)
+
+
+def stream_encoder_grid(train_set, test_set, combinations: list[dict], fs_params: dict | None = None,
+                        dtype=np.float64, directory: Path = ENCODED_DATA_DIR) -> BestEncoding:
+    """
+    Encode and train every vectorizer combination one at a time, keeping only the best.
+    Args:
+        train_set (sklearn.utils.Bunch): The training dataset.
+        test_set (sklearn.utils.Bunch): The test dataset.
+        combinations (list[dict]): TF-IDF parameter combinations.
+        fs_params (dict, optional): The 'feature_selection' config.
+        dtype (np.dtype): Precision of the encodings.
+        directory (Path): Directory the encoded datasets are spilled to.
+    Returns:
+        BestEncoding: The best model, its vectorizer and the scores of all encodings.
+    """
+    best = BestEncoding()
+    for i, param_dict in enumerate(combinations, start=1):
+        logger.info("Encoding dataset %d/%d with parameters: %s", i, len(combinations), param_dict)
+        name, data_set, param_dict, path = vectorizer.encode_and_save(
+            train_set, test_set, param_dict, fs_params=fs_params, dtype=dtype, directory=directory
+        )
+        grid = gridsearch_trainer.train_svm_model(data_set)
+        score = float(grid.best_score_)
+        best.scores.append((name, param_dict, score))
+        best.test_metrics[name] = grid.test_metrics_
+
+        # Strictly better only, so ties keep the earlier encoding like the collected grid does
+        if score > best.score:
+            best.name, best.params, best.score, best.path = name, param_dict, score, path
+            best.model, best.vectorizer = grid.best_estimator_, data_set.vectorizer
+            logger.info("New best encoding %s with score %f", name, score)
+
+        # Evict the matrices and the grid search before the next encoding
+        del data_set, grid
+        gc.collect()
+
+    return best
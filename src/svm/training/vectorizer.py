@@ -1,7 +1,12 @@
 """Script to load data, encode features, and apply preprocessing pipeline."""
 
 # ─── Project Module Imports ──────────────────────────────────────────────────────
+import yaml
+import numpy as np
 from src.data.data_classes import TfidfDataset
+from src.data.data_loader import compact_sparse_matrix, param_dict_to_filename, save_encoded_dataset_as_sparse_matrix
+from src.svm.training import feature_selection, heavy_hitters, ngram_counter, parallel_transform
+from src.config.paths import ENCODED_DATA_DIR, TRAINING_PARAMS
 from src.config import logging_config
 from sklearn.feature_extraction.text import TfidfVectorizer
 
@@ -9,7 +14,42 @@ from sklearn.feature_extraction.text import TfidfVectorizer
 # ─── Logging Setup ───────────────────────────────────────────────────────────────
 logger = logging_config.configure_logging()
 
+# ─── Load Vectorizer Configuration ───────────────────────────────────────────────
+with open(TRAINING_PARAMS, "r") as f:
+    training_params = yaml.load(f, Loader=yaml.FullLoader)
 
+# Counting engines of the encoder; 'sklearn' and 'numpy' produce the same matrices
+ENGINES = ("sklearn", "numpy", "sketch")
+
+
+def _identity(doc):
+    """Pass pre-tokenized documents through the vectorizer's preprocessor and tokenizer unchanged."""
+    return doc
+
+def _remove_stop_words(docs, stop_words) -> list[list[str]]:
+    """Drop stop words from every token list."""
+    if not stop_words:
+        return docs
+    return [[token for token in doc if token not in stop_words] for doc in docs]
+
+def _is_pretokenized(data) -> bool:
+    """Check whether a dataset holds token lists instead of texts."""
+    return len(data) > 0 and not isinstance(data[0], str)
+
+def _fit_transform(vectorizer, train_docs, test_docs, engine: str, transform_params: dict):
+    """Fit the vectorizer on the training documents and encode both splits; the test split in parallel chunks."""
+    encoder = ngram_counter.NgramCounter(vectorizer) if engine == "numpy" else vectorizer
+    if engine == "sketch" and vectorizer.max_features is not None:
+        # Select the columns with bounded memory and count only those
+        vocabulary = heavy_hitters.build_vocabulary(train_docs, vectorizer, vectorizer.max_features,
+                                                    **training_params.get("vocabulary_sketch", {}))
+        vectorizer.set_params(vocabulary=vocabulary)
+        X_train = vectorizer.fit_transform(train_docs)
+        # Keep the grid parameters; the fitted vocabulary_ stays fixed
+        vectorizer.set_params(vocabulary=None)
+    else:
+        X_train = encoder.fit_transform(train_docs)
+    return X_train, parallel_transform.parallel_transform(encoder, test_docs, **transform_params)
 
 # Encoder
 def tfidf_vectorizer(train_data, test_data,
@@ -20,13 +60,28 @@ def tfidf_vectorizer(train_data, test_data,
                      use_idf=True,
                      smooth_idf=True,
                      sublinear_tf=False,
-                     name="tfidf_vectorizer"):
+                     name="tfidf_vectorizer",
+                     dtype=np.float64,
+                     engine=None,
+                     transform_n_jobs=None):
     """
     Create a TF-IDF vectorizer with specific parameters.
     
     Args:
         train_data (sklearn.utils.Bunch): The training dataset containing 'data' and 'target'.
         test_data (sklearn.utils.Bunch): The test dataset containing 'data' and 'target'.
+            'data' holds either texts or token lists from the preprocessing token handoff.
+            Token lists are already lowercased and split like the vectorizer's token pattern,
+            so only stop-word removal and n-gram counting run on them.
+        dtype (np.dtype): Precision of the TF-IDF values. With float32 the matrices also
+            use int32 index arrays, and the fitted vectorizer keeps producing float32 at inference.
+        engine (str, optional): 'sklearn' counts n-grams with TfidfVectorizer itself, 'numpy'
+            with the vectorized ngram_counter engine; the matrices and the fitted vectorizer
+            are the same. 'sketch' selects the max_features columns with a count-min sketch
+            and an exact pass over the candidates (heavy_hitters), so the full vocabulary is
+            never built; ties at the cut-off may differ. Defaults to 'encoder_engine' in the config.
+        transform_n_jobs (int, optional): Worker processes encoding the test split in chunks
+            with the fitted encoder; 1 encodes it in-process. Defaults to 'transform' in the config.
     Returns:
         X_train (sparse matrix): The TF-IDF transformed training data.
         y_train (array): The labels for the training data.
@@ -35,6 +90,15 @@ def tfidf_vectorizer(train_data, test_data,
         vectorizer (TfidfVectorizer): The fitted TF-IDF vectorizer.
     """
     logger.debug(f"Encoding data with {name} using max_features={max_features}")
+    if engine is None:
+        engine = training_params.get("encoder_engine", "sklearn")
+    if engine not in ENGINES:
+        raise ValueError(f"Unknown encoder engine '{engine}'. Choose one of {ENGINES}.")
+    transform_params = training_params.get("transform", {})
+    transform_params = {
+        "n_jobs": transform_params.get("n_jobs", 1) if transform_n_jobs is None else transform_n_jobs,
+        "chunk_size": transform_params.get("chunk_size"),
+    }
 
     # Set the parameters for the TF-IDF vectorizer
     vectorizer = TfidfVectorizer(
@@ -45,15 +109,38 @@ def tfidf_vectorizer(train_data, test_data,
         use_idf=use_idf,
         smooth_idf=smooth_idf,
         sublinear_tf=sublinear_tf,
+        dtype=dtype,
     )
     logger.debug(f"Vectorizer initialized with parameters: %s", vectorizer.get_params())
 
     # Fit the vectorizer on the training data and transform both training and test data
-    X_train = vectorizer.fit_transform(train_data.data)
-    X_test = vectorizer.transform(test_data.data)
+    if _is_pretokenized(train_data.data):
+        if not lowercase:
+            raise ValueError("Pre-tokenized input is lowercased during preprocessing; lowercase=False needs raw texts.")
+        logger.debug("Encoding pre-tokenized data; removing stop words on the token stream")
+
+        # Stop words are removed before n-grams are built, exactly as the word analyzer does
+        stop_words_set = vectorizer.get_stop_words()
+        train_docs = _remove_stop_words(train_data.data, stop_words_set)
+        test_docs = _remove_stop_words(test_data.data, stop_words_set)
+
+        # Skip decoding, lowercasing and regex tokenization for the token lists
+        text_params = {k: vectorizer.get_params()[k] for k in ("stop_words", "lowercase", "preprocessor", "tokenizer", "token_pattern")}
+        vectorizer.set_params(stop_words=None, lowercase=False, preprocessor=_identity, tokenizer=_identity, token_pattern=None)
+        X_train, X_test = _fit_transform(vectorizer, train_docs, test_docs, engine, transform_params)
+
+        # Restore the text settings; the fitted vocabulary and idf encode raw texts identically
+        vectorizer.set_params(**text_params)
+    else:
+        X_train, X_test = _fit_transform(vectorizer, train_data.data, test_data.data, engine, transform_params)
     y_train = train_data.target
     y_test = test_data.target
 
+    # Keep compact matrices compact: float32 values with int32 indices
+    if np.dtype(dtype) == np.float32:
+        X_train = compact_sparse_matrix(X_train, dtype)
+        X_test = compact_sparse_matrix(X_test, dtype)
+
     logger.debug(f"Training data transformed into TF-IDF matrix with shape: {X_train.shape}")
     logger.debug(f"Test data transformed into TF-IDF matrix with shape: {X_test.shape}")
     logger.debug(f"Training labels: {y_train[:5]}")
@@ -72,6 +159,40 @@ def tfidf_vectorizer(train_data, test_data,
 
     return encoded_dataset
 
+def encode_and_save(train_set, test_set, param_dict: dict, fs_params: dict | None = None,
+                    dtype=np.float64, directory=ENCODED_DATA_DIR, transform_n_jobs: int | None = None):
+    """
+    Encode the datasets for one vectorizer parameter combination and save the result.
+    Args:
+        train_set (sklearn.utils.Bunch): The training dataset.
+        test_set (sklearn.utils.Bunch): The test dataset.
+        param_dict (dict): TF-IDF parameters of this combination.
+        fs_params (dict, optional): The 'feature_selection' config; applied if enabled.
+        dtype (np.dtype): Precision of the TF-IDF values.
+        directory (Path): Directory of the saved encoded dataset.
+        transform_n_jobs (int, optional): Worker processes encoding the test split; see tfidf_vectorizer.
+    Returns:
+        tuple[str, TfidfDataset, dict, Path]: Name of the encoding, the encoded dataset,
+            the parameters (including k if features were selected) and the saved file.
+    """
+    # Encode the datasets using the TF-IDF vectorizer
+    data_set = tfidf_vectorizer(train_set, test_set, **param_dict, dtype=dtype, transform_n_jobs=transform_n_jobs)
+
+    # Optionally shrink the encoding to the top-k features
+    if fs_params and fs_params.get("enabled", False):
+        data_set = feature_selection.select_features(data_set, k=fs_params["k"], score_func=fs_params.get("score_func", "chi2"))
+        param_dict = {**param_dict, "k": fs_params["k"]}
+
+    # Create a file path from the encoding parameters
+    name = param_dict_to_filename(param_dict)
+    path = directory / f"encoded__{name}.joblib"
+
+    # Save the encoded datasets as sparse matrices
+    save_encoded_dataset_as_sparse_matrix(data_set, path=path, dtype=dtype)
+    logger.info("Encoded dataset saved to %s", path)
+
+    return name, data_set, param_dict, path
+
 def encoding_pipeline(train_set, test_set):
     """
     Encodes the training and test datasets using the TF-IDF vectorizer.
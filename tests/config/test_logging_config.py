@@ -0,0 +1,93 @@
+"""Tests for the asynchronous logging setup."""
+
+# ─── Standard Library Imports ────────────────────────────────────────────────────
+import os
+import sys
+import logging
+import subprocess
+
+# ─── Project Imports ─────────────────────────────────────────────────────────────
+from src.config import logging_config
+
+
+def _isolated_logger(name: str, tmp_path, monkeypatch, max_bytes: int = 10**6) -> logging.Logger:
+    """Configure a logger that writes to tmp_path and ignores pytest's root handlers."""
+    monkeypatch.setattr(logging_config, "LOG_FILE", tmp_path / "run.log")
+    monkeypatch.setattr(logging_config, "LOG_MAX_BYTES", max_bytes)
+    logging.getLogger(name).propagate = False
+    return logging_config.configure_logging(name)
+
+
+def test_sanitizer_replaces_root_in_message_and_arguments(tmp_path):
+    """ Check if the precomputed project root is replaced in messages and Path arguments. """
+    # Arrange
+    formatter = logging_config.PathSanitizerFormatter("%(message)s", root=tmp_path)
+    record = logging.LogRecord("x", logging.INFO, __file__, 1, f"read {tmp_path}/a and %s", (tmp_path / "b",), None)
+
+    # Act
+    message = formatter.format(record)
+
+    # Assert
+    assert message == "read project_root/a and project_root/b"
+
+
+def test_async_logger_writes_and_rotates_by_size(tmp_path, monkeypatch):
+    """
+    Test that records pass through the background writer into the log file and that the
+    file rotates once it exceeds the size limit.
+    """
+    # Arrange
+    logger = _isolated_logger("test_async_rotation", tmp_path, monkeypatch, max_bytes=2000)
+
+    # Act
+    for i in range(300):
+        logger.debug("record %03d %s", i, "x" * 40)
+    logging_config.shutdown_logging("test_async_rotation")
+
+    # Assert
+    files = sorted(tmp_path.glob("run.log*"))
+    assert len(files) == 1 + logging_config.LOG_BACKUP_COUNT
+    assert all(f.stat().st_size <= 2000 for f in files)
+    assert "record 299" in (tmp_path / "run.log").read_text()
+
+
+def test_forked_worker_logs_to_its_own_file(tmp_path, monkeypatch):
+    """ Check if a forked process gets its own writer and per-process log file. """
+    # Arrange
+    logger = _isolated_logger("test_async_fork", tmp_path, monkeypatch)
+    logger.info("parent record")
+
+    # Act
+    pid = os.fork()
+    if pid == 0:
+        logger.info("child record")
+        logging_config.shutdown_logging("test_async_fork")
+        os._exit(0)
+    os.waitpid(pid, 0)
+    logging_config.shutdown_logging("test_async_fork")
+
+    # Assert
+    parent_log = (tmp_path / "run.log").read_text()
+    child_log = logging_config.process_log_file(pid).read_text()
+    assert "parent record" in parent_log and "child record" not in parent_log
+    assert "child record" in child_log and "parent record" not in child_log
+
+
+def test_run_identity_is_exported_only_while_workers_are_launched():
+    """
+    Test that the run's main pid and timestamp are not left in the environment of
+    unrelated subprocesses, and that workers launched under worker_log_environment share them.
+    """
+    # Arrange
+    command = [sys.executable, "-c", "from src.config import logging_config as c; print(c.MAIN_PID, c.timestamp)"]
+    run = lambda: subprocess.run(command, capture_output=True, text=True, check=True).stdout.split()
+
+    # Act
+    with logging_config.worker_log_environment():
+        worker = run()
+    unrelated = run()
+
+    # Assert
+    assert worker == [str(logging_config.MAIN_PID), logging_config.timestamp]
+    assert unrelated[0] != str(logging_config.MAIN_PID)
+    assert not any(key in os.environ for key in ("LOG_MAIN_PID", "LOG_TIMESTAMP"))
@@ -188,4 +188,35 @@ def test_save_load_encoder(tmp_path):
 
     # Assert
     assert loaded_vectorizer.vocabulary_ == vectorizer.vocabulary_
-    assert_array_almost_equal(loaded_vectorizer.idf_, vectorizer.idf_)
\ No newline at end of file
+    assert_array_almost_equal(loaded_vectorizer.idf_, vectorizer.idf_)
+
+def test_save_encoded_dataset_compact_precision(tmp_path):
+    """
+    Test that saving with dtype=float32 stores float32 values with int32 indices
+    and that the loaded matrices equal the original float64 ones up to float32 precision.
+    """
+    # Arrange
+    X_train = csr_matrix(np.array([[0.5, 0.0], [0.0, 0.25]]))
+    X_train.indices = X_train.indices.astype(np.int64)
+    X_train.indptr = X_train.indptr.astype(np.int64)
+    dataset = TfidfDataset(
+        name="compact_dataset",
+        X_train=X_train,
+        y_train=np.array([0, 1]),
+        X_test=csr_matrix(np.array([[0.0, 1.0]])),
+        y_test=np.array([1]),
+        vectorizer=TfidfVectorizer()
+    )
+
+    # Act
+    path = tmp_path / "compact_dataset.joblib"
+    data_loader.save_encoded_dataset_as_sparse_matrix(dataset, path, dtype=np.float32)
+    loaded_data = data_loader.load_encoded_dataset_joblib(path)
+
+    # Assert
+    for X in (loaded_data.X_train, loaded_data.X_test):
+        assert X.dtype == np.float32
+        assert X.indices.dtype == np.int32
+        assert X.indptr.dtype == np.int32
+    assert_array_almost_equal(loaded_data.X_train.toarray(), X_train.toarray())
+    assert dataset.X_train.dtype == np.float64
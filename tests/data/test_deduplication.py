@@ -0,0 +1,84 @@
+"""Tests for the review deduplication stage."""
+
+# ─── Third-Party Imports ─────────────────────────────────────────────────────────
+import numpy as np
+from sklearn.utils import Bunch
+
+# ─── Project Imports ─────────────────────────────────────────────────────────────
+from src.data import deduplication
+
+
+def _make_bunch(texts, labels):
+    return Bunch(
+        data=list(texts),
+        target=np.array(labels),
+        filenames=np.array([f"{i}.txt" for i in range(len(texts))]),
+        target_names=["neg", "pos"],
+    )
+
+
+def test_normalize_review_collapses_variants():
+    """ Check if whitespace, casing and markup variants normalize to the same string. """
+    variants = [
+        "Great movie!  Loved it.",
+        "great movie loved it",
+        "<b>Great</b> movie!<br /><br />Loved it.",
+    ]
+    normalized = {deduplication.normalize_review(v) for v in variants}
+    assert normalized == {"great movie loved it"}
+
+
+def test_deduplicate_splits_drops_duplicates_and_overlap(tmp_path):
+    """
+    Test that exact duplicates within a split and test reviews also present in train
+    are removed, and that every removal is written to the report.
+    """
+    # Arrange
+    train_set = _make_bunch(
+        ["A fine film.", "a   FINE film", "Terrible acting.", "Shared review text"],
+        [1, 1, 0, 1],
+    )
+    test_set = _make_bunch(
+        ["shared <i>review</i> text!", "Unique test review", "unique test review"],
+        [1, 0, 0],
+    )
+    report_path = tmp_path / "dedup_report.csv"
+
+    # Act
+    train_out, test_out, report = deduplication.deduplicate_splits(train_set, test_set, report_path=report_path)
+
+    # Assert
+    assert train_out.data == ["A fine film.", "Terrible acting.", "Shared review text"]
+    assert list(train_out.target) == [1, 0, 1]
+    assert test_out.data == ["Unique test review"]
+    assert list(test_out.filenames) == ["1.txt"]
+    reasons = sorted(row["reason"] for row in report)
+    assert reasons == ["exact_duplicate", "exact_duplicate", "train_test_overlap"]
+    assert report_path.exists()
+    assert len(report_path.read_text(encoding="utf-8").splitlines()) == len(report) + 1
+
+
+def test_deduplicate_splits_report_mode_keeps_rows():
+    """ Check if report mode reports duplicates without removing them. """
+    train_set = _make_bunch(["Same text", "same text"], [0, 0])
+    test_set = _make_bunch(["Other text"], [1])
+
+    train_out, test_out, report = deduplication.deduplicate_splits(train_set, test_set, mode="report")
+
+    assert len(train_out.data) == 2
+    assert len(test_out.data) == 1
+    assert len(report) == 1
+
+
+def test_near_duplicates_are_detected():
+    """ Check if MinHash/LSH flags reviews that differ by a single word. """
+    base = " ".join(f"word{i}" for i in range(200))
+    near = base.replace("word100", "changed")
+    train_set = _make_bunch([base, "completely different review about another movie"], [1, 0])
+    test_set = _make_bunch([near], [1])
+
+    _, test_out, report = deduplication.deduplicate_splits(train_set, test_set, near_duplicates=True)
+
+    assert test_out.data == []
+    assert [row["reason"] for row in report] == ["near_duplicate"]
+    assert report[0]["duplicate_of"] == "train:0"
@@ -0,0 +1,59 @@
+"""Tests for the memoized lemmatizer."""
+
+# ─── Third-Party Imports ─────────────────────────────────────────────────────────
+import spacy
+from spacy.language import Language
+
+# ─── Project Imports ─────────────────────────────────────────────────────────────
+from src.preprocessing import memo_lemmatizer
+
+
+@Language.component("context_lemmatizer")
+def context_lemmatizer(doc):
+    """ Lemmatize 'saw' depending on the previous token, everything else to lowercase. """
+    for i, token in enumerate(doc):
+        if token.text == "saw":
+            token.lemma_ = "see" if i > 0 and doc[i - 1].text == "I" else "saw"
+        else:
+            token.lemma_ = token.text.lower()
+    return doc
+
+
+def _nlp():
+    nlp = spacy.blank("en")
+    nlp.add_pipe("context_lemmatizer", name="lemmatizer")
+    return nlp
+
+
+def test_memo_matches_full_pass_and_detects_ambiguity():
+    """
+    Test that the memo returns the same lemmas as a full pipeline pass, serves repeated
+    tokens from the cache and keeps context-dependent tokens out of it.
+    """
+    # Arrange
+    nlp = _nlp()
+    lemmatizer = memo_lemmatizer.MemoLemmatizer(nlp=nlp, window=1)
+    texts = ["I saw the Movie", "the saw was loud", "I saw the saw", "the Movie was loud", "the Movie was loud"]
+
+    # Act
+    results = [lemmatizer.lemmatize_text(t) for t in texts]
+
+    # Assert
+    assert results == [" ".join(t.lemma_ for t in nlp(text)) for text in texts]
+    assert "saw" in lemmatizer.ambiguous
+    assert lemmatizer.reviews_from_memo == 1
+    assert lemmatizer.stats()["token_hits"] > 0
+
+
+def test_memo_is_bounded_and_reports_divergence():
+    """ Check if the memo evicts old entries and the divergence report counts seeded mistakes. """
+    # Arrange
+    lemmatizer = memo_lemmatizer.MemoLemmatizer(nlp=_nlp(), max_size=3, confirm=1, seed={"Movie": "film"})
+
+    # Act
+    report = memo_lemmatizer.divergence_report(["a Movie", "one two three four"], lemmatizer)
+
+    # Assert
+    assert lemmatizer.stats()["memo_size"] == 3
+    assert report["diverging_review_rate"] == 0.5
+    assert report["top_divergences"][0]["memo"] == "film"
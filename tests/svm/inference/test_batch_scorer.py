@@ -0,0 +1,87 @@
+"""Tests for the streaming JSONL batch scorer."""
+
+# ─── Standard Library Imports ────────────────────────────────────────────────────
+import json
+
+# ─── Third-Party Imports ─────────────────────────────────────────────────────────
+import numpy as np
+from sklearn.svm import LinearSVC
+from sklearn.feature_extraction.text import TfidfVectorizer
+
+# ─── Project Imports ─────────────────────────────────────────────────────────────
+from src.svm.inference import batch_scorer
+
+
+def _fitted_model():
+    texts = ["good great movie", "bad awful movie", "great fun film", "awful boring film"]
+    y = np.array([1, 0, 1, 0])
+    vectorizer = TfidfVectorizer()
+    model = LinearSVC().fit(vectorizer.fit_transform(texts), y)
+    return vectorizer, model
+
+
+def _write_feed(path, n):
+    with open(path, "w", encoding="utf-8") as f:
+        for i in range(n):
+            f.write(json.dumps({"id": f"r{i}", "text": "great fun" if i % 2 else "awful boring"}) + "\n")
+
+
+def test_score_stream_writes_predictions(tmp_path):
+    """
+    Test that every record is scored in order, malformed lines are reported
+    instead of aborting the run, and the checkpoint covers all records.
+    """
+    # Arrange
+    vectorizer, model = _fitted_model()
+    feed = tmp_path / "feed.jsonl"
+    _write_feed(feed, 7)
+    with open(feed, "a", encoding="utf-8") as f:
+        f.write("{not json}\n")
+    output = tmp_path / "predictions.jsonl"
+    checkpoint = tmp_path / "predictions.ckpt"
+
+    # Act
+    done = batch_scorer.score_stream([feed], vectorizer, model, output=output, checkpoint=checkpoint,
+                                     batch_size=3, preprocess=False)
+
+    # Assert
+    rows = [json.loads(line) for line in output.read_text(encoding="utf-8").splitlines()]
+    assert done == 8
+    assert [row["id"] for row in rows[:7]] == [f"r{i}" for i in range(7)]
+    assert [row["label"] for row in rows[:2]] == ["neg", "pos"]
+    assert rows[1]["score"] > 0 > rows[0]["score"]
+    assert rows[7] == {"id": 8, "error": "malformed record"}
+    assert batch_scorer.read_checkpoint(checkpoint) == {"records_done": 8, "output_bytes": output.stat().st_size}
+
+
+def test_score_stream_resumes_from_checkpoint(tmp_path):
+    """ Check if a resumed run discards output past the checkpoint and skips scored records. """
+    # Arrange: a run that crashed after checkpointing 4 records and half-writing more
+    vectorizer, model = _fitted_model()
+    feed = tmp_path / "feed.jsonl"
+    _write_feed(feed, 10)
+    output = tmp_path / "predictions.jsonl"
+    checkpoint = tmp_path / "predictions.ckpt"
+    batch_scorer.score_stream([feed], vectorizer, model, output=output, batch_size=4, preprocess=False)
+    lines = output.read_text(encoding="utf-8").splitlines(keepends=True)
+    committed = "".join(lines[:4])
+    output.write_text(committed + '{"id": "r4", "predic', encoding="utf-8")
+    batch_scorer.write_checkpoint(checkpoint, 4, len(committed.encode("utf-8")))
+
+    # Act
+    batch_scorer.score_stream([feed], vectorizer, model, output=output, checkpoint=checkpoint,
+                              batch_size=4, preprocess=False)
+
+    # Assert
+    assert output.read_text(encoding="utf-8").splitlines(keepends=True) == lines
+
+
+def test_non_string_text_is_reported_as_malformed(tmp_path):
+    """ Check if records whose text is not a string are yielded as malformed instead of reaching preprocessing. """
+    feed = tmp_path / "feed.jsonl"
+    feed.write_text("\n".join(json.dumps(record) for record in
+                              [{"id": "a", "text": 123}, {"id": "b", "text": None}, {"id": "c", "text": "fine"}]))
+
+    records = list(batch_scorer.iter_jsonl_records([feed]))
+
+    assert records == [(1, 1, None), (2, 2, None), (3, "c", "fine")]
@@ -0,0 +1,80 @@
+"""Tests for the fused raw-text predictor."""
+
+# ─── Third-Party Imports ─────────────────────────────────────────────────────────
+import numpy as np
+import pytest
+from sklearn.svm import LinearSVC
+from sklearn.feature_extraction.text import TfidfVectorizer
+from numpy.testing import assert_array_almost_equal, assert_array_equal
+
+# ─── Project Imports ─────────────────────────────────────────────────────────────
+from src.preprocessing import preprocessing_pipeline
+from src.svm.inference.fused_predictor import STAGES, FusedPredictor
+
+RAW_TEXTS = [
+    "What a <b>GREAT</b> movie, I can't stop watching it!!", "Bad, awful and boring... don't watch it.",
+    "Great fun film, lol", "The plot was boring and the acting awful.",
+    "I loved every minute of this story", "Terrible. Just terrible. 1/10", "", "",
+]
+LABELS = np.array([1, 0, 1, 0, 1, 0, 1, 0])
+
+
+@pytest.fixture
+def fitted():
+    lemmas = preprocessing_pipeline.preprocessing_pipeline(RAW_TEXTS)
+    vectorizer = TfidfVectorizer(ngram_range=(1, 2), stop_words="english", sublinear_tf=True)
+    model = LinearSVC().fit(vectorizer.fit_transform(lemmas), LABELS)
+    return vectorizer, model, lemmas
+
+
+def test_fused_predictor_matches_training_chain(fitted):
+    """ Check if the default stages reproduce preprocessing, vectorizer and model of training. """
+    vectorizer, model, lemmas = fitted
+
+    fused = FusedPredictor(vectorizer, model)
+
+    assert_array_almost_equal(fused.decision_function(RAW_TEXTS), model.decision_function(vectorizer.transform(lemmas)))
+    assert_array_equal(fused.predict(RAW_TEXTS), model.predict(vectorizer.transform(lemmas)))
+
+
+def test_swapped_stages_keep_scores_and_account_latency(fitted):
+    """
+    Test that the batched lemmatizer and the NumPy vectorizer return the default scores
+    and that every stage's time is accounted.
+    """
+    # Arrange
+    vectorizer, model, _ = fitted
+    fused = FusedPredictor(vectorizer, model)
+    fast = fused.with_stages(lemmatize="spacy_batch", vectorize="predictor")
+
+    # Act
+    expected = fused.decision_function(RAW_TEXTS)
+    scores = fast.decision_function(RAW_TEXTS[:4] + RAW_TEXTS[4:])
+    fast.decision_function(RAW_TEXTS)
+    latency = fast.latency()
+
+    # Assert
+    assert_array_almost_equal(scores, expected)
+    assert latency["texts"] == 2 * len(RAW_TEXTS) and latency["batches"] == 2
+    assert all(latency[stage]["seconds"] >= 0 for stage in STAGES)
+    fast.reset_latency()
+    assert fast.latency()["texts"] == 0
+
+
+def test_saved_predictor_loads_in_one_call(fitted, tmp_path):
+    """ Test that a saved predictor loads with its stages, can swap stages on load and rejects unknown ones. """
+    # Arrange
+    vectorizer, model, _ = fitted
+    fused = FusedPredictor(vectorizer, model, stages={"vectorize": "predictor"}, version="svm__test")
+    path = fused.save(tmp_path / "predictor__test.joblib")
+
+    # Act
+    loaded = FusedPredictor.load(path)
+    swapped = FusedPredictor.load(path, vectorize="sklearn")
+
+    # Assert
+    assert loaded.stages == fused.stages and loaded.version == "svm__test"
+    assert_array_almost_equal(loaded.decision_function(RAW_TEXTS), fused.decision_function(RAW_TEXTS))
+    assert_array_almost_equal(swapped.decision_function(RAW_TEXTS), fused.decision_function(RAW_TEXTS))
+    with pytest.raises(ValueError, match="lemmatize"):
+        fused.with_stages(lemmatize="fastest")
@@ -0,0 +1,118 @@
+"""Tests for the model hot-reloader."""
+
+# ─── Third-Party Imports ─────────────────────────────────────────────────────────
+import json
+import numpy as np
+from sklearn.svm import LinearSVC
+from sklearn.feature_extraction.text import TfidfVectorizer
+from numpy.testing import assert_array_almost_equal
+
+# ─── Project Imports ─────────────────────────────────────────────────────────────
+from src.data import data_loader
+from src.svm.inference import batch_scorer
+from src.svm.inference.hot_reload import HotReloader, load_artifacts
+
+TEXTS = ["great movie", "awful movie", "great acting", "awful plot", "great fun", "boring plot"]
+LABELS = np.array([1, 0, 1, 0, 1, 0])
+
+
+def _save_pair(directory, name: str, labels: np.ndarray):
+    vectorizer = TfidfVectorizer()
+    model = LinearSVC().fit(vectorizer.fit_transform(TEXTS), labels)
+    vectorizer_path, model_path = directory / f"vectorizer__{name}.joblib", directory / f"svm__{name}.joblib"
+    data_loader.save_encoder(vectorizer_path, vectorizer)
+    data_loader.save_svm_model(model, model_path)
+    return vectorizer_path, model_path, model.decision_function(vectorizer.transform(TEXTS))
+
+
+def test_reloader_swaps_to_new_manifest_and_keeps_old_on_failure(tmp_path):
+    """
+    Test that a new manifest swaps the active model once it is loaded, that the version
+    and timing are exposed, and that a broken artifact leaves the old model serving.
+    """
+    # Arrange
+    data_loader.write_model_manifest(tmp_path, *_save_pair(tmp_path, "a", LABELS)[:2])
+    vectorizer_path, model_path, expected = _save_pair(tmp_path, "b", 1 - LABELS)
+    reloader = HotReloader(tmp_path, loader=load_artifacts)
+
+    # Act
+    unchanged = reloader.check()
+    data_loader.write_model_manifest(tmp_path, vectorizer_path, model_path)
+    swapped = reloader.check()
+    (tmp_path / "svm__broken.joblib").write_bytes(b"not a model")
+    data_loader.write_model_manifest(tmp_path, vectorizer_path, tmp_path / "svm__broken.joblib")
+    failed = reloader.check()
+
+    # Assert
+    vectorizer, model = reloader.current()
+    assert (unchanged, swapped, failed) == (False, True, False)
+    assert reloader.version.startswith("svm__b@")
+    assert_array_almost_equal(model.decision_function(vectorizer.transform(TEXTS)), expected)
+    stats = reloader.stats()
+    assert stats["reloads"] == 1 and stats["failures"] == 1 and stats["load_seconds"] > 0
+
+
+def test_loose_files_are_loaded_once_they_stop_changing(tmp_path):
+    """ Check if new artifacts without a manifest are picked up only on the second poll that sees them. """
+    _save_pair(tmp_path, "a", LABELS)
+    reloader = HotReloader(tmp_path, loader=load_artifacts)
+    _save_pair(tmp_path, "b", 1 - LABELS)
+
+    polls = [reloader.check(), reloader.check()]
+
+    assert polls == [False, True]
+    assert reloader.version.startswith("svm__b@")
+
+
+def test_retrain_under_the_same_name_is_a_new_version(tmp_path):
+    """
+    Test that artifacts rewritten under the same file names get a new manifest version,
+    are swapped in and report that version.
+    """
+    # Arrange
+    data_loader.write_model_manifest(tmp_path, *_save_pair(tmp_path, "a", LABELS)[:2])
+    reloader = HotReloader(tmp_path, loader=load_artifacts)
+    first = reloader.version
+
+    # Act
+    vectorizer_path, model_path, expected = _save_pair(tmp_path, "a", 1 - LABELS)
+    data_loader.write_model_manifest(tmp_path, vectorizer_path, model_path)
+    swapped = reloader.check()
+
+    # Assert
+    vectorizer, model = reloader.current()
+    assert swapped and reloader.version != first
+    assert reloader.stats()["version"] == data_loader.read_model_manifest(tmp_path)["version"]
+    assert_array_almost_equal(model.decision_function(vectorizer.transform(TEXTS)), expected)
+    assert not list(tmp_path.glob(".*.tmp"))
+
+
+def test_score_stream_switches_model_between_batches(tmp_path):
+    """ Check if a stream scores each batch with the model active when the batch starts. """
+    # Arrange
+    data_loader.write_model_manifest(tmp_path, *_save_pair(tmp_path, "a", LABELS)[:2])
+    vectorizer_path, model_path, _ = _save_pair(tmp_path, "b", 1 - LABELS)
+    reloader = HotReloader(tmp_path, loader=load_artifacts)
+    source = tmp_path / "reviews.jsonl"
+    source.write_text("\n".join(json.dumps({"id": i, "text": TEXTS[0]}) for i in range(4)))
+    output = tmp_path / "predictions.jsonl"
+
+    class SwapAfterFirstBatch:
+        """Model wrapper that publishes the new manifest while the first batch is scored."""
+        def __init__(self, model):
+            self.model = model
+
+        def decision_function(self, X):
+            data_loader.write_model_manifest(tmp_path, vectorizer_path, model_path)
+            reloader.check()
+            return self.model.decision_function(X)
+
+    vectorizer, model = reloader.current()
+
+    # Act
+    batch_scorer.score_stream([source], vectorizer, SwapAfterFirstBatch(model), output=output,
+                              batch_size=2, preprocess=False, reloader=reloader)
+
+    # Assert
+    predictions = [json.loads(line)["prediction"] for line in output.read_text().splitlines()]
+    assert predictions == [1, 1, 0, 0]
@@ -0,0 +1,101 @@
+"""Tests for the prediction cache and its use in the fused predictor."""
+
+# ─── Third-Party Imports ─────────────────────────────────────────────────────────
+import numpy as np
+from sklearn.svm import LinearSVC
+from sklearn.feature_extraction.text import TfidfVectorizer
+from numpy.testing import assert_array_almost_equal
+
+# ─── Project Imports ─────────────────────────────────────────────────────────────
+from src.svm.inference.fused_predictor import FusedPredictor
+from src.svm.inference.prediction_cache import PredictionCache, text_key
+
+TEXTS = ["What a <b>GREAT</b> movie!", "Bad, awful and boring.", "Great fun film", "The plot was awful."]
+LABELS = np.array([1, 0, 1, 0])
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _fused(cache, version="svm__a", labels=LABELS):
+    vectorizer = TfidfVectorizer()
+    model = LinearSVC(random_state=0).fit(vectorizer.fit_transform([text.lower() for text in TEXTS]), labels)
+    return FusedPredictor(vectorizer, model, stages={"lemmatize": "none"}, version=version, cache=cache)
+
+
+def test_cache_evicts_least_recently_used_and_expired_entries():
+    """
+    Test that entries beyond max_size are evicted least recently used first, that entries
+    older than the ttl are not served, and that the counters record it.
+    """
+    # Arrange
+    clock = FakeClock()
+    cache = PredictionCache(max_size=2, ttl=10, clock=clock)
+    a, b, c = (text_key(text) for text in "abc")
+
+    # Act
+    cache.put_many([a, b], [1.0, 2.0], "v1")
+    cache.get_many([a], "v1")
+    cache.put_many([c], [3.0], "v1")
+    fresh = cache.get_many([a, b, c], "v1")
+    clock.now = 11
+    expired = cache.get_many([a], "v1")
+
+    # Assert
+    assert fresh == [1.0, None, 3.0]
+    assert expired == [None]
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["evictions"], stats["expirations"]) == (3, 2, 1, 1)
+    assert stats["size"] == 1
+
+
+def test_new_model_version_invalidates_cached_scores():
+    """ Check if a lookup with another version drops the entries of the previous one. """
+    cache = PredictionCache()
+    key = text_key("great movie")
+    cache.put_many([key], [1.5], "v1")
+
+    assert cache.get_many([key], "v2") == [None]
+    assert cache.stats()["invalidations"] == 1 and cache.version == "v2" and len(cache) == 0
+
+
+def test_fused_predictor_serves_repeated_cleaned_texts_from_cache():
+    """
+    Test that repeated reviews, also ones differing only in what the cleaning stage removes,
+    are scored from the cache with the uncached scores, and that a reloaded model version
+    does not reuse them.
+    """
+    # Arrange
+    cache = PredictionCache()
+    fused = _fused(cache)
+    expected = _fused(None).decision_function(TEXTS)
+
+    # Act
+    first = fused.decision_function(TEXTS)
+    repeated = fused.decision_function([TEXTS[1], TEXTS[0].replace("<b>", "").replace("</b>", ""), TEXTS[0]])
+    after_first = cache.stats()
+    reloaded = _fused(cache, version="svm__b", labels=1 - LABELS).decision_function(TEXTS[:1])
+
+    # Assert
+    assert_array_almost_equal(first, expected)
+    assert_array_almost_equal(repeated, expected[[1, 0, 0]])
+    assert (after_first["hits"], after_first["misses"]) == (3, 4)
+    assert reloaded[0] < 0 < expected[0]
+    assert cache.stats()["invalidations"] == 1
+    assert fused.latency()["texts"] == 7
+
+
+def test_retrained_model_under_the_same_version_invalidates_cached_scores():
+    """ Check if a model retrained under the same version name does not serve its predecessor's scores. """
+    cache = PredictionCache()
+    before = _fused(cache).decision_function(TEXTS[:1])
+
+    after = _fused(cache, labels=1 - LABELS).decision_function(TEXTS[:1])
+
+    assert after[0] < 0 < before[0]
+    assert cache.stats()["invalidations"] == 1 and cache.hits == 0
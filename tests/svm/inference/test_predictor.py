@@ -0,0 +1,58 @@
+"""Tests for the thread-safe shared Predictor."""
+
+# ─── Standard Library Imports ────────────────────────────────────────────────────
+from concurrent.futures import ThreadPoolExecutor
+
+# ─── Third-Party Imports ─────────────────────────────────────────────────────────
+import numpy as np
+from sklearn.svm import LinearSVC
+from sklearn.model_selection import GridSearchCV
+from sklearn.feature_extraction.text import TfidfVectorizer
+from numpy.testing import assert_array_almost_equal, assert_array_equal
+
+# ─── Project Imports ─────────────────────────────────────────────────────────────
+from src.data import data_loader
+from src.svm.inference.predictor import Predictor
+
+TEXTS = [
+    "good great movie", "bad awful movie", "great fun film", "awful boring film",
+    "good fun story", "bad boring plot", "great great great", "",
+]
+LABELS = np.array([1, 0, 1, 0, 1, 0, 1, 0])
+
+
+def test_predictor_matches_vectorizer_and_model():
+    """ Check if the predictor reproduces transform, decision_function and predict of the sklearn objects. """
+    vectorizer = TfidfVectorizer(ngram_range=(1, 2), sublinear_tf=True)
+    X = vectorizer.fit_transform(TEXTS)
+    model = GridSearchCV(LinearSVC(), {"C": [0.5, 1]}, cv=2).fit(X, LABELS)
+
+    predictor = Predictor(vectorizer, model)
+
+    assert_array_almost_equal(predictor.transform(TEXTS).toarray(), X.toarray())
+    assert_array_almost_equal(predictor.decision_function(TEXTS), model.decision_function(X))
+    assert_array_equal(predictor.predict(TEXTS), model.predict(X))
+
+
+def test_predictor_is_consistent_across_threads(tmp_path):
+    """
+    Test that one predictor loaded from files returns the single-threaded results
+    when it is called concurrently from many threads.
+    """
+    # Arrange
+    vectorizer = TfidfVectorizer()
+    model = LinearSVC().fit(vectorizer.fit_transform(TEXTS), LABELS)
+    data_loader.save_encoder(tmp_path / "vectorizer__test.joblib", vectorizer)
+    data_loader.save_svm_model(model, tmp_path / "svm__test.joblib")
+    predictor = Predictor.from_model_dir(tmp_path)
+    batches = [TEXTS[i:] + TEXTS[:i] for i in range(len(TEXTS))] * 8
+    expected = [predictor.decision_function(batch) for batch in batches]
+
+    # Act
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(predictor.decision_function, batches))
+
+    # Assert
+    assert predictor.version == "svm__test"
+    for result, reference in zip(results, expected):
+        assert_array_equal(result, reference)
@@ -0,0 +1,63 @@
+"""Tests for the integer-quantized predictor."""
+
+# ─── Third-Party Imports ─────────────────────────────────────────────────────────
+import numpy as np
+import pytest
+from sklearn.svm import LinearSVC
+from sklearn.feature_extraction.text import TfidfVectorizer
+from numpy.testing import assert_array_almost_equal, assert_array_equal
+
+# ─── Project Imports ─────────────────────────────────────────────────────────────
+from src.svm.inference.quantized import QuantizedPredictor, quantization_report
+
+TEXTS = [
+    "great movie, great acting and a great story", "awful plot and terrible acting",
+    "boring boring boring, I fell asleep", "a wonderful film with a touching story",
+    "terrible film, awful script", "I loved it, great fun", "not great, not terrible", "",
+]
+LABELS = np.array([1, 0, 0, 1, 0, 1, 1, 0])
+
+
+@pytest.mark.parametrize("params", [{}, {"sublinear_tf": True}, {"binary": True, "norm": "l1"}, {"use_idf": False}])
+def test_quantized_scores_track_float_model(params):
+    """
+    Test that int16 weights reproduce the float decision values closely for every
+    TF-IDF variant, and that int8 stays within its coarser error without flips.
+    """
+    # Arrange
+    vectorizer = TfidfVectorizer(ngram_range=(1, 2), **params)
+    model = LinearSVC().fit(vectorizer.fit_transform(TEXTS), LABELS)
+
+    # Act
+    reports = {bits: quantization_report(QuantizedPredictor(vectorizer, model, bits=bits), vectorizer, model, TEXTS)
+               for bits in (8, 16)}
+
+    # Assert
+    assert reports[16]["max_abs_error"] < 1e-3
+    assert reports[8]["max_abs_error"] < 5e-2
+    assert reports[8]["flips"] == reports[16]["flips"] == 0
+    assert reports[8]["quantized_weight_bytes"] * 8 == reports[8]["float_weight_bytes"]
+
+
+def test_saved_quantized_predictor_round_trips(tmp_path):
+    """ Check if a saved quantized predictor loads with the same scores and without float weights. """
+    vectorizer = TfidfVectorizer(sublinear_tf=True)
+    model = LinearSVC().fit(vectorizer.fit_transform(TEXTS), LABELS)
+    predictor = QuantizedPredictor(vectorizer, model, bits=8, version="v1")
+
+    loaded = QuantizedPredictor.load(predictor.save(tmp_path / "quantized.joblib"))
+
+    assert_array_equal(loaded.decision_function(TEXTS), predictor.decision_function(TEXTS))
+    assert_array_equal(loaded.predict(TEXTS), model.predict(vectorizer.transform(TEXTS)))
+    assert loaded.version == "v1" and loaded._weights.dtype == np.int8 and loaded._idf.dtype == np.uint8
+
+
+def test_quantized_transform_matches_vectorizer():
+    """ Check if transform encodes like the vectorizer up to the idf quantization error. """
+    vectorizer = TfidfVectorizer(ngram_range=(1, 2), sublinear_tf=True)
+    model = LinearSVC().fit(vectorizer.fit_transform(TEXTS), LABELS)
+
+    X = QuantizedPredictor(vectorizer, model, bits=16).transform(TEXTS)
+
+    assert X.shape == (len(TEXTS), len(vectorizer.vocabulary_))
+    assert_array_almost_equal(X.toarray(), vectorizer.transform(TEXTS).toarray(), decimal=4)
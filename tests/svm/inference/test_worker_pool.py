@@ -0,0 +1,95 @@
+"""Tests for the pre-fork scoring worker pool and its memory-mapped predictor."""
+
+# ─── Standard Library Imports ────────────────────────────────────────────────────
+import os
+import signal
+
+# ─── Third-Party Imports ─────────────────────────────────────────────────────────
+import joblib
+import numpy as np
+import pytest
+from sklearn.svm import LinearSVC
+from sklearn.feature_extraction.text import TfidfVectorizer
+from numpy.testing import assert_array_almost_equal, assert_array_equal
+
+# ─── Project Imports ─────────────────────────────────────────────────────────────
+from src.data import data_loader
+from src.svm.inference.predictor import Predictor
+from src.svm.inference.worker_pool import ScoringPool, SharedPredictor, export_shared_model
+
+TEXTS = [
+    "good great movie", "bad awful movie", "great fun film", "awful boring film",
+    "good fun story", "bad boring plot", "great great great", "", "unseen words only",
+]
+LABELS = np.array([1, 0, 1, 0, 1, 0, 1, 0, 0])
+
+
+@pytest.fixture
+def model_dir(tmp_path):
+    vectorizer = TfidfVectorizer(ngram_range=(1, 2), sublinear_tf=True)
+    model = LinearSVC().fit(vectorizer.fit_transform(TEXTS), LABELS)
+    data_loader.save_encoder(tmp_path / "vectorizer__test.joblib", vectorizer)
+    data_loader.save_svm_model(model, tmp_path / "svm__test.joblib")
+    return tmp_path
+
+
+def test_shared_predictor_matches_predictor(model_dir, tmp_path):
+    """ Check if the memory-mapped predictor reproduces the dict-based predictor exactly. """
+    predictor = Predictor.from_model_dir(model_dir)
+    shared = SharedPredictor.from_model_dir(model_dir, directory=tmp_path)
+
+    assert shared.version == "svm__test"
+    assert_array_almost_equal(shared.transform(TEXTS).toarray(), predictor.transform(TEXTS).toarray())
+    assert_array_equal(shared.decision_function(TEXTS), predictor.decision_function(TEXTS))
+    assert_array_equal(shared.predict(TEXTS), predictor.predict(TEXTS))
+    shared.release()
+    assert not shared.directory.exists()
+
+
+def test_scoring_pool_returns_batches_in_order(model_dir, tmp_path):
+    """
+    Test that forked workers score batches from the shared queue and the pool
+    yields each batch's scores in input order.
+    """
+    # Arrange
+    shared = SharedPredictor.from_model_dir(model_dir, directory=tmp_path)
+    batches = [TEXTS[i:] + TEXTS[:i] for i in range(len(TEXTS))] * 4
+    expected = [shared.decision_function(batch) for batch in batches]
+
+    # Act
+    with ScoringPool(shared, n_workers=3, max_pending=4) as pool:
+        results = list(pool.map(batches))
+        labels = pool.predict(TEXTS)
+        memory = pool.memory()
+
+    # Assert
+    for result, reference in zip(results, expected):
+        assert_array_equal(result, reference)
+    assert_array_equal(labels, shared.predict(TEXTS))
+    assert sum(pool.served.values()) == len(batches) + 1
+    assert set(memory) == set(pool.pids)
+
+
+def test_shared_predictor_rejects_index_from_another_hash_salt(model_dir, tmp_path):
+    """ Test that an index built under a different string hash salt is refused on attach. """
+    # Arrange
+    directory = export_shared_model(data_loader.load_encoder(model_dir / "vectorizer__test.joblib"),
+                                    data_loader.load_svm_model(model_dir / "svm__test.joblib"), tmp_path / "shared")
+    meta = joblib.load(directory / "meta.joblib")
+    meta["hash_check"] += 1
+    joblib.dump(meta, directory / "meta.joblib")
+
+    # Act / Assert
+    with pytest.raises(ValueError, match="hash"):
+        SharedPredictor(directory)
+
+
+def test_scoring_pool_raises_when_a_worker_dies(model_dir, tmp_path):
+    """ Check if map raises instead of blocking when a worker is killed. """
+    shared = SharedPredictor.from_model_dir(model_dir, directory=tmp_path)
+
+    with ScoringPool(shared, n_workers=1) as pool:
+        os.kill(pool.pids[0], signal.SIGKILL)
+        pool._workers[0].join()
+        with pytest.raises(RuntimeError, match="exit code -9"):
+            pool.decision_function(TEXTS)
@@ -0,0 +1,52 @@
+"""Tests for the batched multi-model evaluation."""
+
+# ─── Third-Party Imports ─────────────────────────────────────────────────────────
+import numpy as np
+import pytest
+from scipy.sparse import csr_matrix
+from sklearn.svm import LinearSVC
+from sklearn.datasets import make_classification
+from sklearn.metrics import accuracy_score, f1_score, precision_score, recall_score
+
+# ─── Project Imports ─────────────────────────────────────────────────────────────
+from src.svm.training import evaluation, solvers
+
+
+def test_evaluate_models_matches_sklearn_metrics():
+    """
+    Test that one batched pass gives every model the decision values and the precision,
+    recall, F1 and accuracy of scoring it on its own, including a model without positives.
+    """
+    # Arrange
+    X, y = make_classification(n_samples=200, n_features=20, random_state=0)
+    X = csr_matrix(np.abs(X))
+    models = [LinearSVC(C=C).fit(X, y) for C in (0.01, 1.0)]
+    models.append(solvers.make_estimator("sgd", C=1.0).fit(X, y))
+    silent = LinearSVC().fit(X, y)
+    silent.coef_, silent.intercept_ = np.zeros_like(silent.coef_), np.array([-1.0])
+    models.append(silent)
+
+    # Act
+    W, b, _ = evaluation.stack_linear_models(models)
+    scores = evaluation.decision_scores(X, W, b)
+    metrics = evaluation.evaluate_models(X, y, models)
+
+    # Assert
+    for i, model in enumerate(models):
+        y_pred = model.predict(X)
+        assert np.array_equal(scores[:, i], model.decision_function(X))
+        assert metrics["precision"][i] == precision_score(y, y_pred, zero_division=0)
+        assert metrics["recall"][i] == recall_score(y, y_pred)
+        assert metrics["f1"][i] == f1_score(y, y_pred)
+        assert metrics["accuracy"][i] == accuracy_score(y, y_pred)
+
+
+def test_stacking_rejects_models_with_different_classes():
+    """ Check if models trained on different label sets cannot be stacked. """
+    # Arrange
+    X = csr_matrix(np.eye(4))
+    models = [LinearSVC().fit(X, [0, 1, 0, 1]), LinearSVC().fit(X, [1, 2, 1, 2])]
+
+    # Act / Assert
+    with pytest.raises(ValueError, match="same classes"):
+        evaluation.stack_linear_models(models)
@@ -0,0 +1,59 @@
+"""Tests for the supervised feature-selection stage."""
+
+# ─── Third-Party Imports ─────────────────────────────────────────────────────────
+import numpy as np
+from sklearn.utils import Bunch
+from sklearn.preprocessing import normalize
+from sklearn.feature_selection import chi2
+from sklearn.feature_extraction.text import TfidfVectorizer
+from numpy.testing import assert_array_almost_equal
+
+# ─── Project Imports ─────────────────────────────────────────────────────────────
+from src.svm.training import vectorizer, feature_selection
+
+TRAIN_TEXTS = [
+    "good great movie", "bad awful movie", "great fun film",
+    "awful boring film", "good fun story", "bad boring plot",
+]
+TRAIN_LABELS = np.array([1, 0, 1, 0, 1, 0])
+
+
+def _encoded_dataset():
+    train_set = Bunch(data=TRAIN_TEXTS, target=TRAIN_LABELS)
+    test_set = Bunch(data=["good movie plot", "awful fun"], target=np.array([1, 0]))
+    return vectorizer.tfidf_vectorizer(train_set, test_set, ngram_range=(1, 2), stop_words=None, sublinear_tf=True)
+
+
+def test_chi2_scores_match_sklearn():
+    """ Check if the vectorized chi² scores equal sklearn's implementation. """
+    data = _encoded_dataset()
+    assert_array_almost_equal(feature_selection.chi2_scores(data.X_train, data.y_train), chi2(data.X_train, data.y_train)[0])
+
+
+def test_select_features_remaps_vectorizer():
+    """
+    Test that the reduced vectorizer reproduces the selected training and test matrices,
+    so a model trained on the reduced features can score raw text directly.
+    """
+    # Arrange
+    data = _encoded_dataset()
+
+    # Act
+    reduced = feature_selection.select_features(data, k=4, score_func="mutual_info")
+
+    # Assert
+    assert reduced.X_train.shape == (6, 4)
+    assert len(reduced.vectorizer.vocabulary_) == 4
+    assert_array_almost_equal(reduced.vectorizer.transform(TRAIN_TEXTS).toarray(), reduced.X_train.toarray())
+    assert_array_almost_equal(reduced.vectorizer.transform(["good movie plot", "awful fun"]).toarray(), reduced.X_test.toarray())
+
+
+def test_reduce_vectorizer_without_idf():
+    """ Check if a vectorizer without idf is reduced to the kept columns as well. """
+    tf = TfidfVectorizer(use_idf=False).fit(TRAIN_TEXTS)
+    keep = np.array([0, 2, 5])
+
+    reduced = feature_selection.reduce_vectorizer(tf, keep)
+
+    expected = normalize(tf.transform(TRAIN_TEXTS)[:, keep])
+    assert_array_almost_equal(reduced.transform(TRAIN_TEXTS).toarray(), expected.toarray())
@@ -0,0 +1,73 @@
+"""Tests for the bounded-memory heavy-hitter vocabulary builder."""
+
+# ─── Third-Party Imports ─────────────────────────────────────────────────────────
+import numpy as np
+import pytest
+from sklearn.utils import Bunch
+from sklearn.feature_extraction.text import CountVectorizer, TfidfVectorizer
+from numpy.testing import assert_array_almost_equal
+
+# ─── Project Imports ─────────────────────────────────────────────────────────────
+from src.svm.training import vectorizer
+from src.svm.training.heavy_hitters import CountMinSketch, build_vocabulary
+
+
+def _corpus(n_docs: int, seed: int) -> list[str]:
+    # Zipf-like word frequencies, so the top n-grams stand out from a long tail
+    rng = np.random.default_rng(seed)
+    words = np.array([f"w{i}" for i in range(2000)])
+    weights = 1.0 / np.arange(1, len(words) + 1)
+    return [" ".join(rng.choice(words, size=30, p=weights / weights.sum())) for _ in range(n_docs)]
+
+
+def _untied_cutoff(docs: list[str], at_least: int) -> int:
+    # A max_features whose last kept n-gram is strictly more frequent than the next one
+    counts = np.sort(np.asarray(CountVectorizer(ngram_range=(1, 2)).fit_transform(docs).sum(axis=0)).ravel())[::-1]
+    return next(k for k in range(at_least, len(counts)) if counts[k - 1] > counts[k])
+
+
+def test_sketch_never_undercounts():
+    """ Check if every estimate of a small, colliding sketch is at least the true count. """
+    rng = np.random.default_rng(0)
+    hashes = rng.integers(-2**63, 2**63 - 1, size=500, dtype=np.int64)
+    counts = rng.integers(1, 50, size=500)
+    sketch = CountMinSketch(width=64, depth=4)
+
+    sketch.add(hashes, counts)
+
+    assert np.all(sketch.estimate(hashes) >= counts)
+    assert sketch.nbytes == 64 * 4 * 4
+
+
+def test_heavy_hitter_vocabulary_matches_max_features():
+    """
+    Test that a sketch far smaller than the n-gram vocabulary still selects sklearn's
+    max_features columns, and that the 'sketch' engine then encodes like sklearn.
+    """
+    # Arrange
+    train = Bunch(data=_corpus(300, seed=1), target=np.zeros(300))
+    test = Bunch(data=_corpus(50, seed=2), target=np.zeros(50))
+    max_features = _untied_cutoff(train.data, at_least=150)
+    params = dict(max_features=max_features, ngram_range=(1, 2), stop_words=None, sublinear_tf=True)
+    reference = vectorizer.tfidf_vectorizer(train, test, engine="sklearn", **params)
+    n_ngrams = len(TfidfVectorizer(ngram_range=(1, 2)).fit(train.data).vocabulary_)
+
+    # Act
+    vocabulary = build_vocabulary(train.data, TfidfVectorizer(ngram_range=(1, 2)), max_features=max_features,
+                                  width=1024, chunk_size=64)
+    encoded = vectorizer.tfidf_vectorizer(train, test, engine="sketch", **params)
+
+    # Assert
+    assert 1024 * 4 < n_ngrams
+    assert vocabulary == reference.vectorizer.vocabulary_
+    assert encoded.vectorizer.vocabulary_ == reference.vectorizer.vocabulary_
+    assert encoded.vectorizer.get_params()["vocabulary"] is None
+    assert_array_almost_equal(encoded.X_train.toarray(), reference.X_train.toarray())
+    assert_array_almost_equal(encoded.X_test.toarray(), reference.X_test.toarray())
+
+
+@pytest.mark.parametrize("params", [{"min_df": 2}, {"max_df": 0.5}, {"binary": True}])
+def test_sketch_rejects_settings_it_cannot_reproduce(params):
+    """ Check if document-frequency limits and binary counts are rejected instead of silently ignored. """
+    with pytest.raises(ValueError, match="does not support"):
+        build_vocabulary(["a b c", "a b"], TfidfVectorizer(**params), max_features=2)
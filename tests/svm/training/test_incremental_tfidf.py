@@ -0,0 +1,54 @@
+"""Tests for the incrementally updatable TF-IDF encoder."""
+
+# ─── Third-Party Imports ─────────────────────────────────────────────────────────
+import numpy as np
+import pytest
+from sklearn.feature_extraction.text import TfidfVectorizer
+from numpy.testing import assert_array_almost_equal, assert_array_equal
+
+# ─── Project Imports ─────────────────────────────────────────────────────────────
+from src.data.data_classes import TfidfDataset
+from src.svm.training.incremental_tfidf import IncrementalTfidf
+
+FIRST = ["good movie", "bad movie", "good acting and a good plot", "bad plot", "great movie"]
+SECOND = ["good plot twist", "twist ending was bad", "plot twist in a great movie", "movie night"]
+
+
+@pytest.mark.parametrize("smooth_idf", [True, False])
+def test_partial_fit_matches_refit_with_fixed_vocabulary(smooth_idf):
+    """
+    Test that absorbing a second batch gives the idf and matrices of fitting on both
+    batches with the same vocabulary, when the encoder starts from an encoded dataset.
+    """
+    # Arrange
+    vectorizer = TfidfVectorizer(ngram_range=(1, 2), smooth_idf=smooth_idf, sublinear_tf=True)
+    X_train = vectorizer.fit_transform(FIRST)
+    data = TfidfDataset(name="test", X_train=X_train, y_train=np.zeros(len(FIRST)),
+                        X_test=X_train, y_test=np.zeros(len(FIRST)), vectorizer=vectorizer)
+    encoder = IncrementalTfidf.from_dataset(data)
+
+    # Act
+    encoder.partial_fit(SECOND)
+
+    # Assert
+    refit = TfidfVectorizer(ngram_range=(1, 2), smooth_idf=smooth_idf, sublinear_tf=True,
+                            vocabulary=vectorizer.vocabulary_).fit(FIRST + SECOND)
+    assert encoder.n_documents_ == len(FIRST) + len(SECOND)
+    assert_array_almost_equal(encoder.idf_, refit.idf_)
+    assert_array_almost_equal(encoder.transform(SECOND).toarray(), refit.transform(SECOND).toarray())
+    assert_array_equal(vectorizer.idf_, data.vectorizer.idf_)
+
+
+def test_capacity_admits_new_terms_and_evicts_low_frequency_ones():
+    """ Check if frequent new terms are admitted and the rarest terms are evicted down to the capacity. """
+    encoder = IncrementalTfidf.from_documents(TfidfVectorizer(), FIRST, capacity=7, min_df=2)
+
+    encoder.partial_fit(SECOND)
+
+    # 'twist' (3 documents) joins; the capacity drops the single-document terms that sort last
+    assert sorted(encoder.vocabulary_) == ["acting", "bad", "good", "great", "movie", "plot", "twist"]
+    assert list(encoder.vocabulary_.values()) == list(range(7))
+    refit = TfidfVectorizer(vocabulary=sorted(encoder.vocabulary_)).fit(FIRST + SECOND)
+    assert encoder.document_counts_[encoder.vocabulary_["twist"]] == 3
+    assert_array_almost_equal(encoder.idf_[encoder.vocabulary_["movie"]], refit.idf_[refit.vocabulary_["movie"]])
+    assert encoder.transform(SECOND).shape == (len(SECOND), 7)
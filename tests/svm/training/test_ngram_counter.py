@@ -0,0 +1,75 @@
+"""Tests for the vectorized n-gram counting engine."""
+
+# ─── Third-Party Imports ─────────────────────────────────────────────────────────
+import numpy as np
+import pytest
+from sklearn.utils import Bunch
+from sklearn.feature_extraction.text import TfidfVectorizer
+
+# ─── Project Imports ─────────────────────────────────────────────────────────────
+from src.svm.training import ngram_counter, vectorizer
+
+TRAIN = [
+    "A great movie, a great cast and a great story.",
+    "Awful film. The story was awful and the cast was bored.",
+    "Great fun; not awful at all, the cast shines",
+    "bored bored bored",
+    "",
+    "The the the",
+]
+TEST = ["an unseen great movie with a story", "zzz qqq", "cast awful cast"]
+
+
+def _assert_identical(X, Y):
+    """Same values, indices and stored entry order."""
+    assert X.dtype == Y.dtype
+    assert np.array_equal(X.indptr, Y.indptr)
+    assert np.array_equal(X.indices, Y.indices)
+    assert np.array_equal(X.data, Y.data)
+
+
+@pytest.mark.parametrize("ngram_range", [(1, 1), (1, 2), (1, 3), (2, 3), (3, 3)])
+@pytest.mark.parametrize("max_features", [None, 7])
+@pytest.mark.parametrize("dtype", [np.float64, np.float32])
+def test_matches_tfidf_vectorizer(ngram_range, max_features, dtype):
+    """
+    Test that fit_transform and transform give TfidfVectorizer's vocabulary, idf and
+    matrices, including max_features ties and n-grams around unseen tokens.
+    """
+    # Arrange
+    params = dict(ngram_range=ngram_range, max_features=max_features, stop_words="english", sublinear_tf=True, dtype=dtype)
+    reference = TfidfVectorizer(**params)
+    counter = ngram_counter.NgramCounter(TfidfVectorizer(**params))
+
+    # Act
+    X_reference, X_test_reference = reference.fit_transform(TRAIN), reference.transform(TEST)
+    X, X_test = counter.fit_transform(TRAIN), counter.transform(TEST)
+
+    # Assert
+    assert counter.vectorizer.vocabulary_ == reference.vocabulary_
+    assert np.array_equal(counter.vectorizer.idf_, reference.idf_)
+    _assert_identical(X, X_reference)
+    _assert_identical(X_test, X_test_reference)
+    _assert_identical(counter.vectorizer.transform(TEST), X_test_reference)
+
+
+def test_unsupported_settings_raise():
+    """ Check if settings the engine does not reproduce are rejected. """
+    with pytest.raises(ValueError, match="min_df"):
+        ngram_counter.NgramCounter(TfidfVectorizer(min_df=2))
+
+
+def test_tfidf_vectorizer_engines_agree_on_token_lists():
+    """ Check if both encoder engines encode the token handoff identically. """
+    # Arrange
+    tokens = [text.lower().split() for text in TRAIN]
+    data = Bunch(data=tokens, target=np.arange(len(tokens)) % 2)
+
+    # Act
+    with_sklearn = vectorizer.tfidf_vectorizer(data, data, ngram_range=(1, 3), engine="sklearn")
+    with_numpy = vectorizer.tfidf_vectorizer(data, data, ngram_range=(1, 3), engine="numpy")
+
+    # Assert
+    assert with_numpy.vectorizer.vocabulary_ == with_sklearn.vectorizer.vocabulary_
+    _assert_identical(with_numpy.X_train, with_sklearn.X_train)
+    _assert_identical(with_numpy.X_test, with_sklearn.X_test)
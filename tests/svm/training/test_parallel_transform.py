@@ -0,0 +1,54 @@
+"""Tests for the chunked parallel transform."""
+
+# ─── Third-Party Imports ─────────────────────────────────────────────────────────
+import numpy as np
+import scipy.sparse as sp
+from sklearn.feature_extraction.text import TfidfVectorizer
+from numpy.testing import assert_array_equal
+
+# ─── Project Imports ─────────────────────────────────────────────────────────────
+from src.svm.training import ngram_counter
+from src.svm.training.parallel_transform import ParallelTransformer, parallel_transform, stack_csr
+
+
+def _corpus(n_docs: int) -> list[str]:
+    rng = np.random.default_rng(0)
+    words = [f"word{i}" for i in range(300)]
+    return [" ".join(rng.choice(words, size=rng.integers(1, 40))) for _ in range(n_docs)]
+
+
+def test_stack_csr_matches_vstack():
+    """ Check if stacking CSR pieces gives the same matrix as scipy's vstack, including empty pieces. """
+    # Arrange
+    pieces = [sp.random(n, 50, density=0.1, format="csr", random_state=n) for n in (7, 0, 13, 1)]
+
+    # Act
+    stacked = stack_csr(pieces)
+
+    # Assert
+    expected = sp.vstack(pieces, format="csr")
+    assert stacked.shape == expected.shape
+    assert stacked.indices.dtype == np.int32
+    assert_array_equal(stacked.toarray(), expected.toarray())
+
+
+def test_parallel_transform_matches_transform_in_order():
+    """
+    Test that the chunked transform on two workers returns exactly the matrix of
+    transform, for both encoder engines, and that the pool serves repeated calls.
+    """
+    # Arrange
+    train, docs = _corpus(400), _corpus(1000)[::-1]
+    vectorizer = TfidfVectorizer(ngram_range=(1, 2), sublinear_tf=True).fit(train)
+    counter = ngram_counter.NgramCounter(TfidfVectorizer(ngram_range=(1, 2)))
+    counter.fit_transform(train)
+
+    # Act
+    with ParallelTransformer(vectorizer, n_jobs=2, chunk_size=96) as pool:
+        first, second = pool.transform(docs), pool.transform(docs[:500])
+    counted = parallel_transform(counter, docs, n_jobs=2, chunk_size=96)
+
+    # Assert
+    assert_array_equal(first.toarray(), vectorizer.transform(docs).toarray())
+    assert_array_equal(second.toarray(), vectorizer.transform(docs[:500]).toarray())
+    assert_array_equal(counted.toarray(), counter.transform(docs).toarray())
@@ -0,0 +1,81 @@
+"""Tests for the persistent grid-search result store."""
+
+# ─── Third-Party Imports ─────────────────────────────────────────────────────────
+import numpy as np
+from scipy.sparse import csr_matrix
+from sklearn.datasets import make_classification
+from sklearn.feature_extraction.text import TfidfVectorizer
+from numpy.testing import assert_array_almost_equal
+
+# ─── Project Imports ─────────────────────────────────────────────────────────────
+from src.data.data_classes import TfidfDataset
+from src.svm.training import shared_memory
+from src.svm.training.result_store import ResultStore, encoding_fingerprint
+
+
+def _dataset():
+    X, y = make_classification(n_samples=120, n_features=15, random_state=0)
+    X = csr_matrix(np.abs(X))
+    return TfidfDataset(name="test", X_train=X, y_train=y, X_test=X, y_test=y, vectorizer=TfidfVectorizer())
+
+
+def test_extended_grid_fits_only_missing_cells(tmp_path, monkeypatch):
+    """
+    Test that extending the grid fits only the new (candidate, fold) cells and that the
+    merged search equals a search over the full grid from scratch.
+    """
+    # Arrange
+    data = _dataset()
+    fits = []
+    original = shared_memory.fit_fold
+    monkeypatch.setattr(shared_memory, "fit_fold", lambda *args: fits.append(args[2]) or original(*args))
+    store = ResultStore(tmp_path / "results.sqlite")
+    small = {"C": [0.1, 1.0], "class_weight": [None, "balanced"]}
+    extended = {"C": [0.1, 1.0, 4.0], "class_weight": [None, "balanced"]}
+
+    # Act
+    shared_memory.shared_grid_search(data, small, cv=3, n_jobs=1, directory=tmp_path, store=store)
+    fits.clear()
+    merged = shared_memory.shared_grid_search(data, extended, cv=3, n_jobs=1, directory=tmp_path, store=store)
+    new_fits = list(fits)
+    scratch = shared_memory.shared_grid_search(data, extended, cv=3, n_jobs=1, directory=tmp_path)
+
+    # Assert
+    assert len(new_fits) == 2 * 3 and all(params["C"] == 4.0 for params in new_fits)
+    assert merged.best_params_ == scratch.best_params_
+    assert_array_almost_equal(merged.cv_results_["mean_test_score"], scratch.cv_results_["mean_test_score"])
+    store.close()
+
+
+def test_store_summary_and_pareto_front(tmp_path):
+    """ Check if the store reports every complete candidate and a front that no candidate dominates. """
+    # Arrange
+    data = _dataset()
+    fingerprint = encoding_fingerprint(data.X_train, data.y_train, cv=3)
+    with ResultStore(tmp_path / "results.sqlite") as store:
+        shared_memory.shared_grid_search(data, {"C": [0.01, 0.1, 1.0, 10.0]}, cv=3, n_jobs=1,
+                                         directory=tmp_path, store=store)
+
+        # Act
+        summary = store.summary(fingerprint)
+        front = store.pareto_front(fingerprint)
+
+    # Assert
+    assert len(summary) == 4 and summary[0]["encoding"] == "test"
+    assert [row["mean_score"] for row in summary] == sorted((row["mean_score"] for row in summary), reverse=True)
+    for row in front:
+        assert not any(other["mean_score"] > row["mean_score"] and other["total_fit_time"] < row["total_fit_time"]
+                       for other in summary)
+
+
+def test_fingerprint_changes_with_data_and_folds():
+    """ Test that the fingerprint changes when the matrix or the CV splitter changes. """
+    data = _dataset()
+    base = encoding_fingerprint(data.X_train, data.y_train, cv=3)
+
+    changed = data.X_train.copy()
+    changed.data[0] += 1.0
+
+    assert encoding_fingerprint(data.X_train, data.y_train, cv=3) == base
+    assert encoding_fingerprint(changed, data.y_train, cv=3) != base
+    assert encoding_fingerprint(data.X_train, data.y_train, cv=5) != base
@@ -0,0 +1,60 @@
+"""Tests for the CPU and memory scheduler."""
+
+# ─── Standard Library Imports ────────────────────────────────────────────────────
+import time
+
+# ─── Third-Party Imports ─────────────────────────────────────────────────────────
+from sklearn.utils import Bunch
+from threadpoolctl import threadpool_info
+
+# ─── Project Imports ─────────────────────────────────────────────────────────────
+from src.svm.training import scheduler
+
+
+def _sleep_and_report(seconds):
+    """Sleep and report the time window and the thread limit seen by the worker."""
+    start = time.monotonic()
+    time.sleep(seconds)
+    threads = [pool["num_threads"] for pool in threadpool_info()]
+    return start, time.monotonic(), threads
+
+
+def test_memory_limit_serializes_tasks_and_runs_follow_ups():
+    """
+    Test that tasks whose summed memory estimate exceeds the ceiling never overlap, that
+    native thread pools are pinned to the allocated cores and that follow-ups are run.
+    """
+    # Arrange
+    runner = scheduler.ResourceScheduler(max_cpus=2, memory_limit_bytes=100)
+    follow_up = scheduler.Task(name="follow-up", fn=_sleep_and_report, args=(0.0,))
+    for name in ("a", "b"):
+        runner.submit(scheduler.Task(name=name, fn=_sleep_and_report, args=(0.2,), memory_bytes=60,
+                                     on_done=lambda result, name=name: [follow_up] if name == "a" else []))
+
+    # Act
+    results = runner.run()
+
+    # Assert
+    (start_a, end_a, threads), (start_b, end_b, _) = results["a"], results["b"]
+    assert end_a <= start_b or end_b <= start_a
+    assert all(n == 1 for n in threads)
+    assert "follow-up" in results
+    assert runner.peak_memory_bytes == 60
+
+
+def test_run_encoder_grid_trains_every_encoding(tmp_path):
+    """ Check if every combination is encoded, saved and trained under the scheduler. """
+    # Arrange
+    texts = ["good great movie", "bad awful film", "great fun", "awful boring"] * 10
+    labels = [1, 0, 1, 0] * 10
+    train_set, test_set = Bunch(data=texts, target=labels), Bunch(data=texts, target=labels)
+    combinations = [{"ngram_range": (1, 1)}, {"ngram_range": (1, 2)}]
+
+    # Act
+    results = scheduler.run_encoder_grid(train_set, test_set, combinations, max_cpus=2, directory=tmp_path)
+
+    # Assert
+    assert len(results) == 2
+    for grid, param_dict, path in results.values():
+        assert path.exists()
+        assert grid.best_score_ == 1.0
@@ -0,0 +1,24 @@
+"""Tests for the encoder screening pass."""
+
+# ─── Third-Party Imports ─────────────────────────────────────────────────────────
+from sklearn.utils import Bunch
+
+# ─── Project Imports ─────────────────────────────────────────────────────────────
+from src.svm.training import screening
+
+
+def test_screening_keeps_the_best_combinations_in_grid_order():
+    """ Check if the proxy prunes an encoding without useful features and keeps grid order. """
+    # Arrange
+    texts = ["good great movie plot", "bad awful film plot", "great fun movie plot", "awful boring film plot"] * 20
+    train_set = Bunch(data=texts, target=[1, 0, 1, 0] * 20)
+    combinations = [{"ngram_range": (1, 1)}, {"ngram_range": (1, 1), "max_features": 1}, {"ngram_range": (1, 2)}]
+
+    # Act
+    kept, scores, seconds = screening.screen_encodings(train_set, combinations, top_k=2, subsample=60)
+
+    # Assert
+    assert kept == [combinations[0], combinations[2]]
+    assert [params for params, _ in scores] == combinations
+    assert scores[0][1] == 1.0 and scores[1][1] < 1.0
+    assert seconds > 0
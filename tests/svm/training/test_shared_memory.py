@@ -0,0 +1,72 @@
+"""Tests for the shared-memory grid search."""
+
+# ─── Standard Library Imports ────────────────────────────────────────────────────
+import mmap
+
+# ─── Third-Party Imports ─────────────────────────────────────────────────────────
+import numpy as np
+from scipy.sparse import csr_matrix
+from sklearn.svm import LinearSVC
+from sklearn.datasets import make_classification
+from sklearn.model_selection import GridSearchCV
+from sklearn.feature_extraction.text import TfidfVectorizer
+from numpy.testing import assert_array_almost_equal
+
+# ─── Project Imports ─────────────────────────────────────────────────────────────
+from src.data.data_classes import TfidfDataset
+from src.svm.training import shared_memory
+
+
+def test_shared_csr_round_trip_is_memory_mapped(tmp_path):
+    """ Check if a stored CSR matrix is reattached from memory-mapped files with equal content. """
+    X = csr_matrix(np.array([[0.0, 1.5], [2.0, 0.0], [0.0, 0.0]]))
+
+    prefix = shared_memory.save_shared_csr(X, tmp_path, "X")
+    loaded = shared_memory.load_shared_csr(prefix)
+
+    base = loaded.data
+    while getattr(base, "base", None) is not None and not isinstance(base, (np.memmap, mmap.mmap)):
+        base = base.base
+    assert isinstance(base, (np.memmap, mmap.mmap))
+    assert_array_almost_equal(loaded.toarray(), X.toarray())
+
+
+def test_shared_grid_search_matches_gridsearchcv(tmp_path):
+    """
+    Test that the search over memory-mapped folds selects the same parameters with the
+    same fold scores as GridSearchCV, and removes its files afterwards.
+    """
+    # Arrange
+    X, y = make_classification(n_samples=120, n_features=15, random_state=0)
+    X = csr_matrix(np.abs(X))
+    data = TfidfDataset(name="test", X_train=X, y_train=y, X_test=X, y_test=y, vectorizer=TfidfVectorizer())
+    param_grid = {"C": [0.1, 1.0], "class_weight": [None, "balanced"]}
+
+    # Act
+    shared = shared_memory.shared_grid_search(data, param_grid, cv=3, n_jobs=1, directory=tmp_path)
+    reference = GridSearchCV(LinearSVC(), param_grid, cv=3, scoring="f1").fit(X, y)
+
+    # Assert
+    assert shared.best_params_ == reference.best_params_
+    assert_array_almost_equal(shared.cv_results_["mean_test_score"], reference.cv_results_["mean_test_score"])
+    assert_array_almost_equal(shared.decision_function(X), reference.decision_function(X))
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_prepare_shared_folds_stores_only_x_train_and_row_indices(tmp_path):
+    """ Check if the folds are stored as row indices into one copy of X_train and sliced on load. """
+    # Arrange
+    X, y = make_classification(n_samples=60, n_features=8, random_state=0)
+    X = csr_matrix(np.abs(X))
+
+    # Act
+    shared = shared_memory.prepare_shared_folds(X, y, cv=3, directory=tmp_path)
+    X_val, y_val = shared_memory.load_shared_fold(shared, 1, "val")
+
+    # Assert
+    matrices = {p.name for p in shared.directory.iterdir() if p.name.endswith(".data.npy")}
+    assert matrices == {"X_train.data.npy"}
+    val_idx = np.load(shared.folds[1][1])
+    assert_array_almost_equal(X_val.toarray(), X[val_idx].toarray())
+    assert_array_almost_equal(y_val, y[val_idx])
+    shared_memory.release_shared_folds(shared)
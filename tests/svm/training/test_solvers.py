@@ -0,0 +1,65 @@
+"""Tests for the pluggable linear-SVM solver backends."""
+
+# ─── Third-Party Imports ─────────────────────────────────────────────────────────
+import numpy as np
+import pytest
+from scipy.sparse import csr_matrix
+from sklearn.svm import LinearSVC
+from sklearn.datasets import make_classification
+from sklearn.model_selection import GridSearchCV
+from sklearn.preprocessing import normalize
+from numpy.testing import assert_array_almost_equal
+
+# ─── Project Imports ─────────────────────────────────────────────────────────────
+from src.svm.training import solvers
+
+
+@pytest.fixture
+def dataset():
+    X, y = make_classification(n_samples=400, n_features=30, n_informative=10, class_sep=2.0, random_state=0)
+    return normalize(csr_matrix(np.abs(X))), y
+
+
+@pytest.mark.parametrize("solver", list(solvers.SOLVERS))
+def test_solver_matches_linearsvc_predictions(dataset, solver):
+    """ Check if every backend predicts (almost) like the current LinearSVC. """
+    # Arrange
+    X, y = dataset
+    reference = LinearSVC(C=1.0).fit(X, y).predict(X)
+
+    # Act
+    model = solvers.make_estimator(solver, C=1.0, class_weight="balanced").fit(X, y)
+
+    # Assert
+    assert model.coef_.shape == (1, X.shape[1])
+    assert np.mean(model.predict(X) == reference) >= 0.95
+
+
+def test_custom_solvers_work_in_grid_search_and_auto_mode(dataset):
+    """
+    Test that the NumPy backends can be cloned by GridSearchCV and that auto mode returns
+    one of the registered backends.
+    """
+    # Arrange
+    X, y = dataset
+
+    # Act
+    grid = GridSearchCV(solvers.make_estimator("averaged_sgd"), {"C": [0.5, 1.0]}, cv=3, scoring="f1").fit(X, y)
+    reference = GridSearchCV(LinearSVC(), {"C": [0.5, 1.0]}, cv=3, scoring="f1").fit(X, y)
+    selected = solvers.select_solver(X, y, params={"C": 1.0}, sample_size=200)
+
+    # Assert
+    assert abs(grid.best_score_ - reference.best_score_) < 0.02
+    assert selected in solvers.SOLVERS
+    with pytest.raises(ValueError):
+        solvers.make_estimator("unknown")
+
+
+def test_linear_classifier_scores_like_sklearn(dataset):
+    """ Check if the SGD backend's decision function and score equal those of its fitted SGDClassifier weights. """
+    X, y = dataset
+
+    model = solvers.SGDHingeSVC(C=1.0).fit(X, y)
+
+    assert_array_almost_equal(model.decision_function(X), X @ model.coef_.ravel() + model.intercept_[0])
+    assert model.score(X, y) == np.mean(model.predict(X) == y)
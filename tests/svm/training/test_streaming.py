@@ -0,0 +1,34 @@
+"""Tests for the streamed encode → train → discard grid."""
+
+# ─── Third-Party Imports ─────────────────────────────────────────────────────────
+from sklearn.utils import Bunch
+
+# ─── Project Imports ─────────────────────────────────────────────────────────────
+from src.svm.training import streaming, vectorizer, gridsearch_trainer
+
+
+def test_streamed_grid_selects_the_same_best_encoding(tmp_path):
+    """
+    Test that streaming picks the encoding the collect-all loop would pick, keeps its
+    model and vectorizer, and records a score for every combination.
+    """
+    # Arrange
+    texts = ["good great movie", "bad awful film", "great fun plot", "awful boring plot", "good film", "bad movie"] * 6
+    labels = [1, 0, 1, 0, 1, 0] * 6
+    train_set, test_set = Bunch(data=texts, target=labels), Bunch(data=texts, target=labels)
+    combinations = [{"ngram_range": (2, 2), "max_features": 3}, {"ngram_range": (1, 1)}, {"ngram_range": (1, 2)}]
+
+    # Act
+    best = streaming.stream_encoder_grid(train_set, test_set, combinations, directory=tmp_path)
+    collected = []
+    for param_dict in combinations:
+        name, data_set, _, _ = vectorizer.encode_and_save(train_set, test_set, param_dict, directory=tmp_path)
+        collected.append((gridsearch_trainer.train_svm_model(data_set).best_score_, name))
+    collected.sort(key=lambda x: x[0], reverse=True)
+
+    # Assert
+    assert best.name == collected[0][1]
+    assert best.score == collected[0][0]
+    assert len(best.scores) == 3
+    assert best.model.coef_.shape[1] == len(best.vectorizer.vocabulary_)
+    assert best.path.exists()
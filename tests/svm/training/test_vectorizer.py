@@ -0,0 +1,32 @@
+"""Tests for the TF-IDF encoder."""
+
+# ─── Third-Party Imports ─────────────────────────────────────────────────────────
+import numpy as np
+from sklearn.utils import Bunch
+
+# ─── Project Imports ─────────────────────────────────────────────────────────────
+from src.preprocessing.lemmatization import normalize_lemmas
+from src.svm.training import vectorizer
+
+
+def test_pretokenized_input_gives_identical_features():
+    """
+    Test that encoding the token handoff yields the same vocabulary and matrices as encoding
+    the space-joined lemma strings, and that the returned vectorizer still encodes texts.
+    """
+    # Arrange
+    lemma_texts = ["I be go to save the World !", "the movie be blu-ray 10 x", "a GOOD movie , not a bad_one ΟΔΟΣ"] * 2
+    token_lists = [normalize_lemmas(text.split(" ")) for text in lemma_texts]
+    labels = np.array([1, 0, 1, 0, 1, 0])
+
+    # Act
+    from_text = vectorizer.tfidf_vectorizer(Bunch(data=lemma_texts, target=labels), Bunch(data=lemma_texts, target=labels),
+                                            ngram_range=(1, 2), sublinear_tf=True)
+    from_tokens = vectorizer.tfidf_vectorizer(Bunch(data=token_lists, target=labels), Bunch(data=token_lists, target=labels),
+                                              ngram_range=(1, 2), sublinear_tf=True)
+
+    # Assert
+    assert from_tokens.vectorizer.vocabulary_ == from_text.vectorizer.vocabulary_
+    assert (from_tokens.X_train != from_text.X_train).nnz == 0
+    assert (from_tokens.vectorizer.transform(lemma_texts) != from_text.X_test).nnz == 0
+    assert from_tokens.vectorizer.stop_words == "english"
@@ -1,19 +1,25 @@
 """Main routine orchestrating the download, cleaning, preprocessing, and training for the SVM model on the IMDb dataset."""
 
 # ─── Standard Library Imports ────────────────────────────────────────────────────
+import time
 import argparse
 import yaml
 import itertools
 
+# ─── Third-Party Imports ─────────────────────────────────────────────────────────
+import numpy as np
+
 # ─── Project Imports ─────────────────────────────────────────────────────────────
 import src.data as dat
 from src.data import data_loader
 import src.preprocessing as prep
 import src.svm.training as train
+from src.svm.inference.fused_predictor import FusedPredictor
+from src.svm.inference.quantized import QuantizedPredictor, quantization_report
 from src.config import logging_config
 
 # ─── Path Imports ────────────────────────────────────────────────────────────────
-from src.config.paths import DATA_DIR, TRAIN_DATA_DIR, TEST_DATA_DIR, CLEANED_DATA_TXT_DIR ,CLEANED_TRAIN_DIR, CLEANED_TEST_DIR, ENCODED_DATA_DIR, TRAINING_PARAMS, MODEL_DIR
+from src.config.paths import DATA_DIR, TRAIN_DATA_DIR, TEST_DATA_DIR, CLEANED_DATA_TXT_DIR ,CLEANED_TRAIN_DIR, CLEANED_TEST_DIR, TRAINING_PARAMS, MODEL_DIR
 
 # ─── Argument Parsing ────────────────────────────────────────────────────────────
 parser = argparse.ArgumentParser(description="Run the main pipeline.")
@@ -32,6 +38,10 @@ else:
 
 def training():
 
+    # Load the training parameters from the YAML file
+    with open(TRAINING_PARAMS, "r") as f:
+        training_params = yaml.load(f, Loader=yaml.FullLoader)
+
     # ─── Test Mode Handling ───────────────────────────────────────────────────────
     if args.test:
         # Set test flag and sample size
@@ -69,13 +79,34 @@ def training():
         test_set = dat.data_loader.load_texts_from_folder(TEST_DATA_DIR, test_mode=test_flag, sample_count=samples)
 
 
+    # ─── Deduplicate the Datasets ────────────────────────────────────────────────────
+    """Drop duplicate reviews within each split and test reviews leaking from train before preprocessing."""
+    dedup_params = training_params.get("deduplication", {})
+    if args.skip_prep or not dedup_params.get("enabled", False):
+        logger.info("Skipping deduplication step.")
+    else:
+        report_path = logging_config.LOG_DIR / f"{logging_config.timestamp}_dedup_report.csv"
+        train_set, test_set, _ = dat.deduplication.deduplicate_splits(
+            train_set, test_set,
+            mode=dedup_params.get("mode", "drop"),
+            near_duplicates=dedup_params.get("near_duplicates", False),
+            num_perm=dedup_params.get("num_perm", 64),
+            bands=dedup_params.get("bands", 16),
+            threshold=dedup_params.get("threshold", 0.8),
+            chunk_size=dedup_params.get("chunk_size", 10000),
+            report_path=report_path,
+        )
+        logger.info("Deduplicated datasets: %d train and %d test samples remain", len(train_set.data), len(test_set.data))
+
+
     # ─── Preprocessing the Datasets ──────────────────────────────────────────────────
     if args.skip_prep:  
         logger.info("Skipping preprocessing step.")
     else:
-        # Preprocess the datasets
-        train_set.data = prep.preprocessing_pipeline.preprocessing_pipeline(train_set.data, name="train_set")
-        test_set.data = prep.preprocessing_pipeline.preprocessing_pipeline(test_set.data, name="test_set")
+        # Preprocess the datasets; with the token handoff the vectorizer receives token lists
+        token_handoff = training_params.get("preprocessing", {}).get("token_handoff", False)
+        train_set.data = prep.preprocessing_pipeline.preprocessing_pipeline(train_set.data, name="train_set", tokens=token_handoff)
+        test_set.data = prep.preprocessing_pipeline.preprocessing_pipeline(test_set.data, name="test_set", tokens=token_handoff)
 
         # Save the preprocessed datasets to the DATA_DIR
         path = CLEANED_DATA_TXT_DIR 
@@ -85,34 +116,18 @@ def training():
 
     # ─── Encode the Datasets ────────────────────────────────────────────────────────
     """If fine-tuning the encoder, encode multiple versions of the dataset with different max_features values."""
-    # Load the training parameters from the YAML file
-    with open(TRAINING_PARAMS, "r") as f:
-        training_params = yaml.load(f, Loader=yaml.FullLoader)
     vec_param_grid = training_params.get("vectorizer_param_grid", {})
     logger.info(f"Using TF-IDF parameters: %s", vec_param_grid)
+    fs_params = training_params.get("feature_selection", {})
+    dtype = np.dtype(training_params.get("precision", "float64"))
+    logger.info("Encoding with %s precision", dtype)
 
 
     if args.skip_fine_tune_encoder:
         logger.info("Skipping fine-tuning of the encoder. Using default parameters.")
 
         # Use the first parameter in the list as the default
-        param_dict = {name: value[0] for name, value in vec_param_grid.items()}
-        logger.info("Encoded dataset with parameters: %s", param_dict)
-
-        # Encode the dataset using the TF-IDF vectorizer
-        data_set = train.vectorizer.tfidf_vectorizer(train_set, test_set, **param_dict)
-
-        # Create a file path from the encoding parameters
-        name = dat.data_loader.param_dict_to_filename(param_dict)
-        path = ENCODED_DATA_DIR / f"encoded__{name}.joblib"
-
-        # Save the encoded datasets as sparse matrices
-        dat.data_loader.save_encoded_dataset_as_sparse_matrix(data_set, path=path)
-        logger.info("Encoded dataset saved to %s", path)
-
-        # Store the encoded dataset in the dictionary
-        encoded_datasets[name] = (data_set, param_dict)
-
+        combinations = [{name: value[0] for name, value in vec_param_grid.items()}]
     else:
         logger.info("Fine-tuning encoder. Generating multiple encoded datasets with different parameters.")
 
@@ -121,48 +136,57 @@ def training():
         combinations = [dict(zip(keys, combo)) for combo in itertools.product(*values)]
         logger.info("Generated %d combinations of parameters for fine-tuning.", len(combinations))
 
-        # Create a dictionary to store encoded datasets for different max_features
-        encoded_datasets = {}
+    # ─── Screen the Encodings ────────────────────────────────────────────────────
+    """Score every combination with a cheap proxy and run the full grid search only on the top-k."""
+    screening_params = training_params.get("screening", {})
+    screened = screening_params.get("enabled", False) and len(combinations) > screening_params.get("top_k", 8)
+    if screened:
+        n_total = len(combinations)
+        combinations, _, screening_seconds = train.screening.screen_encodings(
+            train_set, combinations,
+            top_k=screening_params.get("top_k", 8),
+            subsample=screening_params.get("subsample", 5000),
+            holdout=screening_params.get("holdout", 0.25),
+            C=screening_params.get("C", 1.0),
+            dtype=dtype,
+        )
+    full_start = time.perf_counter()
+
+    # Create dictionaries to store the encoded datasets and their trained SVM models
+    encoded_datasets, models, best = {}, {}, None
+
+    scheduler_params = training_params.get("scheduler", {})
+    streaming = training_params.get("trainer", {}).get("streaming", False)
+    if scheduler_params.get("enabled", False):
+        """Encode and train under one CPU and memory budget; each encoding is trained as soon as it is saved."""
+        memory_limit_gb = scheduler_params.get("memory_limit_gb")
+        results = train.scheduler.run_encoder_grid(
+            train_set, test_set, combinations, fs_params=fs_params, dtype=dtype,
+            max_cpus=scheduler_params.get("max_cpus"),
+            memory_limit_bytes=None if memory_limit_gb is None else int(memory_limit_gb * 2**30),
+            train_cpus=scheduler_params.get("train_cpus"),
+        )
+        for name, (model, param_dict, path) in results.items():
+            encoded_datasets[name] = (path, param_dict)
+            models[name] = (model, param_dict)
+    elif streaming:
+        """Train every encoding as soon as it is produced and keep only the best model and encoder in memory."""
+        best = train.streaming.stream_encoder_grid(train_set, test_set, combinations, fs_params=fs_params, dtype=dtype)
+    else:
         for param_dict in combinations:
             logger.info("Encoding dataset with parameters: %s", param_dict)
-            
-            # Encode the datasets using the TF-IDF vectorizer
-            data_set = train.vectorizer.tfidf_vectorizer(train_set, test_set, **param_dict)
-            
-            # Create a file path from the encoding parameters
-            name = dat.data_loader.param_dict_to_filename(param_dict)
-            path = ENCODED_DATA_DIR / f"encoded__{name}.joblib"
-
-            # Save the encoded datasets as sparse matrices
-            dat.data_loader.save_encoded_dataset_as_sparse_matrix(data_set, path=path)
-            logger.info("Encoded dataset saved to %s", path)
+
+            # Encode, optionally select features and save the encoded dataset
+            name, data_set, param_dict, path = train.vectorizer.encode_and_save(
+                train_set, test_set, param_dict, fs_params=fs_params, dtype=dtype
+            )
 
             # Store the encoded dataset in the dictionary
             encoded_datasets[name] = (data_set, param_dict)
 
 
-    # ─── Train the SVM Model ───────────────────────────────────────────────────────
-    """If fine-tuning the encoder, train multiple SVM models on all the differently encoded data sets."""
-
-    if args.skip_fine_tune_encoder:
-        logger.info("Skipping fine-tuning of the encoder. Training SVM model with default parameters.")
-
-        # Train the SVM model using the encoded datasets
-        model = train.gridsearch_trainer.train_svm_model(data_set)
-
-        # Create a file path from the parameters
-        name_final_model = encoded_datasets.keys()[0] 
-        path = MODEL_DIR / f"svm__{name_final_model}.joblib"
-
-        # Save the trained SVM model
-        dat.data_loader.save_svm_model(model, path=path)
-        logger.info("SVM model trained and saved to %s", path)
-        
-    else:
-        logger.info("Fine-tuning encoder. Saving only the best model.")
-
-        # Create a directory to save the SVM models
-        models = {}
+        # ─── Train the SVM Model ───────────────────────────────────────────────────────
+        """Train an SVM model on every encoded data set."""
 
         # Iterate over the encoded datasets and train SVM models
         for name, set_and_params in encoded_datasets.items():
@@ -178,32 +202,49 @@ def training():
             # Store the model in the dictionary
             models[name] = (model, param_dict)
 
-        # Store the best models based on their scores
-        best_models = []
-        for name, model_and_params in models.items():
-            # Get the model and the training parameters
-            model = model_and_params[0]
-            param_dict = model_and_params[1]
-
-            # Get the model score and the estimator itself
-            score = model.best_score_
-            model = model.best_estimator_
-
-            # Store the models with their score as key
-            best_models.append((model, param_dict, score, name))
-
-        # Get the best model based on the highest score
-        best_models.sort(key=lambda x: x[2], reverse=True)
-        best_model, best_params, best_score, best_name = best_models[0]
+    if screened:
+        train.screening.log_compute_saved(
+            n_total, len(combinations), screening_seconds, time.perf_counter() - full_start,
+            grid_params=training_params["grid_search_params"], cv=training_params.get("trainer", {}).get("cv", 3),
+        )
+
+    # ─── Select and Report the Best Model ────────────────────────────────────────────
+    """Select by cross-validated F1 and report the test-set metrics of every encoding's best model."""
+    if best is not None:
+        names = [name for name, _, _ in best.scores]
+        cv_scores = np.array([score for _, _, score in best.scores])
+        test_metrics = [best.test_metrics[name] for name in names]
+    else:
+        names = list(models)
+        cv_scores = np.array([models[name][0].best_score_ for name in names])
+        test_metrics = [models[name][0].test_metrics_ for name in names]
+    metrics = {metric: np.array([m[metric] for m in test_metrics]) for metric in train.evaluation.METRICS}
+    logger.info("Best model per encoding:\n%s",
+                train.evaluation.format_report(names, metrics, extra={"cv_f1": cv_scores}))
+
+    # Cost/accuracy trade-off over everything the result store has recorded
+    store = train.gridsearch_trainer.open_result_store()
+    if store is not None:
+        with store:
+            logger.info("Accuracy/fit-time Pareto front of the result store:\n%s",
+                        train.result_store.format_summary(store.pareto_front()))
+
+    # First highest CV score, so ties keep the earlier encoding
+    best_index = int(np.argmax(cv_scores))
+    best_name, best_score = names[best_index], float(cv_scores[best_index])
+    if best is not None:
+        best_model, best_params = best.model, best.params
+    else:
+        best_model, best_params = models[best_name][0].best_estimator_, models[best_name][1]
 
-        # Create a file path from the parameters
-        name_final_model = best_name
-        path = MODEL_DIR / f"svm__{name_final_model}.joblib"
+    # Create a file path from the parameters
+    name_final_model = best_name
+    path = MODEL_DIR / f"svm__{name_final_model}.joblib"
 
-        # Save the best SVM model
-        dat.data_loader.save_svm_model(best_model, path=path)
-        logger.info("Best SVM model saved with parameters: %s", best_params)
-        logger.info("Best SVM model saved with score: %f", best_score)
+    # Save the best SVM model
+    dat.data_loader.save_svm_model(best_model, path=path)
+    logger.info("Best SVM model saved with parameters: %s", best_params)
+    logger.info("Best SVM model saved with score: %f", best_score)
 
 
     # ─── Select the best encoder based on the evaluation ───────────────────────────────────────────────────────
@@ -211,11 +252,17 @@ def training():
     name_final_encoder = name_final_model 
     logger.info("Selected encoder: %s", name_final_encoder)
 
-    # Get the dataset
-    best_dataset = encoded_datasets[name_final_encoder][0]
-    
-    # Get the best encoder from the encoded datasets
-    best_encoder = best_dataset.vectorizer
+    if best is not None:
+        # The streamed grid already kept the best encoder
+        best_encoder = best.vectorizer
+    else:
+        # Get the dataset; the scheduler only keeps the path of the saved encoding
+        best_dataset = encoded_datasets[name_final_encoder][0]
+        if not isinstance(best_dataset, dat.data_classes.TfidfDataset):
+            best_dataset = data_loader.load_encoded_dataset_joblib(best_dataset)
+
+        # Get the best encoder from the encoded datasets
+        best_encoder = best_dataset.vectorizer
 
 
     # Save the best encoder
@@ -223,6 +270,31 @@ def training():
     data_loader.save_encoder(path_encoder, best_encoder)
     logger.info("Best encoder saved to %s", path_encoder)
 
+    # Retrains under the same name get a new version, so scorers can tell the artifacts apart
+    version = data_loader.model_version(path)
+
+    # Save the whole raw-text → decision chain as one predictor for online scoring
+    path_predictor = MODEL_DIR / f"predictor__{name_final_encoder}.joblib"
+    fused = FusedPredictor(best_encoder, best_model, version=version)
+    fused.save(path_predictor)
+
+    # Optionally export the integer-quantized predictor for memory-constrained scoring
+    quantization_params = training_params.get("quantization", {})
+    if quantization_params.get("enabled", False):
+        bits = quantization_params.get("bits", 8)
+        quantized = QuantizedPredictor(best_encoder, best_model, bits=bits, version=version)
+        path_quantized = quantized.save(MODEL_DIR / f"quantized__{name_final_encoder}.joblib")
+
+        # The saved encoder reads texts; lemma token lists re-join to the same tokens
+        test_texts = [doc if isinstance(doc, str) else " ".join(doc) for doc in test_set.data]
+        report = quantization_report(quantized, best_encoder, best_model, test_texts, test_set.target)
+        report["artifact_bytes"] = path_quantized.stat().st_size
+        report["float_artifact_bytes"] = path.stat().st_size + path_encoder.stat().st_size
+        logger.info("int%d quantization on the test split: %s", bits, report)
+
+    # Point the manifest at the new pair last, so hot-reloading scorers only see complete artifacts
+    data_loader.write_model_manifest(MODEL_DIR, path_encoder, path, version=version)
+
 
 if __name__ == "__main__":
     training()
\ No newline at end of file